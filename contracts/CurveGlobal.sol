@@ -1,6 +1,8 @@
 // SPDX-License-Identifier: AGPL-3.0
 pragma solidity 0.8.19;
 
+import {ClonesWithImmutableArgs} from "./libraries/ClonesWithImmutableArgs.sol";
+
 enum VaultType {
     LEGACY,
     DEFAULT,
@@ -90,7 +92,8 @@ interface ICurveGauge {
 }
 
 interface IStrategy {
-    function cloneStrategyConvex(
+    // convex
+    function initialize(
         address _vault,
         address _strategist,
         address _rewards,
@@ -101,9 +104,10 @@ interface IStrategy {
         uint256 _harvestProfitMaxInUsdc,
         address _booster,
         address _convexToken
-    ) external returns (address newStrategy);
+    ) external;
 
-    function cloneStrategyCurveBoosted(
+    // curve
+    function initialize(
         address _vault,
         address _strategist,
         address _rewards,
@@ -111,9 +115,10 @@ interface IStrategy {
         address _tradeFactory,
         address _proxy,
         address _gauge
-    ) external returns (address newStrategy);
+    ) external;
 
-    function cloneStrategyConvexFrax(
+    // convex frax
+    function initialize(
         address _vault,
         address _strategist,
         address _rewards,
@@ -124,7 +129,7 @@ interface IStrategy {
         uint256 _harvestProfitMinInUsdc,
         uint256 _harvestProfitMaxInUsdc,
         address _booster
-    ) external returns (address newStrategy);
+    ) external;
 
     function setVoter(address _curveVoter) external;
 
@@ -201,11 +206,46 @@ contract CurveGlobal {
         address convexFraxStrategy
     );
 
+    /// @notice Emitted when a call in applyToStrategies fails.
+    event StrategyCallFailed(address indexed strategy, bytes reason);
+
+    struct BatchResult {
+        /// @notice Curve gauge we attempted to deploy a vault for.
+        address gauge;
+        /// @notice Address of the new vault, zero if deployment failed.
+        address vault;
+        /// @notice Address of the vault's Convex strategy, if created.
+        address convexStrategy;
+        /// @notice Address of the vault's Curve boosted strategy, if created.
+        address curveStrategy;
+        /// @notice Address of the vault's Convex Frax strategy, if created.
+        address convexFraxStrategy;
+        /// @notice Whether or not deployment for this gauge succeeded.
+        bool success;
+        /// @notice Revert data from a failed deployment, empty on success.
+        bytes reason;
+    }
+
+    struct StrategyCallResult {
+        /// @notice Strategy we called.
+        address strategy;
+        /// @notice Whether or not our call succeeded.
+        bool success;
+        /// @notice Revert data from a failed call, empty on success.
+        bytes reason;
+    }
+
     /* ========== STATE VARIABLES ========== */
 
     /// @notice This is a list of all vaults deployed by this factory.
     address[] public deployedVaults;
 
+    /// @notice Latest vault deployed by this factory for a given Curve gauge.
+    mapping(address => address) public gaugeToVault;
+
+    /// @notice Curve gauge for a given vault deployed by this factory.
+    mapping(address => address) public vaultToGauge;
+
     /// @notice This is specific to the protocol we are deploying automated vaults for.
     /// @dev 0 for curve, 1 for balancer. This is a subcategory within our vault type AUTOMATED on the registry.
     uint256 public constant CATEGORY = 0;
@@ -277,6 +317,11 @@ contract CurveGlobal {
     /// @dev If zero address, then factory will produce vaults without Convex Frax strategies.
     address public convexFraxStratImplementation;
 
+    /// @notice Whether we deploy strategies as clones that keep their pool addresses and pid in their code.
+    /// @dev Cheaper to deploy, and each pool address or pid costs about 200 gas to read per call instead of a cold
+    ///  SLOAD. Our strategy implementations must support reading immutable args.
+    bool public useImmutableArgsClones;
+
     /// @notice The percentage of CRV we re-lock for boost (in basis points). Default is 0%.
     uint256 public keepCRV;
 
@@ -310,6 +355,19 @@ contract CurveGlobal {
     /// @notice Default deposit limit on our factory vaults. Set to a large number.
     uint256 public depositLimit = 10_000_000_000_000 * 1e18;
 
+    /// @notice Indexed Convex pid (plus one) for a given booster and Curve gauge. Zero if not yet indexed.
+    /// @dev Filled by syncPids and whenever this factory adds a pool to Convex. Keyed by booster so that
+    ///  updating our booster never returns stale pids. Use getPid to read.
+    mapping(address => mapping(address => uint256)) internal pidIndex;
+
+    /// @notice Indexed Convex Frax pids for a given Convex Frax pool registry and Convex pid, oldest first.
+    /// @dev Filled by syncFraxPools. Inactive pools are indexed too, since they may be reactivated. Keyed
+    ///  by registry so that updating our registry never returns stale pools. Use getFraxInfo to read.
+    mapping(address => mapping(uint256 => uint256[])) internal fraxPoolIndex;
+
+    /// @notice Number of pools from a given Convex Frax pool registry that have been added to our index.
+    mapping(address => uint256) public fraxPoolsSynced;
+
     /* ========== CONSTRUCTOR ========== */
 
     constructor(
@@ -529,6 +587,16 @@ contract CurveGlobal {
         convexFraxStratImplementation = _convexFraxStratImplementation;
     }
 
+    /// @notice Set whether we deploy strategies as clones with immutable args.
+    /// @dev Must be called by owner. Only turn this on once all of our strategy implementations support it.
+    /// @param _useImmutableArgsClones Whether to use immutable-args clones for new strategies.
+    function setUseImmutableArgsClones(bool _useImmutableArgsClones) external {
+        if (msg.sender != owner) {
+            revert();
+        }
+        useImmutableArgsClones = _useImmutableArgsClones;
+    }
+
     /// @notice Direct a specified percentage of CRV from every harvest to Yearn's CRV voter.
     /// @dev Must be called by owner.
     /// @param _keepCRV The percentage of CRV from each harvest that we send to our voter (out of 10,000).
@@ -654,6 +722,30 @@ contract CurveGlobal {
         return deployedVaults;
     }
 
+    /// @notice View a page of vault addresses deployed by this factory.
+    /// @dev Pages that run past the end of our deployed vaults are trimmed, so this may return fewer
+    ///  than _count vaults.
+    /// @param _start Index in deployedVaults of the first vault to return.
+    /// @param _count Max number of vaults to return.
+    /// @return vaults Array of deployed factory vault addresses in our page.
+    function deployedVaultsPage(
+        uint256 _start,
+        uint256 _count
+    ) external view returns (address[] memory vaults) {
+        uint256 length = deployedVaults.length;
+        if (_start >= length) {
+            return vaults;
+        }
+        if (_count > length - _start) {
+            _count = length - _start;
+        }
+
+        vaults = new address[](_count);
+        for (uint256 i; i < _count; ++i) {
+            vaults[i] = deployedVaults[_start + i];
+        }
+    }
+
     /// @notice Number of vaults deployed by this factory.
     /// @return Number of vaults deployed by this factory.
     function numVaults() external view returns (uint256) {
@@ -667,6 +759,10 @@ contract CurveGlobal {
     function canCreateVaultPermissionlessly(
         address _gauge
     ) public view returns (bool) {
+        // skip the registry if we've already deployed a vault for this gauge ourselves
+        if (gaugeToVault[_gauge] != address(0)) {
+            return false;
+        }
         return latestStandardVaultFromGauge(_gauge) == address(0);
     }
 
@@ -703,7 +799,8 @@ contract CurveGlobal {
     }
 
     /// @notice Find the Convex pool id (pid) for a given Curve gauge.
-    /// @dev Will return max uint if no pid exists for a gauge.
+    /// @dev Will return max uint if no pid exists for a gauge. Indexed gauges (see syncPids) are looked up
+    ///  directly, otherwise we fall back to searching the booster from the most recent pool.
     /// @param _gauge The gauge address to check.
     /// @return pid The Convex pool id for the specified Curve gauge.
     function getPid(address _gauge) public view returns (uint256 pid) {
@@ -712,6 +809,15 @@ contract CurveGlobal {
             return type(uint256).max;
         }
 
+        // use our index if we have it, as long as the indexed pool hasn't since been shut down
+        uint256 indexed = pidIndex[address(_booster)][_gauge];
+        if (indexed > 0) {
+            (, , , , , bool shutdown) = _booster.poolInfo(indexed - 1);
+            if (!shutdown) {
+                return indexed - 1;
+            }
+        }
+
         for (uint256 i = _booster.poolLength(); i > 0; --i) {
             //we start at the end and work back for most recent
             (, , address gauge, , , ) = _booster.poolInfo(i - 1);
@@ -722,8 +828,39 @@ contract CurveGlobal {
         }
     }
 
+    /// @notice Index the gauges for a range of Convex pids so getPid can look them up directly.
+    /// @dev May be called by anyone. Large ranges can be split over several calls to stay under the
+    ///  block gas limit. If a gauge has more than one pid, the most recent is kept.
+    /// @param _start The first Convex pid to index.
+    /// @param _end The Convex pid to stop at (exclusive). Capped at the booster's pool length.
+    function syncPids(uint256 _start, uint256 _end) external {
+        IBooster _booster = booster;
+        uint256 poolLength = _booster.poolLength();
+        if (_end > poolLength) {
+            _end = poolLength;
+        }
+
+        for (uint256 i = _start; i < _end; ++i) {
+            (, , address gauge, , , ) = _booster.poolInfo(i);
+            _indexPid(address(_booster), gauge, i);
+        }
+    }
+
+    // store a gauge's pid in our index, only ever replacing an older pid with a newer one
+    function _indexPid(
+        address _booster,
+        address _gauge,
+        uint256 _pid
+    ) internal {
+        if (_pid + 1 > pidIndex[_booster][_gauge]) {
+            pidIndex[_booster][_gauge] = _pid + 1;
+        }
+    }
+
     /// @notice Check if a Convex pid is also available on Convex Frax.
-    /// @dev Try-catch may appear as reverts in some dev envs.
+    /// @dev Pools already indexed by syncFraxPools are read from our index, so this only needs to
+    ///  check pools added to the Convex Frax registry since our last sync. Try-catch (used for
+    ///  unsynced pools) may appear as reverts in some dev envs.
     /// @param _convexPid The Convex pid to check.
     /// @return hasFraxPool Whether or not the given Convex pid also has a Convex Frax pool.
     /// @return convexFraxPid For Convex Frax pools, their assigned Convex Frax pid.
@@ -742,8 +879,14 @@ contract CurveGlobal {
         IPoolRegistry _convexFraxPoolRegistry = IPoolRegistry(
             convexFraxPoolRegistry
         );
-        for (uint256 i = _convexFraxPoolRegistry.poolLength(); i > 0; --i) {
-            // we start at the end and work back for most recent
+
+        // check any pools added since our last sync first, we start at the end and work back for most recent
+        uint256 synced = fraxPoolsSynced[address(_convexFraxPoolRegistry)];
+        for (
+            uint256 i = _convexFraxPoolRegistry.poolLength();
+            i > synced;
+            --i
+        ) {
             (
                 ,
                 address _stakingAddress,
@@ -756,15 +899,79 @@ contract CurveGlobal {
                 continue;
             }
 
-            // check the convex pool pid for this frax pool pid. some staking tokens don't have this view
-            try IStakingToken(stakingToken).convexPoolId() returns (
-                uint256 currentPoolConvexPid
-            ) {
-                if (_convexPid == currentPoolConvexPid) {
-                    return (true, (i - 1), _stakingAddress);
-                }
-            } catch {}
+            (bool isValid, uint256 currentPoolConvexPid) = _getConvexPid(
+                stakingToken
+            );
+            if (isValid && _convexPid == currentPoolConvexPid) {
+                return (true, (i - 1), _stakingAddress);
+            }
         }
+
+        // otherwise use our index, again most recent first, skipping any pools that aren't active now
+        uint256[] storage fraxPids = fraxPoolIndex[
+            address(_convexFraxPoolRegistry)
+        ][_convexPid];
+        for (uint256 i = fraxPids.length; i > 0; --i) {
+            uint256 fraxPid = fraxPids[i - 1];
+            (
+                ,
+                address _stakingAddress,
+                ,
+                ,
+                uint8 isActive
+            ) = _convexFraxPoolRegistry.poolInfo(fraxPid);
+            if (isActive != 0) {
+                return (true, fraxPid, _stakingAddress);
+            }
+        }
+    }
+
+    /// @notice Index new pools from the Convex Frax pool registry so getFraxInfo can look them up directly.
+    /// @dev May be called by anyone. Picks up where the last sync left off, so large registries should be
+    ///  synced over several calls to stay under the block gas limit. Our deployment functions don't sync,
+    ///  so call this ahead of time to keep their cost down. Inactive pools are indexed as well, getFraxInfo
+    ///  checks whether a pool is active when it's read.
+    /// @param _count The maximum number of registry pools to index in this call.
+    function syncFraxPools(uint256 _count) external {
+        IPoolRegistry _convexFraxPoolRegistry = IPoolRegistry(
+            convexFraxPoolRegistry
+        );
+        uint256 start = fraxPoolsSynced[address(_convexFraxPoolRegistry)];
+        uint256 end = _convexFraxPoolRegistry.poolLength();
+        if (start >= end) {
+            return;
+        }
+        if (_count < end - start) {
+            end = start + _count;
+        }
+
+        mapping(uint256 => uint256[]) storage poolIndex = fraxPoolIndex[
+            address(_convexFraxPoolRegistry)
+        ];
+        for (uint256 i = start; i < end; ++i) {
+            (, , address stakingToken, , ) = _convexFraxPoolRegistry.poolInfo(
+                i
+            );
+            (bool isValid, uint256 convexPid) = _getConvexPid(stakingToken);
+            if (isValid) {
+                poolIndex[convexPid].push(i);
+            }
+        }
+
+        fraxPoolsSynced[address(_convexFraxPoolRegistry)] = end;
+    }
+
+    // pull the convex pid for a convex frax pool's staking token. isValid is false if the staking token
+    //  doesn't tell us its convex pid, some staking tokens don't have this view.
+    function _getConvexPid(
+        address _stakingToken
+    ) internal view returns (bool isValid, uint256 convexPid) {
+        try IStakingToken(_stakingToken).convexPoolId() returns (
+            uint256 currentPoolConvexPid
+        ) {
+            isValid = true;
+            convexPid = currentPoolConvexPid;
+        } catch {}
     }
 
     /// @notice Check our current Curve strategy proxy via our Curve voter.
@@ -773,6 +980,73 @@ contract CurveGlobal {
         proxy = IVoter(curveVoter).strategy();
     }
 
+    /// @notice Predict the addresses of the strategies that our next vault for a given Curve gauge will get.
+    /// @dev Our strategies are CREATE2 clones salted by their gauge and that gauge's latest vault from this
+    ///  factory, so these hold until we deploy for this gauge or change our implementations, clone type or
+    ///  curve voter. Our vault is deployed by our registry, so we can't predict it. The Convex Frax pool
+    ///  check may appear as a revert in some dev envs, see getFraxInfo.
+    /// @param _gauge The gauge address to check.
+    /// @return convexStrategy Predicted address of our Convex strategy. With immutable-args clones, this is
+    ///  zero until our gauge has a Convex pool, since we can't know its rewards contract ahead of time.
+    /// @return curveStrategy Predicted address of our Curve boosted strategy.
+    /// @return convexFraxStrategy Predicted address of our Convex Frax strategy, zero if we won't create one.
+    function predictAddresses(
+        address _gauge
+    )
+        external
+        view
+        returns (
+            address convexStrategy,
+            address curveStrategy,
+            address convexFraxStrategy
+        )
+    {
+        bytes32 salt = _strategySalt(_gauge);
+        curveStrategy = ClonesWithImmutableArgs.predictDeterministicAddress(
+            curveStratImplementation,
+            _curveArgs(_gauge, getProxy()),
+            salt,
+            address(this)
+        );
+
+        // without a convex pool, we'll add one on deployment. new convex pools won't have a frax pool yet.
+        uint256 pid = getPid(_gauge);
+        if (pid == type(uint256).max) {
+            if (!useImmutableArgsClones) {
+                convexStrategy = ClonesWithImmutableArgs
+                    .predictDeterministicAddress(
+                        convexStratImplementation,
+                        "",
+                        salt,
+                        address(this)
+                    );
+            }
+            return (convexStrategy, curveStrategy, convexFraxStrategy);
+        }
+
+        convexStrategy = ClonesWithImmutableArgs.predictDeterministicAddress(
+            convexStratImplementation,
+            _convexArgs(pid),
+            salt,
+            address(this)
+        );
+
+        (
+            bool hasFraxPool,
+            uint256 fraxPid,
+            address stakingAddress
+        ) = getFraxInfo(pid);
+        if (hasFraxPool) {
+            convexFraxStrategy = ClonesWithImmutableArgs
+                .predictDeterministicAddress(
+                    convexFraxStratImplementation,
+                    _convexFraxArgs(fraxPid, stakingAddress),
+                    salt,
+                    address(this)
+                );
+        }
+    }
+
     /* ========== CORE FUNCTIONS ========== */
 
     /// @notice Deploy a factory Curve vault for a given Curve gauge.
@@ -802,7 +1076,14 @@ contract CurveGlobal {
             revert();
         }
 
-        return _createNewVaultsAndStrategies(_gauge, true, _name, _symbol);
+        return
+            _createNewVaultsAndStrategies(
+                _gauge,
+                true,
+                _name,
+                _symbol,
+                getProxy()
+            );
     }
 
     /// @notice Deploy a factory Curve vault for a given Curve gauge permissionlessly.
@@ -825,7 +1106,155 @@ contract CurveGlobal {
         )
     {
         return
-            _createNewVaultsAndStrategies(_gauge, false, "default", "default");
+            _createNewVaultsAndStrategies(
+                _gauge,
+                false,
+                "default",
+                "default",
+                getProxy()
+            );
+    }
+
+    /// @notice Deploy factory Curve vaults for several Curve gauges permissionlessly.
+    /// @dev This may be called by anyone. A gauge that fails to deploy (for instance, because a vault
+    ///  already exists) doesn't revert the batch, its revert data is returned instead. That isolation
+    ///  has a cost: each gauge is deployed through an external self-call, so it pays for a call plus
+    ///  ABI encoding and decoding, and re-reads our factory settings (registry, implementations, fees,
+    ///  keeps and voters) from storage. Only our strategy proxy is looked up once for the whole batch.
+    ///  Batching saves a transaction per gauge, not per-gauge execution gas.
+    /// @param _gauges Addresses of the Curve gauges to deploy new vaults for.
+    /// @return results Deployment result for each gauge, in the same order as _gauges.
+    function createNewVaultsAndStrategiesBatch(
+        address[] calldata _gauges
+    ) external returns (BatchResult[] memory results) {
+        address proxy = getProxy();
+
+        uint256 length = _gauges.length;
+        results = new BatchResult[](length);
+        for (uint256 i; i < length; ++i) {
+            BatchResult memory result = results[i];
+            result.gauge = _gauges[i];
+
+            try
+                this.createNewVaultsAndStrategiesForBatch(_gauges[i], proxy)
+            returns (
+                address vault,
+                address convexStrategy,
+                address curveStrategy,
+                address convexFraxStrategy
+            ) {
+                result.vault = vault;
+                result.convexStrategy = convexStrategy;
+                result.curveStrategy = curveStrategy;
+                result.convexFraxStrategy = convexFraxStrategy;
+                result.success = true;
+            } catch (bytes memory reason) {
+                result.reason = reason;
+            }
+        }
+    }
+
+    /// @notice Deploy a single vault as part of createNewVaultsAndStrategiesBatch.
+    /// @dev Must be called by this factory. This is external only so that each deployment in a
+    ///  batch may revert on its own without reverting the whole batch.
+    /// @param _gauge Address of the Curve gauge to deploy a new vault for.
+    /// @param _proxy Address of our current Curve strategy proxy.
+    /// @return vault Address of the new vault.
+    /// @return convexStrategy Address of the vault's Convex strategy, if created.
+    /// @return curveStrategy Address of the vault's Curve boosted strategy.
+    /// @return convexFraxStrategy Address of the vault's Convex Frax strategy, if created.
+    function createNewVaultsAndStrategiesForBatch(
+        address _gauge,
+        address _proxy
+    )
+        external
+        returns (
+            address vault,
+            address convexStrategy,
+            address curveStrategy,
+            address convexFraxStrategy
+        )
+    {
+        if (msg.sender != address(this)) {
+            revert();
+        }
+
+        return
+            _createNewVaultsAndStrategies(
+                _gauge,
+                false,
+                "default",
+                "default",
+                _proxy
+            );
+    }
+
+    /// @notice Update our strategy settings on many of our newly deployed strategies at once.
+    /// @dev Each call must be one of the setters we use when deploying strategies. setHealthCheck and
+    ///  setBaseFeeOracle may be called by owner or management, setVoter(s) and setLocalKeepCrv(s) by owner
+    ///  only, since they decide where our strategies send their keep. Only reaches strategies whose vault
+    ///  still has our factory as governance, i.e. before ychad accepts it. Once governance has been
+    ///  accepted, use scripts/fleet_multisend.py to batch the same calls from governance instead. A call
+    ///  that fails doesn't revert the others, its revert data is returned instead.
+    /// @param _strategies Strategies to call.
+    /// @param _calls ABI-encoded setter calls, one for each strategy in _strategies.
+    /// @return results Outcome of each call, in the same order as _strategies.
+    function applyToStrategies(
+        address[] calldata _strategies,
+        bytes[] calldata _calls
+    ) external returns (StrategyCallResult[] memory results) {
+        if (!(msg.sender == owner || msg.sender == management)) {
+            revert();
+        }
+        uint256 length = _strategies.length;
+        require(length == _calls.length, "Length mismatch");
+
+        results = new StrategyCallResult[](length);
+        for (uint256 i; i < length; ++i) {
+            // only our strategy setters, this shouldn't be a way to make arbitrary calls from our factory
+            bytes4 selector = bytes4(_calls[i]);
+            require(_isStrategySetter(selector), "Call not allowed");
+
+            // keeps and voters decide where our rewards go, so management can't touch them
+            if (_isKeepSetter(selector) && msg.sender != owner) {
+                revert();
+            }
+
+            StrategyCallResult memory result = results[i];
+            result.strategy = _strategies[i];
+
+            (bool success, bytes memory reason) = _strategies[i].call(
+                _calls[i]
+            );
+            if (success) {
+                result.success = true;
+            } else {
+                result.reason = reason;
+                emit StrategyCallFailed(_strategies[i], reason);
+            }
+        }
+    }
+
+    // check if a selector is one of the strategy setters we allow in applyToStrategies
+    function _isStrategySetter(bytes4 _selector) internal pure returns (bool) {
+        return
+            _selector == IStrategy.setHealthCheck.selector ||
+            _selector == IStrategy.setBaseFeeOracle.selector ||
+            _isKeepSetter(_selector);
+    }
+
+    // check if a selector sets our strategy's keep or voters, only owner may call these in applyToStrategies
+    function _isKeepSetter(bytes4 _selector) internal pure returns (bool) {
+        return
+            _selector == IStrategy.setVoter.selector ||
+            _selector == IStrategy.setLocalKeepCrv.selector ||
+            _selector == bytes4(keccak256("setVoters(address,address)")) ||
+            _selector ==
+            bytes4(keccak256("setVoters(address,address,address)")) ||
+            _selector ==
+            bytes4(keccak256("setLocalKeepCrvs(uint256,uint256)")) ||
+            _selector ==
+            bytes4(keccak256("setLocalKeepCrvs(uint256,uint256,uint256)"));
     }
 
     // create a new vault along with strategies to match
@@ -833,7 +1262,8 @@ contract CurveGlobal {
         address _gauge,
         bool _permissionedUser,
         string memory _name,
-        string memory _symbol
+        string memory _symbol,
+        address _proxy
     )
         internal
         returns (
@@ -844,11 +1274,9 @@ contract CurveGlobal {
         )
     {
         // a curve gauge must have weight for a vault to be deployed
-        IGaugeController gaugeController = IGaugeController(
-            0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB
-        );
         require(
-            gaugeController.get_gauge_weight(_gauge) > 0,
+            IGaugeController(0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB)
+                .get_gauge_weight(_gauge) > 0,
             "Gauge must have weight"
         );
 
@@ -863,7 +1291,7 @@ contract CurveGlobal {
 
         // make sure we don't already have a curve strategy setup for this gauge
         require(
-            !doesStrategyProxyHaveGauge(_gauge),
+            IProxy(_proxy).strategies(_gauge) == address(0),
             "Voter strategy already exists"
         );
 
@@ -877,8 +1305,14 @@ contract CurveGlobal {
                 IPoolManager(convexPoolManager).addPool(_gauge),
                 "Unable to add pool to Convex"
             );
+
+            // index our new pool so future lookups don't need to search the booster
+            _indexPid(address(booster), _gauge, pid);
         }
 
+        // salt our strategy clones before we record our new vault for this gauge, see predictAddresses
+        bytes32 salt = _strategySalt(_gauge);
+
         if (_permissionedUser) {
             // allow trusted users to input the name and symbol or deploy a factory version of a legacy vault
             vault = _createCustomVault(lptoken, _name, _symbol);
@@ -888,13 +1322,15 @@ contract CurveGlobal {
         }
 
         // setup our fees, deposit limit, gov, etc
-        _setupVaultParams(vault);
+        _setupVaultParams(vault, _gauge);
 
         // setup our strategies as needed
         (convexStrategy, curveStrategy, convexFraxStrategy) = _setupStrategies(
             vault,
             _gauge,
-            pid
+            pid,
+            _proxy,
+            salt
         );
 
         emit NewAutomatedVault(
@@ -954,10 +1390,12 @@ contract CurveGlobal {
         );
     }
 
-    // set vault management, gov, deposit limit, and fees
-    function _setupVaultParams(address _vault) internal {
+    // record our vault and its gauge, and set vault management, gov, deposit limit, and fees
+    function _setupVaultParams(address _vault, address _gauge) internal {
         // record our new vault for posterity
         deployedVaults.push(_vault);
+        gaugeToVault[_gauge] = _vault;
+        vaultToGauge[_vault] = _gauge;
 
         Vault v = Vault(_vault);
         v.setManagement(management);
@@ -978,7 +1416,9 @@ contract CurveGlobal {
     function _setupStrategies(
         address _vault,
         address _gauge,
-        uint256 _pid
+        uint256 _pid,
+        address _proxy,
+        bytes32 _salt
     )
         internal
         returns (
@@ -987,7 +1427,8 @@ contract CurveGlobal {
             address convexFraxStrategy
         )
     {
-        // check if we can add a convex frax strategy for this pool, ganache can't handle this (use tenderly)
+        // check if we can add a convex frax strategy for this pool. if our index hasn't been synced with
+        //  syncFraxPools, this falls back to scanning the unsynced registry pools with try-catch
         (
             bool hasFraxPool,
             uint256 fraxPid,
@@ -995,15 +1436,22 @@ contract CurveGlobal {
         ) = getFraxInfo(_pid);
 
         // we have a frax implementation, so we know we at least want convex and curve boosted strategies
-        convexStrategy = _addConvexStrategy(_vault, _pid);
-        curveStrategy = _addCurveStrategy(_vault, _gauge, hasFraxPool);
+        convexStrategy = _addConvexStrategy(_vault, _pid, _salt);
+        curveStrategy = _addCurveStrategy(
+            _vault,
+            _gauge,
+            hasFraxPool,
+            _proxy,
+            _salt
+        );
 
         if (hasFraxPool) {
             // we attach a frax strategy here since this is a frax pool
             convexFraxStrategy = _addConvexFraxStrategy(
                 _vault,
                 fraxPid,
-                stakingAddress
+                stakingAddress,
+                _salt
             );
         }
     }
@@ -1011,21 +1459,26 @@ contract CurveGlobal {
     // deploy and attach a new convex strategy using our factory's existing implementation
     function _addConvexStrategy(
         address _vault,
-        uint256 _pid
+        uint256 _pid,
+        bytes32 _salt
     ) internal returns (address convexStrategy) {
-        convexStrategy = IStrategy(convexStratImplementation)
-            .cloneStrategyConvex(
-                _vault,
-                management,
-                treasury,
-                keeper,
-                tradeFactory,
-                _pid,
-                harvestProfitMinInUsdc,
-                harvestProfitMaxInUsdc,
-                address(booster),
-                CVX
-            );
+        convexStrategy = ClonesWithImmutableArgs.cloneDeterministic(
+            convexStratImplementation,
+            _convexArgs(_pid),
+            _salt
+        );
+        IStrategy(convexStrategy).initialize(
+            _vault,
+            management,
+            treasury,
+            keeper,
+            tradeFactory,
+            _pid,
+            harvestProfitMinInUsdc,
+            harvestProfitMaxInUsdc,
+            address(booster),
+            CVX
+        );
 
         // set up health check and the base fee oracle for our new strategy
         IStrategy(convexStrategy).setHealthCheck(healthCheck);
@@ -1045,22 +1498,27 @@ contract CurveGlobal {
     function _addCurveStrategy(
         address _vault,
         address _gauge,
-        bool _hasFraxPool
+        bool _hasFraxPool,
+        address _proxy,
+        bytes32 _salt
     ) internal returns (address curveStrategy) {
-        // pull our strategyProxy from our voter
-        IProxy proxy = IProxy(getProxy());
+        IProxy proxy = IProxy(_proxy);
 
         // create the curve voter strategy
-        curveStrategy = IStrategy(curveStratImplementation)
-            .cloneStrategyCurveBoosted(
-                _vault,
-                management,
-                treasury,
-                keeper,
-                tradeFactory,
-                address(proxy),
-                _gauge
-            );
+        curveStrategy = ClonesWithImmutableArgs.cloneDeterministic(
+            curveStratImplementation,
+            _curveArgs(_gauge, _proxy),
+            _salt
+        );
+        IStrategy(curveStrategy).initialize(
+            _vault,
+            management,
+            treasury,
+            keeper,
+            tradeFactory,
+            _proxy,
+            _gauge
+        );
 
         // set up health check and the base fee oracle for our new strategy
         IStrategy(curveStrategy).setHealthCheck(healthCheck);
@@ -1095,21 +1553,26 @@ contract CurveGlobal {
     function _addConvexFraxStrategy(
         address _vault,
         uint256 _fraxPid,
-        address _stakingAddress
+        address _stakingAddress,
+        bytes32 _salt
     ) internal returns (address convexFraxStrategy) {
-        convexFraxStrategy = IStrategy(convexFraxStratImplementation)
-            .cloneStrategyConvexFrax(
-                _vault,
-                management,
-                treasury,
-                keeper,
-                tradeFactory,
-                _fraxPid,
-                _stakingAddress,
-                harvestProfitMinInUsdc,
-                harvestProfitMaxInUsdc,
-                address(fraxBooster)
-            );
+        convexFraxStrategy = ClonesWithImmutableArgs.cloneDeterministic(
+            convexFraxStratImplementation,
+            _convexFraxArgs(_fraxPid, _stakingAddress),
+            _salt
+        );
+        IStrategy(convexFraxStrategy).initialize(
+            _vault,
+            management,
+            treasury,
+            keeper,
+            tradeFactory,
+            _fraxPid,
+            _stakingAddress,
+            harvestProfitMinInUsdc,
+            harvestProfitMaxInUsdc,
+            address(fraxBooster)
+        );
 
         // set up health check and the base fee oracle for our new strategy
         IStrategy(convexFraxStrategy).setHealthCheck(healthCheck);
@@ -1138,4 +1601,41 @@ contract CurveGlobal {
             0
         );
     }
+
+    // our strategy clones are salted by their gauge and that gauge's latest vault from this factory
+    function _strategySalt(address _gauge) internal view returns (bytes32) {
+        return keccak256(abi.encodePacked(_gauge, gaugeToVault[_gauge]));
+    }
+
+    // immutable args for our convex strategy clones, these must match our implementation's layout
+    function _convexArgs(uint256 _pid) internal view returns (bytes memory) {
+        if (!useImmutableArgsClones) {
+            return "";
+        }
+        (, , , address rewardsContract, , ) = booster.poolInfo(_pid);
+        return abi.encodePacked(address(booster), rewardsContract, _pid);
+    }
+
+    // immutable args for our curve boosted strategy clones
+    function _curveArgs(
+        address _gauge,
+        address _proxy
+    ) internal view returns (bytes memory) {
+        if (!useImmutableArgsClones) {
+            return "";
+        }
+        return abi.encodePacked(_proxy, _gauge);
+    }
+
+    // immutable args for our convex frax strategy clones
+    function _convexFraxArgs(
+        uint256 _fraxPid,
+        address _stakingAddress
+    ) internal view returns (bytes memory) {
+        if (!useImmutableArgsClones) {
+            return "";
+        }
+        return
+            abi.encodePacked(address(fraxBooster), _stakingAddress, _fraxPid);
+    }
 }
@@ -0,0 +1,248 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+interface ICurveGlobal {
+    function deployedVaults(uint256) external view returns (address);
+
+    function numVaults() external view returns (uint256);
+
+    // older factories don't have this view
+    function vaultToGauge(address) external view returns (address);
+}
+
+struct StrategyParams {
+    uint256 performanceFee;
+    uint256 activation;
+    uint256 debtRatio;
+    uint256 minDebtPerHarvest;
+    uint256 maxDebtPerHarvest;
+    uint256 lastReport;
+    uint256 totalDebt;
+    uint256 totalGain;
+    uint256 totalLoss;
+}
+
+interface IVault {
+    function token() external view returns (address);
+
+    function totalAssets() external view returns (uint256);
+
+    function debtRatio() external view returns (uint256);
+
+    function withdrawalQueue(uint256) external view returns (address);
+
+    function creditAvailable(address) external view returns (uint256);
+
+    function strategies(address) external view returns (StrategyParams memory);
+}
+
+interface IStrategy {
+    function harvestTrigger(uint256) external view returns (bool);
+
+    // not all of our strategies have this view (curve boosted doesn't)
+    function claimableProfitInUsdc() external view returns (uint256);
+
+    // only our curve boosted strategies have this view
+    function gauge() external view returns (address);
+}
+
+/// @notice Read-only helper for keepers and dashboards to pull data on many factory vaults in one call.
+/// @dev Nothing here should be called on-chain, these views are meant for eth_call only.
+contract CurveGlobalLens {
+    struct StrategyTrigger {
+        /// @notice Vault this strategy is attached to.
+        address vault;
+        /// @notice Address of the strategy.
+        address strategy;
+        /// @notice Whether or not our strategy should be harvested. False if harvestTrigger reverts.
+        bool trigger;
+        /// @notice Claimable profit in USDC. Zero for strategies without this view.
+        uint256 claimableProfitInUsdc;
+        /// @notice Timestamp of the strategy's last report to its vault.
+        uint256 lastReport;
+        /// @notice Amount of want the vault is ready to lend to the strategy.
+        uint256 creditAvailable;
+    }
+
+    struct VaultSummary {
+        /// @notice Address of the vault.
+        address vault;
+        /// @notice The vault's want, a Curve LP token.
+        address lpToken;
+        /// @notice Curve gauge for our LP token, zero if neither our factory nor our strategies know it.
+        address gauge;
+        /// @notice Total assets held by the vault and its strategies.
+        uint256 totalAssets;
+        /// @notice Total debt ratio of the vault across all strategies.
+        uint256 debtRatio;
+        /// @notice Strategies in the vault's withdrawal queue, in order.
+        address[] strategies;
+        /// @notice Debt ratio of each strategy, in the same order as strategies.
+        uint256[] debtRatios;
+    }
+
+    /// @notice Max number of strategies a yearn vault may have in its withdrawal queue.
+    uint256 internal constant MAXIMUM_STRATEGIES = 20;
+
+    /// @notice The factory whose vaults we are looking at.
+    ICurveGlobal public immutable curveGlobal;
+
+    constructor(address _curveGlobal) {
+        curveGlobal = ICurveGlobal(_curveGlobal);
+    }
+
+    /// @notice Check the harvest triggers for every strategy of a page of our factory's vaults.
+    /// @dev Vaults are taken in the order they appear in our factory's deployedVaults, and strategies
+    ///  in the order of each vault's withdrawal queue. Use eth_call, this isn't gas-efficient on-chain.
+    /// @param _offset Index in deployedVaults of the first vault to check.
+    /// @param _limit Max number of vaults to check.
+    /// @param _callCostInEth Cost of calling harvest (in wei), passed to each strategy's harvestTrigger.
+    /// @return triggers Trigger info for each strategy of each vault in our page.
+    function harvestTriggers(
+        uint256 _offset,
+        uint256 _limit,
+        uint256 _callCostInEth
+    ) external view returns (StrategyTrigger[] memory triggers) {
+        address[] memory vaults = _vaultsPage(_offset, _limit);
+
+        // first collect all of our strategies, then check each one
+        uint256 length = vaults.length;
+        address[] memory strategyVaults = new address[](
+            length * MAXIMUM_STRATEGIES
+        );
+        address[] memory strategies = new address[](
+            length * MAXIMUM_STRATEGIES
+        );
+        uint256 numStrategies;
+        for (uint256 i; i < length; ++i) {
+            address[] memory queue = _withdrawalQueue(vaults[i]);
+            for (uint256 j; j < queue.length; ++j) {
+                strategyVaults[numStrategies] = vaults[i];
+                strategies[numStrategies] = queue[j];
+                ++numStrategies;
+            }
+        }
+
+        triggers = new StrategyTrigger[](numStrategies);
+        for (uint256 i; i < numStrategies; ++i) {
+            triggers[i] = _strategyTrigger(
+                strategyVaults[i],
+                strategies[i],
+                _callCostInEth
+            );
+        }
+    }
+
+    /// @notice Summarize a page of our factory's vaults.
+    /// @dev Vaults are taken in the order they appear in our factory's deployedVaults. Use eth_call,
+    ///  this isn't gas-efficient on-chain.
+    /// @param _offset Index in deployedVaults of the first vault to summarize.
+    /// @param _limit Max number of vaults to summarize.
+    /// @return summaries Summary of each vault in our page.
+    function vaultSummaries(
+        uint256 _offset,
+        uint256 _limit
+    ) external view returns (VaultSummary[] memory summaries) {
+        address[] memory vaults = _vaultsPage(_offset, _limit);
+        summaries = new VaultSummary[](vaults.length);
+        for (uint256 i; i < vaults.length; ++i) {
+            summaries[i] = _vaultSummary(vaults[i]);
+        }
+    }
+
+    // pull summary info for a single vault
+    function _vaultSummary(
+        address _vault
+    ) internal view returns (VaultSummary memory summary) {
+        IVault vault = IVault(_vault);
+        summary.vault = _vault;
+        summary.lpToken = vault.token();
+        summary.totalAssets = vault.totalAssets();
+        summary.debtRatio = vault.debtRatio();
+        summary.strategies = _withdrawalQueue(_vault);
+
+        // use our factory's gauge index if it has one
+        try curveGlobal.vaultToGauge(_vault) returns (address gauge) {
+            summary.gauge = gauge;
+        } catch {}
+
+        uint256 length = summary.strategies.length;
+        summary.debtRatios = new uint256[](length);
+        for (uint256 i; i < length; ++i) {
+            address strategy = summary.strategies[i];
+            summary.debtRatios[i] = vault.strategies(strategy).debtRatio;
+
+            // otherwise, only our curve boosted strategies know their gauge
+            if (summary.gauge == address(0)) {
+                try IStrategy(strategy).gauge() returns (address gauge) {
+                    summary.gauge = gauge;
+                } catch {}
+            }
+        }
+    }
+
+    // pull trigger info for a single strategy, never reverting on optional views
+    function _strategyTrigger(
+        address _vault,
+        address _strategy,
+        uint256 _callCostInEth
+    ) internal view returns (StrategyTrigger memory info) {
+        info.vault = _vault;
+        info.strategy = _strategy;
+
+        try IStrategy(_strategy).harvestTrigger(_callCostInEth) returns (
+            bool trigger
+        ) {
+            info.trigger = trigger;
+        } catch {}
+
+        try IStrategy(_strategy).claimableProfitInUsdc() returns (
+            uint256 claimableProfit
+        ) {
+            info.claimableProfitInUsdc = claimableProfit;
+        } catch {}
+
+        IVault vault = IVault(_vault);
+        info.lastReport = vault.strategies(_strategy).lastReport;
+        info.creditAvailable = vault.creditAvailable(_strategy);
+    }
+
+    // pull a page of vaults from our factory, capped at the number of vaults it has deployed
+    function _vaultsPage(
+        uint256 _offset,
+        uint256 _limit
+    ) internal view returns (address[] memory vaults) {
+        uint256 numVaults = curveGlobal.numVaults();
+        if (_offset >= numVaults) {
+            return vaults;
+        }
+        if (_limit > numVaults - _offset) {
+            _limit = numVaults - _offset;
+        }
+
+        vaults = new address[](_limit);
+        for (uint256 i; i < _limit; ++i) {
+            vaults[i] = curveGlobal.deployedVaults(_offset + i);
+        }
+    }
+
+    // a vault's withdrawal queue ends at the first empty slot
+    function _withdrawalQueue(
+        address _vault
+    ) internal view returns (address[] memory queue) {
+        address[] memory fullQueue = new address[](MAXIMUM_STRATEGIES);
+        uint256 length;
+        for (; length < MAXIMUM_STRATEGIES; ++length) {
+            address strategy = IVault(_vault).withdrawalQueue(length);
+            if (strategy == address(0)) {
+                break;
+            }
+            fullQueue[length] = strategy;
+        }
+
+        queue = new address[](length);
+        for (uint256 i; i < length; ++i) {
+            queue[i] = fullQueue[i];
+        }
+    }
+}
@@ -3,15 +3,99 @@ pragma solidity 0.6.12;
 
 interface IStrategy {
     function harvest() external;
+
+    function harvestTrigger(uint256 callCost) external view returns (bool);
 }
 
 /// @notice This contract allows anyone to harvest automated yearn strategies
 /// @dev Automated yearn strategies do not swap tokens during harvests
 contract KeeperWrapper {
+    /// @notice Emitted when a strategy is harvested as part of a batch
+    event Harvested(address indexed strategy);
+
+    /// @notice Emitted when a strategy in a batch fails to harvest or check its trigger
+    /// @dev reason is empty if there's no contract at the strategy address
+    event HarvestFailed(address indexed strategy, bytes reason);
+
     /// @notice Calls harvest on the strategy address entered
     /// @dev Will revert if the strategy's keeper is not set to this address
     /// @param _strategy Address of the strategy to harvest
     function harvest(address _strategy) external {
         IStrategy(_strategy).harvest();
     }
+
+    /// @notice Calls harvest on each of the strategy addresses entered
+    /// @dev A strategy that reverts (for instance, if its keeper is not set to this address)
+    ///  is skipped and logged without reverting the rest of the batch
+    /// @param _strategies Addresses of the strategies to harvest
+    /// @return harvested Number of strategies successfully harvested
+    function harvestMany(
+        address[] calldata _strategies
+    ) external returns (uint256 harvested) {
+        for (uint256 i; i < _strategies.length; ++i) {
+            if (_harvest(_strategies[i])) {
+                harvested++;
+            }
+        }
+    }
+
+    /// @notice Calls harvest on each of the strategy addresses entered whose harvestTrigger is true
+    /// @dev Strategies whose trigger is false are skipped silently, while those that revert on
+    ///  either the trigger or the harvest (or don't return a trigger at all) are skipped and logged
+    /// @param _strategies Addresses of the strategies to check and harvest
+    /// @param _callCost Cost of calling harvest (in wei), passed to each strategy's harvestTrigger
+    /// @return harvested Number of strategies successfully harvested
+    function harvestManyIfTriggered(
+        address[] calldata _strategies,
+        uint256 _callCost
+    ) external returns (uint256 harvested) {
+        for (uint256 i; i < _strategies.length; ++i) {
+            address strategy = _strategies[i];
+            if (!_isContract(strategy)) {
+                emit HarvestFailed(strategy, "");
+                continue;
+            }
+
+            // a high-level call would revert the whole batch if our return data can't be decoded
+            (bool success, bytes memory data) = strategy.staticcall(
+                abi.encodeWithSelector(
+                    IStrategy.harvestTrigger.selector,
+                    _callCost
+                )
+            );
+            if (!success || data.length < 32) {
+                emit HarvestFailed(strategy, data);
+                continue;
+            }
+
+            if (abi.decode(data, (bool)) && _harvest(strategy)) {
+                harvested++;
+            }
+        }
+    }
+
+    // harvest a single strategy, logging the outcome instead of reverting
+    function _harvest(address _strategy) internal returns (bool) {
+        // try-catch reverts outright if there's no code at our address, so check first
+        if (!_isContract(_strategy)) {
+            emit HarvestFailed(_strategy, "");
+            return false;
+        }
+
+        try IStrategy(_strategy).harvest() {
+            emit Harvested(_strategy);
+            return true;
+        } catch (bytes memory reason) {
+            emit HarvestFailed(_strategy, reason);
+            return false;
+        }
+    }
+
+    function _isContract(address _account) internal view returns (bool) {
+        uint256 size;
+        assembly {
+            size := extcodesize(_account)
+        }
+        return size > 0;
+    }
 }
@@ -0,0 +1,172 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+interface IOracle {
+    function latestRoundData(
+        address,
+        address
+    )
+        external
+        view
+        returns (
+            uint80 roundId,
+            uint256 answer,
+            uint256 startedAt,
+            uint256 updatedAt,
+            uint80 answeredInRound
+        );
+}
+
+interface IConvexToken {
+    function totalSupply() external view returns (uint256);
+}
+
+/// @notice Shared cache of the reward token prices and CVX mint rate used by our strategies' harvest triggers.
+/// @dev Everything is packed into a single storage slot, so a strategy can price its claimable rewards with one
+///  call instead of several Chainlink lookups and the CVX cliff math. Anyone may refresh the cache, and stale
+///  values are never returned (we fall back to live values instead).
+contract RewardPriceSnapshot {
+    event Updated(
+        uint256 crvPrice,
+        uint256 cvxPrice,
+        uint256 fxsPrice,
+        uint256 cvxReduction,
+        uint256 cvxTillMax
+    );
+
+    struct Snapshot {
+        /// @notice CRV price in USD (8 decimals).
+        uint56 crvPrice;
+        /// @notice CVX price in USD (8 decimals).
+        uint56 cvxPrice;
+        /// @notice FXS price in USD (8 decimals).
+        uint56 fxsPrice;
+        /// @notice CVX minted per CRV claimed, out of TOTAL_CLIFFS. Zero once all cliffs are reached.
+        uint16 cvxReduction;
+        /// @notice CVX left to mint before max supply, in whole tokens (rounded down).
+        uint32 cvxTillMax;
+        /// @notice Timestamp of our last update.
+        uint40 updatedAt;
+    }
+
+    /* ========== STATE VARIABLES ========== */
+
+    /// @notice Chainlink's feed registry.
+    IOracle internal constant FEED_REGISTRY =
+        IOracle(0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf);
+
+    /// @notice Chainlink's denomination for USD.
+    address internal constant USD = 0x0000000000000000000000000000000000000348;
+
+    /// @notice Address of CRV.
+    address public constant CRV = 0xD533a949740bb3306d119CC777fa900bA034cd52;
+
+    /// @notice Address of CVX.
+    address public constant CVX = 0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B;
+
+    /// @notice Address of FXS.
+    address public constant FXS = 0x3432B6A60D23Ca0dFCa7761B7ab56459D9C964D0;
+
+    // calculations pulled directly from CVXs contract for minting CVX per CRV claimed
+    uint256 public constant TOTAL_CLIFFS = 1_000;
+    uint256 internal constant REDUCTION_PER_CLIFF = 100_000 * 1e18;
+    uint256 internal constant MAX_SUPPLY = 100 * 1_000_000 * 1e18;
+
+    /// @notice How long (in seconds) our snapshot is valid for. Zero means only during the block it was taken.
+    uint256 public immutable ttl;
+
+    // our packed snapshot
+    Snapshot internal cached;
+
+    /* ========== CONSTRUCTOR ========== */
+
+    constructor(uint256 _ttl) {
+        ttl = _ttl;
+    }
+
+    /* ========== VIEWS ========== */
+
+    /// @notice Check whether our snapshot has expired and needs an update.
+    /// @return Whether or not our snapshot is older than our TTL.
+    function isStale() public view returns (bool) {
+        return block.timestamp > uint256(cached.updatedAt) + ttl;
+    }
+
+    /// @notice Timestamp of our last update.
+    /// @return Timestamp of our last update, zero if never updated.
+    function updatedAt() external view returns (uint256) {
+        return cached.updatedAt;
+    }
+
+    /// @notice Current reward prices and CVX mint rate, from our cache if it's fresh.
+    /// @dev If our cache is stale, live values are calculated instead (but not stored).
+    /// @return crvPrice CRV price in USD (8 decimals).
+    /// @return cvxPrice CVX price in USD (8 decimals).
+    /// @return fxsPrice FXS price in USD (8 decimals).
+    /// @return cvxReduction CVX minted per CRV claimed, out of TOTAL_CLIFFS.
+    /// @return cvxTillMax CVX left to mint before max supply (18 decimals, rounded down to whole tokens).
+    function snapshot()
+        external
+        view
+        returns (
+            uint256 crvPrice,
+            uint256 cvxPrice,
+            uint256 fxsPrice,
+            uint256 cvxReduction,
+            uint256 cvxTillMax
+        )
+    {
+        Snapshot memory current = cached;
+        if (block.timestamp > uint256(current.updatedAt) + ttl) {
+            current = _liveSnapshot();
+        }
+
+        return (
+            current.crvPrice,
+            current.cvxPrice,
+            current.fxsPrice,
+            current.cvxReduction,
+            uint256(current.cvxTillMax) * 1e18
+        );
+    }
+
+    /* ========== CORE FUNCTIONS ========== */
+
+    /// @notice Refresh our snapshot with live values.
+    /// @dev May be called by anyone.
+    function update() external {
+        Snapshot memory current = _liveSnapshot();
+        cached = current;
+
+        emit Updated(
+            current.crvPrice,
+            current.cvxPrice,
+            current.fxsPrice,
+            current.cvxReduction,
+            uint256(current.cvxTillMax) * 1e18
+        );
+    }
+
+    // pull our prices from chainlink and do our CVX cliff math
+    function _liveSnapshot() internal view returns (Snapshot memory current) {
+        current.crvPrice = uint56(_usdPrice(CRV));
+        current.cvxPrice = uint56(_usdPrice(CVX));
+        current.fxsPrice = uint56(_usdPrice(FXS));
+
+        uint256 supply = IConvexToken(CVX).totalSupply();
+        uint256 cliff = supply / REDUCTION_PER_CLIFF;
+
+        // mint if below total cliffs
+        if (cliff < TOTAL_CLIFFS) {
+            current.cvxReduction = uint16(TOTAL_CLIFFS - cliff);
+            current.cvxTillMax = uint32((MAX_SUPPLY - supply) / 1e18);
+        }
+
+        current.updatedAt = uint40(block.timestamp);
+    }
+
+    // chainlink USD prices return 8 decimals, plenty of room in a uint56 (~$720M)
+    function _usdPrice(address _token) internal view returns (uint256 price) {
+        (, price, , , ) = FEED_REGISTRY.latestRoundData(_token, USD);
+    }
+}
@@ -2,64 +2,81 @@
 pragma solidity 0.8.19;
 
 import {Math} from "@openzeppelin/contracts@4.9.3/utils/math/Math.sol";
+import {SafeCast} from "@openzeppelin/contracts@4.9.3/utils/math/SafeCast.sol";
+import {ClonesWithImmutableArgs} from "./libraries/ClonesWithImmutableArgs.sol";
 import "github.com/yearn/yearn-vaults/blob/v0.4.6/contracts/BaseStrategy.sol";
 import "./interfaces/ConvexInterfaces.sol";
 
 contract StrategyConvexFactoryClonable is BaseStrategy {
     using SafeERC20 for IERC20;
 
-    /* ========== STATE VARIABLES ========== */
-
-    /// @notice This is the deposit contract that all Convex pools use, aka booster.
-    address public depositContract;
-
-    /// @notice This is unique to each pool and holds the rewards.
-    IConvexRewards public rewardsContract;
+    struct HarvestInfo {
+        /**
+         * @notice Minimum profit size in USDC that we want to harvest.
+         * @dev Only used in harvestTrigger.
+         */
+        uint112 harvestProfitMinInUsdc;
+        /**
+         * @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
+         * @dev Only used in harvestTrigger.
+         */
+        uint112 harvestProfitMaxInUsdc;
+        /**
+         * @notice Check if we need to earmark rewards on Convex before harvesting, usually false.
+         * @dev Only used in harvestTrigger.
+         */
+        bool checkEarmark;
+        /// @notice Whether we should claim rewards when withdrawing, generally this should be false.
+        bool claimRewards;
+    }
 
-    /// @notice This is a unique numerical identifier for each Convex pool.
-    uint256 public pid;
+    struct KeepInfo {
+        /// @notice The address of our Curve voter. This is where we send any keepCRV.
+        address curveVoter;
+        /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
+        uint16 localKeepCRV;
+        /// @notice The percentage of CVX from each harvest that we send to our voter (out of 10,000).
+        uint16 localKeepCVX;
+        /// @notice The address of our Convex voter. This is where we send any keepCVX.
+        address convexVoter;
+    }
 
-    /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
-    uint256 public localKeepCRV;
+    /* ========== STATE VARIABLES ========== */
 
-    /// @notice The percentage of CVX from each harvest that we send to our voter (out of 10,000).
-    uint256 public localKeepCVX;
+    // our booster, rewards contract and pid. only written on our original and plain clones, see depositContract().
+    address internal storedDepositContract;
+    IConvexRewards internal storedRewardsContract;
+    uint256 internal storedPid;
 
-    /// @notice The address of our Curve voter. This is where we send any keepCRV.
-    address public curveVoter;
+    // booster (20 bytes), rewards contract (20 bytes) and pid (32 bytes), packed at the end of our immutable-args clones
+    uint256 internal constant IMMUTABLE_ARGS_LENGTH = 72;
 
-    /// @notice The address of our Convex voter. This is where we send any keepCVX.
-    address public convexVoter;
+    /// @notice Our keep amounts and voters. See struct NatSpec for more details.
+    KeepInfo public keepInfo;
 
     // this means all of our fee values are in basis points
     uint256 internal constant FEE_DENOMINATOR = 10000;
 
+    // CVX minted per CRV claimed is out of this many cliffs, pulled directly from CVXs contract
+    uint256 internal constant TOTAL_CLIFFS = 1_000;
+
     /// @notice The address of our base token (CRV for Curve, BAL for Balancer, etc.).
     IERC20 public crv;
 
     /// @notice The address of our Convex token (CVX for Curve, AURA for Balancer, etc.).
     IERC20 public convexToken;
 
-    /// @notice Whether we should claim rewards when withdrawing, generally this should be false.
-    bool public claimRewards;
-
     /**
-     * @notice Minimum profit size in USDC that we want to harvest.
-     * @dev Only used in harvestTrigger.
+     * @notice Info about our harvests and withdrawals. See struct NatSpec for more details.
+     * @dev Packed into one slot, so harvestTrigger only needs a single read for all of it.
      */
-    uint256 public harvestProfitMinInUsdc;
+    HarvestInfo public harvestInfo;
 
     /**
-     * @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
-     * @dev Only used in harvestTrigger.
+     * @notice Optional shared cache of our reward prices and the CVX mint rate.
+     * @dev Only used in harvestTrigger. If zero address, we price rewards directly via Chainlink.
      */
-    uint256 public harvestProfitMaxInUsdc;
-
-    /**
-     * @notice Check if we need to earmark rewards on Convex before harvesting, usually false.
-     * @dev Only used in harvestTrigger.
-     */
-    bool public checkEarmark;
+    IRewardPriceSnapshot public rewardPriceSnapshot;
 
     // ySwaps stuff
     /// @notice The address of our ySwaps trade factory.
@@ -163,9 +180,64 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         emit Cloned(newStrategy);
     }
 
+    /**
+     * @notice Same as cloneStrategyConvex, but our clone keeps its booster, rewards contract and pid in its code.
+     * @dev These never change, so this saves writing them on deployment and reading them from storage afterwards.
+     * @param _vault Vault address we are targeting with this strategy.
+     * @param _strategist Address to grant the strategist role.
+     * @param _rewards If we have any strategist rewards, send them here.
+     * @param _keeper Address to grant the keeper role.
+     * @param _tradeFactory Our trade factory address.
+     * @param _pid Our pool id (pid) for this strategy.
+     * @param _harvestProfitMinInUsdc Minimum acceptable profit for a harvest.
+     * @param _harvestProfitMaxInUsdc Maximum acceptable profit for a harvest.
+     * @param _booster Address of the convex booster/deposit contract.
+     * @param _convexToken Address of our convex token.
+     * @return newStrategy Address of our new cloned strategy.
+     */
+    function cloneStrategyConvexWithArgs(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _tradeFactory,
+        uint256 _pid,
+        uint256 _harvestProfitMinInUsdc,
+        uint256 _harvestProfitMaxInUsdc,
+        address _booster,
+        address _convexToken
+    ) external returns (address newStrategy) {
+        // dont clone a clone
+        if (!isOriginal) {
+            revert("Cant clone a clone");
+        }
+
+        (, , , address _rewardsContract, , ) = IConvexDeposit(_booster)
+            .poolInfo(_pid);
+        newStrategy = ClonesWithImmutableArgs.clone(
+            address(this),
+            abi.encodePacked(_booster, _rewardsContract, _pid)
+        );
+
+        StrategyConvexFactoryClonable(newStrategy).initialize(
+            _vault,
+            _strategist,
+            _rewards,
+            _keeper,
+            _tradeFactory,
+            _pid,
+            _harvestProfitMinInUsdc,
+            _harvestProfitMaxInUsdc,
+            _booster,
+            _convexToken
+        );
+
+        emit Cloned(newStrategy);
+    }
+
     /**
      * @notice Initialize the strategy.
-     * @dev This should only be called by the clone function above.
+     * @dev This should only be called by the clone functions above, or by our factory right after it deploys a clone.
      * @param _vault Vault address we are targeting with this strategy.
      * @param _strategist Address to grant the strategist role.
      * @param _rewards If we have any strategist rewards, send them here.
@@ -209,17 +281,24 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         address _booster,
         address _convexToken
     ) internal {
-        // make sure that we havent initialized this before
-        if (depositContract != address(0)) {
-            revert("Already initialized");
+        // make sure that we havent initialized this before. our immutable-args clones rely on baseStrategy's check.
+        bool hasArgs = ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH);
+        if (!hasArgs) {
+            if (storedDepositContract != address(0)) {
+                revert("Already initialized");
+            }
+            storedPid = _pid;
+            storedDepositContract = _booster;
         }
 
         // 1:1 assignments
         tradeFactory = _tradeFactory;
-        pid = _pid;
-        harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
-        harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
-        depositContract = _booster;
+        harvestInfo.harvestProfitMinInUsdc = SafeCast.toUint112(
+            _harvestProfitMinInUsdc
+        );
+        harvestInfo.harvestProfitMaxInUsdc = SafeCast.toUint112(
+            _harvestProfitMaxInUsdc
+        );
         convexToken = IERC20(_convexToken);
 
         // want = Curve LP
@@ -235,7 +314,9 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         (address lptoken, , , address _rewardsContract, , ) = booster.poolInfo(
             _pid
         );
-        rewardsContract = IConvexRewards(_rewardsContract);
+        if (!hasArgs) {
+            storedRewardsContract = IConvexRewards(_rewardsContract);
+        }
         if (address(lptoken) != address(want)) {
             revert();
         }
@@ -258,9 +339,73 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
             );
     }
 
+    /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
+    function localKeepCRV() external view returns (uint256) {
+        return uint256(keepInfo.localKeepCRV);
+    }
+
+    /// @notice The percentage of CVX from each harvest that we send to our voter (out of 10,000).
+    function localKeepCVX() external view returns (uint256) {
+        return uint256(keepInfo.localKeepCVX);
+    }
+
+    /// @notice The address of our Curve voter. This is where we send any keepCRV.
+    function curveVoter() external view returns (address) {
+        return keepInfo.curveVoter;
+    }
+
+    /// @notice The address of our Convex voter. This is where we send any keepCVX.
+    function convexVoter() external view returns (address) {
+        return keepInfo.convexVoter;
+    }
+
+    /// @notice Whether we should claim rewards when withdrawing, generally this should be false.
+    function claimRewards() external view returns (bool) {
+        return harvestInfo.claimRewards;
+    }
+
+    /// @notice Minimum profit size in USDC that we want to harvest.
+    function harvestProfitMinInUsdc() external view returns (uint256) {
+        return uint256(harvestInfo.harvestProfitMinInUsdc);
+    }
+
+    /// @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
+    function harvestProfitMaxInUsdc() external view returns (uint256) {
+        return uint256(harvestInfo.harvestProfitMaxInUsdc);
+    }
+
+    /// @notice Check if we need to earmark rewards on Convex before harvesting, usually false.
+    function checkEarmark() external view returns (bool) {
+        return harvestInfo.checkEarmark;
+    }
+
+    /// @notice This is the deposit contract that all Convex pools use, aka booster.
+    function depositContract() public view returns (address) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return ClonesWithImmutableArgs.getArgAddress(0);
+        }
+        return storedDepositContract;
+    }
+
+    /// @notice This is unique to each pool and holds the rewards.
+    function rewardsContract() public view returns (IConvexRewards) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return IConvexRewards(ClonesWithImmutableArgs.getArgAddress(20));
+        }
+        return storedRewardsContract;
+    }
+
+    /// @notice This is a unique numerical identifier for each Convex pool.
+    function pid() public view returns (uint256) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return ClonesWithImmutableArgs.getArgUint256(40);
+        }
+        return storedPid;
+    }
+
     /// @notice Balance of want staked in Convex.
     function stakedBalance() public view returns (uint256) {
-        return rewardsContract.balanceOf(address(this));
+        return rewardsContract().balanceOf(address(this));
     }
 
     /// @notice Balance of want sitting in our strategy.
@@ -271,7 +416,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
 
     /// @notice Balance of CRV we can claim from the staking contract.
     function claimableBalance() public view returns (uint256) {
-        return rewardsContract.earned(address(this));
+        return rewardsContract().earned(address(this));
     }
 
     /// @notice Total assets the strategy holds, sum of loose and staked want.
@@ -290,11 +435,14 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
     {
         // this claims our CRV, CVX, and any extra tokens like SNX or ANKR. no harm leaving this true even if no extra rewards currently
         // rewards will be converted later with mev protection by yswaps (tradeFactory)
-        rewardsContract.getReward(address(this), true);
+        // read our rewards contract once, on args clones each read is an extcodesize and extcodecopy
+        IConvexRewards _rewardsContract = rewardsContract();
+        _rewardsContract.getReward(address(this), true);
 
         // by default this is zero, but if we want any for our voter this will be used
-        uint256 _localKeepCRV = localKeepCRV;
-        address _curveVoter = curveVoter;
+        KeepInfo storage _keepInfo = keepInfo;
+        uint256 _localKeepCRV = uint256(_keepInfo.localKeepCRV);
+        address _curveVoter = _keepInfo.curveVoter;
         uint256 _sendToVoter;
         if (_localKeepCRV > 0 && _curveVoter != address(0)) {
             uint256 crvBalance = crv.balanceOf(address(this));
@@ -307,20 +455,26 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         }
 
         // by default this is zero, but if we want any for our voter this will be used
-        uint256 _localKeepCVX = localKeepCVX;
-        address _convexVoter = convexVoter;
-        if (_localKeepCVX > 0 && _convexVoter != address(0)) {
-            uint256 cvxBalance = convexToken.balanceOf(address(this));
-            unchecked {
-                _sendToVoter = (cvxBalance * _localKeepCVX) / FEE_DENOMINATOR;
-            }
-            if (_sendToVoter > 0) {
-                convexToken.safeTransfer(_convexVoter, _sendToVoter);
+        // our convex voter is in its own slot, so we only read it if we have a keep
+        uint256 _localKeepCVX = uint256(_keepInfo.localKeepCVX);
+        if (_localKeepCVX > 0) {
+            address _convexVoter = _keepInfo.convexVoter;
+            if (_convexVoter != address(0)) {
+                uint256 cvxBalance = convexToken.balanceOf(address(this));
+                unchecked {
+                    _sendToVoter =
+                        (cvxBalance * _localKeepCVX) /
+                        FEE_DENOMINATOR;
+                }
+                if (_sendToVoter > 0) {
+                    convexToken.safeTransfer(_convexVoter, _sendToVoter);
+                }
             }
         }
 
         // serious loss should never happen, but if it does (for instance, if Curve is hacked), lets record it accurately
-        uint256 assets = estimatedTotalAssets();
+        uint256 assets = balanceOfWant() +
+            _rewardsContract.balanceOf(address(this));
         uint256 debt = vault.strategies(address(this)).totalDebt;
 
         // if assets are greater than debt, things are working great!
@@ -366,7 +520,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         // deposit into convex and stake immediately but only if we have something to invest
         // the final true argument means we deposit + stake at the same time
         if (_toInvest > 0) {
-            IConvexDeposit(depositContract).deposit(pid, _toInvest, true);
+            IConvexDeposit(depositContract()).deposit(pid(), _toInvest, true);
         }
     }
 
@@ -376,16 +530,17 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         // check our loose want
         uint256 _wantBal = balanceOfWant();
         if (_amountNeeded > _wantBal) {
-            uint256 _stakedBal = stakedBalance();
+            IConvexRewards _rewardsContract = rewardsContract();
+            uint256 _stakedBal = _rewardsContract.balanceOf(address(this));
             if (_stakedBal > 0) {
                 uint256 _neededFromStaked;
                 unchecked {
                     _neededFromStaked = _amountNeeded - _wantBal;
                 }
                 // withdraw whatever extra funds we need
-                rewardsContract.withdrawAndUnwrap(
+                _rewardsContract.withdrawAndUnwrap(
                     Math.min(_stakedBal, _neededFromStaked),
-                    claimRewards
+                    harvestInfo.claimRewards
                 );
             }
             uint256 _withdrawnBal = balanceOfWant();
@@ -401,20 +556,28 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
 
     // fire sale, get rid of it all!
     function liquidateAllPositions() internal override returns (uint256) {
-        uint256 _stakedBal = stakedBalance();
+        IConvexRewards _rewardsContract = rewardsContract();
+        uint256 _stakedBal = _rewardsContract.balanceOf(address(this));
         if (_stakedBal > 0) {
             // dont bother withdrawing zero, save gas where we can
-            rewardsContract.withdrawAndUnwrap(_stakedBal, claimRewards);
+            _rewardsContract.withdrawAndUnwrap(
+                _stakedBal,
+                harvestInfo.claimRewards
+            );
         }
         return balanceOfWant();
     }
 
     // migrate our want token to a new strategy if needed, claim rewards tokens as well unless its an emergency
     function prepareMigration(address _newStrategy) internal override {
-        uint256 stakedBal = stakedBalance();
+        IConvexRewards _rewardsContract = rewardsContract();
+        uint256 stakedBal = _rewardsContract.balanceOf(address(this));
 
         if (stakedBal > 0) {
-            rewardsContract.withdrawAndUnwrap(stakedBal, claimRewards);
+            _rewardsContract.withdrawAndUnwrap(
+                stakedBal,
+                harvestInfo.claimRewards
+            );
         }
 
         uint256 crvBal = crv.balanceOf(address(this));
@@ -442,27 +605,24 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
      *  from strategy after this.
      */
     function withdrawToConvexDepositTokens() external onlyVaultManagers {
-        uint256 _stakedBal = stakedBalance();
+        IConvexRewards _rewardsContract = rewardsContract();
+        uint256 _stakedBal = _rewardsContract.balanceOf(address(this));
         if (_stakedBal > 0) {
-            rewardsContract.withdraw(_stakedBal, claimRewards);
+            _rewardsContract.withdraw(_stakedBal, harvestInfo.claimRewards);
         }
     }
 
     /* ========== YSWAPS ========== */
 
     /**
-     * @notice Use to add or update rewards, rebuilds tradefactory too
+     * @notice Use to add or update rewards, updates tradefactory too
      * @dev Do this before updating trade factory if we have extra rewards. Can only be called by governance.
+     *  Only rewards tokens that were added or removed are approved or revoked on our trade factory.
      */
     function updateRewards() external onlyGovernance {
-        // store this to save our tradefactory address before tearing it down
-        address tf = tradeFactory;
-        _removeTradeFactoryPermissions(true);
-
-        // set things up again
+        address[] memory oldRewardsTokens = rewardsTokens;
         _updateRewards();
-        tradeFactory = tf;
-        _setUpTradeFactory();
+        _updateTradeFactoryRewards(oldRewardsTokens);
     }
 
     function _updateRewards() internal {
@@ -470,10 +630,11 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         delete rewardsTokens;
 
         // convex provides us info on any extra tokens we may receive
-        uint256 length = rewardsContract.extraRewardsLength();
+        IConvexRewards _rewardsContract = rewardsContract();
+        uint256 length = _rewardsContract.extraRewardsLength();
         address _convexToken = address(convexToken);
         for (uint256 i; i < length; ++i) {
-            address virtualRewardsPool = rewardsContract.extraRewards(i);
+            address virtualRewardsPool = _rewardsContract.extraRewards(i);
             address _rewardsToken = IConvexRewards(virtualRewardsPool)
                 .rewardToken();
 
@@ -487,6 +648,78 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         }
     }
 
+    // only approve and enable rewards tokens we've added, and revoke any we've removed. our base rewards
+    //  tokens are set up with our trade factory no matter what's in our list, so leave them alone.
+    function _updateTradeFactoryRewards(
+        address[] memory _oldRewardsTokens
+    ) internal {
+        address _tradeFactory = tradeFactory;
+        if (_tradeFactory == address(0)) {
+            return;
+        }
+        ITradeFactory tf = ITradeFactory(_tradeFactory);
+        address _want = address(want);
+        address[] memory _newRewardsTokens = rewardsTokens;
+
+        // revoke any tokens we no longer receive
+        for (uint256 i; i < _oldRewardsTokens.length; ++i) {
+            address _rewardsToken = _oldRewardsTokens[i];
+            if (
+                _isBaseRewardToken(_rewardsToken) ||
+                _contains(_newRewardsTokens, _rewardsToken)
+            ) {
+                continue;
+            }
+
+            // skip a token we cant approve, we never enabled it
+            if (!_callApproveRewardTokens(_rewardsToken, _tradeFactory, 0)) {
+                continue;
+            }
+            tf.disable(_rewardsToken, _want);
+        }
+
+        // and approve any that are new to us
+        for (uint256 i; i < _newRewardsTokens.length; ++i) {
+            address _rewardsToken = _newRewardsTokens[i];
+            if (
+                _isBaseRewardToken(_rewardsToken) ||
+                _contains(_oldRewardsTokens, _rewardsToken)
+            ) {
+                continue;
+            }
+
+            // skip a token we cant approve
+            if (
+                !_callApproveRewardTokens(
+                    _rewardsToken,
+                    _tradeFactory,
+                    type(uint256).max
+                )
+            ) {
+                continue;
+            }
+            tf.enable(_rewardsToken, _want);
+        }
+    }
+
+    // check if a token is one of our base rewards tokens (CRV and CVX)
+    function _isBaseRewardToken(address _token) internal view returns (bool) {
+        return _token == address(crv) || _token == address(convexToken);
+    }
+
+    // check if an array of addresses includes a given address
+    function _contains(
+        address[] memory _array,
+        address _value
+    ) internal pure returns (bool) {
+        for (uint256 i; i < _array.length; ++i) {
+            if (_array[i] == _value) {
+                return true;
+            }
+        }
+        return false;
+    }
+
     /**
      * @notice Use to update our trade factory.
      * @dev Can only be called by governance.
@@ -628,8 +861,11 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
             return false;
         }
 
+        // our whole config is in one slot, so read it all at once
+        HarvestInfo memory _harvestInfo = harvestInfo;
+
         // only check if we need to earmark on vaults we know are problematic
-        if (checkEarmark) {
+        if (_harvestInfo.checkEarmark) {
             // dont harvest if we need to earmark convex rewards
             if (needsEarmarkReward()) {
                 return false;
@@ -638,7 +874,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
 
         // harvest if we have a profit to claim at our upper limit without considering gas price
         uint256 claimableProfit = claimableProfitInUsdc();
-        if (claimableProfit > harvestProfitMaxInUsdc) {
+        if (claimableProfit > _harvestInfo.harvestProfitMaxInUsdc) {
             return true;
         }
 
@@ -653,7 +889,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         }
 
         // harvest if we have a sufficient profit to claim, but only if our gas price is acceptable
-        if (claimableProfit > harvestProfitMinInUsdc) {
+        if (claimableProfit > _harvestInfo.harvestProfitMinInUsdc) {
             return true;
         }
 
@@ -674,10 +910,31 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
 
     /**
      * @notice Calculates the profit if all claimable assets were sold for USDC (6 decimals).
-     * @dev Uses Chainlinks feed registry.
+     * @dev Uses our reward price snapshot if we have one, otherwise Chainlinks feed registry.
      * @return Total return in USDC from selling claimable CRV and CVX.
      */
     function claimableProfitInUsdc() public view returns (uint256) {
+        // our shared snapshot saves us the oracle calls and cliff math below
+        if (address(rewardPriceSnapshot) != address(0)) {
+            (
+                uint256 snapshotCrvPrice,
+                uint256 snapshotCvxPrice,
+                ,
+                uint256 cvxReduction,
+                uint256 cvxTillMax
+            ) = rewardPriceSnapshot.snapshot();
+            uint256 claimableCrv = claimableBalance();
+            uint256 claimableCvx = Math.min(
+                (claimableCrv * cvxReduction) / TOTAL_CLIFFS,
+                cvxTillMax
+            );
+            return
+                (snapshotCrvPrice *
+                    claimableCrv +
+                    snapshotCvxPrice *
+                    claimableCvx) / 1e20;
+        }
+
         (, uint256 crvPrice, , , ) = IOracle(
             0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf
         ).latestRoundData(
@@ -693,7 +950,6 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
             );
 
         // calculations pulled directly from CVXs contract for minting CVX per CRV claimed
-        uint256 totalCliffs = 1_000;
         uint256 maxSupply; // 100mil
         unchecked {
             maxSupply = 100 * 1_000_000 * 1e18;
@@ -712,14 +968,14 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         uint256 _claimableBal = claimableBalance();
 
         // mint if below total cliffs
-        if (cliff < totalCliffs) {
+        if (cliff < TOTAL_CLIFFS) {
             uint256 reduction; // for reduction% take inverse of current cliff
             unchecked {
-                reduction = totalCliffs - cliff;
+                reduction = TOTAL_CLIFFS - cliff;
             }
             // reduce
             unchecked {
-                mintableCvx = (_claimableBal * reduction) / totalCliffs;
+                mintableCvx = (_claimableBal * reduction) / TOTAL_CLIFFS;
             }
 
             uint256 amtTillMax; // supply cap check
@@ -752,7 +1008,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
      */
     function needsEarmarkReward() public view returns (bool needsEarmark) {
         // check if there is any CRV we need to earmark
-        uint256 crvExpiry = rewardsContract.periodFinish();
+        uint256 crvExpiry = rewardsContract().periodFinish();
         if (crvExpiry < block.timestamp) {
             return true;
         }
@@ -775,16 +1031,17 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
             revert();
         }
 
-        if (_keepCrv > 0 && curveVoter == address(0)) {
+        if (_keepCrv > 0 && keepInfo.curveVoter == address(0)) {
             revert();
         }
 
-        if (_keepCvx > 0 && convexVoter == address(0)) {
+        if (_keepCvx > 0 && keepInfo.convexVoter == address(0)) {
             revert();
         }
 
-        localKeepCRV = _keepCrv;
-        localKeepCVX = _keepCvx;
+        // we checked these above, so they fit
+        keepInfo.localKeepCRV = uint16(_keepCrv);
+        keepInfo.localKeepCVX = uint16(_keepCvx);
     }
 
     /**
@@ -797,8 +1054,8 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         address _curveVoter,
         address _convexVoter
     ) external onlyGovernance {
-        curveVoter = _curveVoter;
-        convexVoter = _convexVoter;
+        keepInfo.curveVoter = _curveVoter;
+        keepInfo.convexVoter = _convexVoter;
     }
 
     /**
@@ -807,7 +1064,7 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
      * @param _claimRewards Whether we want to claim rewards on withdrawals.
      */
     function setClaimRewards(bool _claimRewards) external onlyVaultManagers {
-        claimRewards = _claimRewards;
+        harvestInfo.claimRewards = _claimRewards;
     }
 
     /**
@@ -824,8 +1081,22 @@ contract StrategyConvexFactoryClonable is BaseStrategy {
         uint256 _harvestProfitMaxInUsdc,
         bool _checkEarmark
     ) external onlyVaultManagers {
-        harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
-        harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
-        checkEarmark = _checkEarmark;
+        harvestInfo = HarvestInfo({
+            harvestProfitMinInUsdc: SafeCast.toUint112(_harvestProfitMinInUsdc),
+            harvestProfitMaxInUsdc: SafeCast.toUint112(_harvestProfitMaxInUsdc),
+            checkEarmark: _checkEarmark,
+            claimRewards: harvestInfo.claimRewards
+        });
+    }
+
+    /**
+     * @notice Use this to set or remove our shared reward price snapshot.
+     * @dev Only used in harvestTrigger. Set to zero address to price rewards directly via Chainlink.
+     * @param _rewardPriceSnapshot Address of our reward price snapshot.
+     */
+    function setRewardPriceSnapshot(
+        address _rewardPriceSnapshot
+    ) external onlyVaultManagers {
+        rewardPriceSnapshot = IRewardPriceSnapshot(_rewardPriceSnapshot);
     }
 }
@@ -2,6 +2,7 @@
 pragma solidity 0.8.19;
 
 import {Math} from "@openzeppelin/contracts@4.9.3/utils/math/Math.sol";
+import {ClonesWithImmutableArgs} from "./libraries/ClonesWithImmutableArgs.sol";
 import "github.com/yearn/yearn-vaults/blob/v0.4.6/contracts/BaseStrategy.sol";
 import "./interfaces/ConvexFraxInterfaces.sol";
 
@@ -35,16 +36,24 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         bool addToExistingKeks;
     }
 
-    /* ========== STATE VARIABLES ========== */
+    struct LockedKek {
+        /// @notice Frax's unique identifier for this kek.
+        bytes32 kekId;
+        /// @notice Amount of want locked in this kek. Zero once withdrawn.
+        uint128 amount;
+        /// @notice Timestamp when this kek unlocks.
+        uint64 endingTimestamp;
+    }
 
-    /// @notice This is the Frax Booster.
-    address public fraxBooster;
+    /* ========== STATE VARIABLES ========== */
 
-    /// @notice This is the staking address specific to this Convex pool.
-    IConvexFrax public stakingAddress;
+    // our booster, staking address and frax pid. only written on our original and plain clones, see fraxBooster().
+    address internal storedFraxBooster;
+    IConvexFrax internal storedStakingAddress;
+    uint256 internal storedFraxPid;
 
-    /// @notice This is a unique numerical identifier for each Convex Frax pool.
-    uint256 public fraxPid;
+    // booster (20 bytes), staking address (20 bytes) and frax pid (32 bytes), packed at the end of our immutable-args clones
+    uint256 internal constant IMMUTABLE_ARGS_LENGTH = 72;
 
     /// @notice This is the vault our strategy uses to stake on Frax and use Convexs boost.
     IConvexFrax public userVault;
@@ -91,6 +100,12 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
      */
     uint256 public harvestProfitMaxInUsdc;
 
+    /**
+     * @notice Optional shared cache of our reward prices.
+     * @dev Only used in harvestTrigger. If zero address, we price rewards directly via Chainlink.
+     */
+    IRewardPriceSnapshot public rewardPriceSnapshot;
+
     // ySwaps stuff
     /// @notice The address of our ySwaps trade factory.
     address public tradeFactory;
@@ -117,6 +132,13 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     /// @notice Info about our keks. See struct NatSpec for more details.
     KekInfo public kekInfo;
 
+    /**
+     * @notice Our own record of each kek we've locked, by index. See struct NatSpec for more details.
+     * @dev Indices match our user vault's lockedStakesOf, but this way we only read our open keks instead of copying
+     *  every stake we've ever made into memory, so harvest and withdrawal gas doesn't grow over time.
+     */
+    mapping(uint256 => LockedKek) public keks;
+
     /// @notice Used to track the deployed version of this contract. Maps to releases in the CurveVaultFactory repo.
     string public constant strategyVersion = "3.0.2";
 
@@ -209,9 +231,62 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         emit Cloned(newStrategy);
     }
 
+    /**
+     * @notice Same as cloneStrategyConvexFrax, but our clone keeps its booster, staking address and frax pid in its code.
+     * @dev These never change, so this saves writing them on deployment and reading them from storage afterwards.
+     * @param _vault Vault address we are targeting with this strategy.
+     * @param _strategist Address to grant the strategist role.
+     * @param _rewards If we have any strategist rewards, send them here.
+     * @param _keeper Address to grant the keeper role.
+     * @param _tradeFactory Our trade factory address.
+     * @param _fraxPid Our frax pool id (pid) for this strategy.
+     * @param _stakingAddress Convex staking address for our want token.
+     * @param _harvestProfitMinInUsdc Minimum acceptable profit for a harvest.
+     * @param _harvestProfitMaxInUsdc Maximum acceptable profit for a harvest.
+     * @param _booster Address of the convex frax booster/deposit contract.
+     * @return newStrategy Address of our new cloned strategy.
+     */
+    function cloneStrategyConvexFraxWithArgs(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _tradeFactory,
+        uint256 _fraxPid,
+        address _stakingAddress,
+        uint256 _harvestProfitMinInUsdc,
+        uint256 _harvestProfitMaxInUsdc,
+        address _booster
+    ) external returns (address newStrategy) {
+        // dont clone a clone
+        if (!isOriginal) {
+            revert("Cant clone a clone");
+        }
+
+        newStrategy = ClonesWithImmutableArgs.clone(
+            address(this),
+            abi.encodePacked(_booster, _stakingAddress, _fraxPid)
+        );
+
+        StrategyConvexFraxFactoryClonable(newStrategy).initialize(
+            _vault,
+            _strategist,
+            _rewards,
+            _keeper,
+            _tradeFactory,
+            _fraxPid,
+            _stakingAddress,
+            _harvestProfitMinInUsdc,
+            _harvestProfitMaxInUsdc,
+            _booster
+        );
+
+        emit Cloned(newStrategy);
+    }
+
     /**
      * @notice Initialize the strategy.
-     * @dev This should only be called by the clone function above.
+     * @dev This should only be called by the clone functions above, or by our factory right after it deploys a clone.
      * @param _vault Vault address we are targeting with this strategy.
      * @param _strategist Address to grant the strategist role.
      * @param _rewards If we have any strategist rewards, send them here.
@@ -255,18 +330,20 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         uint256 _harvestProfitMaxInUsdc,
         address _booster
     ) internal {
-        // make sure that we havent initialized this before
-        if (fraxBooster != address(0)) {
-            revert("Already initialized");
+        // make sure that we havent initialized this before. our immutable-args clones rely on baseStrategy's check.
+        if (!ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            if (storedFraxBooster != address(0)) {
+                revert("Already initialized");
+            }
+            storedFraxPid = _fraxPid;
+            storedStakingAddress = IConvexFrax(_stakingAddress);
+            storedFraxBooster = _booster;
         }
 
         // 1:1 assignments
         tradeFactory = _tradeFactory;
-        fraxPid = _fraxPid;
-        stakingAddress = IConvexFrax(_stakingAddress);
         harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
         harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
-        fraxBooster = _booster;
 
         // have our strategy deploy our vault from the booster using the fraxPid
         userVault = IConvexFrax(IConvexFrax(_booster).createVault(_fraxPid));
@@ -285,7 +362,7 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
 
         // setup our default frax LP management vars
         kekInfo.maxKeks = 5;
-        lockTime = stakingAddress.lock_time_min(); // default to current minimum
+        lockTime = IConvexFrax(_stakingAddress).lock_time_min(); // default to current minimum
         depositInfo.maxSingleDeposit = 500_000e18;
         depositInfo.minDeposit = 100e18;
         depositInfo.addToExistingKeks = true; // this allows us to not worry about locking
@@ -316,12 +393,45 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
             );
     }
 
+    /**
+     * @notice This is the Frax Booster.
+     * @return Address of our Convex Frax booster.
+     */
+    function fraxBooster() public view returns (address) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return ClonesWithImmutableArgs.getArgAddress(0);
+        }
+        return storedFraxBooster;
+    }
+
+    /**
+     * @notice This is the staking address specific to this Convex pool.
+     * @return Our Frax staking contract.
+     */
+    function stakingAddress() public view returns (IConvexFrax) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return IConvexFrax(ClonesWithImmutableArgs.getArgAddress(20));
+        }
+        return storedStakingAddress;
+    }
+
+    /**
+     * @notice This is a unique numerical identifier for each Convex Frax pool.
+     * @return Our Convex Frax pool id.
+     */
+    function fraxPid() public view returns (uint256) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return ClonesWithImmutableArgs.getArgUint256(40);
+        }
+        return storedFraxPid;
+    }
+
     /**
      * @notice Balance of want staked in Convex Frax.
      * @return balanceStaked Balance of want staked in Convex Frax.
      */
     function stakedBalance() public view returns (uint256 balanceStaked) {
-        balanceStaked = stakingAddress.lockedLiquidityOf(address(userVault));
+        balanceStaked = stakingAddress().lockedLiquidityOf(address(userVault));
     }
 
     /**
@@ -358,12 +468,13 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         returns (address[] memory tokenAddresses, uint256[] memory tokenAmounts)
     {
         // on older pools, we can read directly from our user vault returns FXS, CRV, CVX addresses with amounts
-        if (fraxPid < 44) {
+        if (fraxPid() < 44) {
             (tokenAddresses, tokenAmounts) = userVault.earned();
         } else {
             // on newer pools we just read from the staking address
-            tokenAmounts = stakingAddress.earned(address(userVault));
-            tokenAddresses = stakingAddress.getAllRewardTokens();
+            IConvexFrax _stakingAddress = stakingAddress();
+            tokenAmounts = _stakingAddress.earned(address(userVault));
+            tokenAddresses = _stakingAddress.getAllRewardTokens();
         }
     }
 
@@ -475,46 +586,42 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
 
         // If we have already locked the max amount of keks, first check if we want to just add to existing keks or not
         if (_nextKek >= _maxKeks) {
-            // pull our current stake data
-            IConvexFrax.LockedStake[] memory stake = stakingAddress
-                .lockedStakesOf(address(userVault));
-
             // only add to existing if weve maxxed out our number of keks
             if (depositInfo.addToExistingKeks) {
                 // figure out which is our lowest TVL kek, start with our latest one
-                IConvexFrax.LockedStake memory latestStake = stake[
-                    _nextKek - 1
-                ];
-                bytes32 smallestKek = latestStake.kek_id;
-                uint256 smallestKekSize = latestStake.amount;
+                uint256 smallestIndex = _nextKek - 1;
+                uint256 smallestKekSize = keks[smallestIndex].amount;
 
                 // if only 1 kek, no need to check which is the smallest
                 if (_maxKeks != 1) {
+                    uint256 kekSize;
                     for (uint256 i = 2; i <= _maxKeks; ++i) {
-                        latestStake = stake[_nextKek - i];
+                        kekSize = keks[_nextKek - i].amount;
                         // if a kek is smaller in size than our previous smallest, it
                         //   is now smallest
-                        if (latestStake.amount < smallestKekSize) {
-                            smallestKekSize = latestStake.amount;
-                            smallestKek = latestStake.kek_id;
+                        if (kekSize < smallestKekSize) {
+                            smallestKekSize = kekSize;
+                            smallestIndex = _nextKek - i;
                         }
                     }
                 }
                 // deposit our assets to our smallest kek
-                userVault.lockAdditionalCurveLp(smallestKek, _toInvest);
+                LockedKek storage smallestKek = keks[smallestIndex];
+                userVault.lockAdditionalCurveLp(smallestKek.kekId, _toInvest);
+                smallestKek.amount = uint128(smallestKekSize + _toInvest);
             } else {
                 // if not, we need to withdraw the oldest one and reinvest that alongside the new funds
 
                 // Get the oldest kek that could have funds in it
-                IConvexFrax.LockedStake memory firstStake = stake[
-                    _nextKek - _maxKeks
-                ];
+                LockedKek storage firstKek = keks[_nextKek - _maxKeks];
+                uint256 firstKekSize = firstKek.amount;
                 // Make sure it hasnt already been withdrawn
-                if (firstStake.amount > 0) {
+                if (firstKekSize > 0) {
                     // Withdraw funds and add them to the amount to deposit
-                    userVault.withdrawLockedAndUnwrap(firstStake.kek_id);
+                    userVault.withdrawLockedAndUnwrap(firstKek.kekId);
+                    firstKek.amount = 0;
                     unchecked {
-                        _toInvest += firstStake.amount;
+                        _toInvest += firstKekSize;
                     }
 
                     // dont want a single kek too large vs others
@@ -523,17 +630,27 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
                     }
                 }
                 // deposit, increment our next kek
-                userVault.stakeLockedCurveLp(_toInvest, lockTime);
-                kekInfo.nextKek++;
+                _lockNewKek(_toInvest, _nextKek);
             }
         } else {
             // deposit, increment our next kek
-            userVault.stakeLockedCurveLp(_toInvest, lockTime);
-            kekInfo.nextKek++;
+            _lockNewKek(_toInvest, _nextKek);
         }
         lastDeposit = block.timestamp;
     }
 
+    // lock want in a new kek at our next index, and keep our own record of it
+    function _lockNewKek(uint256 _amount, uint256 _index) internal {
+        uint256 _lockTime = lockTime;
+        bytes32 kekId = userVault.stakeLockedCurveLp(_amount, _lockTime);
+        keks[_index] = LockedKek(
+            kekId,
+            uint128(_amount),
+            uint64(block.timestamp + _lockTime)
+        );
+        kekInfo.nextKek = uint128(_index + 1);
+    }
+
     function liquidatePosition(
         uint256 _amountNeeded
     ) internal override returns (uint256 _liquidatedAmount, uint256 _loss) {
@@ -546,16 +663,20 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
                 unchecked {
                     _neededFromStaked = _amountNeeded - _wantBal;
                 }
+                // pick which of our unlocked keks to pull from
+                (uint256[] memory plan, uint256 planned) = _planWithdrawal(
+                    _neededFromStaked
+                );
+
                 // Need to check that there is enough liquidity to withdraw so we dont report loss thats not true
                 if (lastDeposit + lockTime > block.timestamp) {
                     require(
-                        stakedBalance() - stillLockedStake() >=
-                            _neededFromStaked,
+                        planned >= _neededFromStaked,
                         "Need to wait until oldest deposit unlocks"
                     );
                 }
                 // no need to check for >0, we know _neededFromStaked has to be at least 1 wei
-                withdrawSome(_neededFromStaked);
+                _withdrawKeks(plan);
             }
             uint256 _withdrawnBal = balanceOfWant();
             _liquidatedAmount = Math.min(_amountNeeded, _withdrawnBal);
@@ -570,38 +691,91 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
 
     // this function manages withdrawing from multiple keks at once
     function withdrawSome(uint256 _amount) internal {
-        IConvexFrax.LockedStake[] memory stakes = stakingAddress.lockedStakesOf(
-            address(userVault)
-        );
-
-        // pull down our kek info
-        uint256 _nextKek = uint256(kekInfo.nextKek);
-        uint256 _maxKeks = uint256(kekInfo.maxKeks);
-
-        uint256 i = _nextKek > _maxKeks ? _nextKek - _maxKeks : 0;
-        uint256 needed = Math.min(_amount, stakedBalance());
-        IConvexFrax.LockedStake memory stake;
-        uint256 liquidity;
-        while (needed > 0 && i < _nextKek) {
-            stake = stakes[i];
-            liquidity = stake.amount;
+        (uint256[] memory plan, ) = _planWithdrawal(_amount);
+        _withdrawKeks(plan);
+    }
 
-            if (liquidity > 0 && stake.ending_timestamp <= block.timestamp) {
-                userVault.withdrawLockedAndUnwrap(stake.kek_id);
+    /**
+     * @dev Keks can only be withdrawn whole, so we pick as few unlocked keks as we can to cover _amount: at each step,
+     *  the smallest kek that covers what's left, or if none can, our largest. Ties go to our oldest kek. Anything we
+     *  withdraw beyond _amount stays loose in the strategy until adjustPosition re-locks it.
+     */
+    function _planWithdrawal(
+        uint256 _amount
+    ) internal view returns (uint256[] memory plan, uint256 planned) {
+        // gather up our unlocked keks
+        uint256[] memory indices;
+        uint256[] memory sizes;
+        uint256 count;
+        {
+            // pull down our kek info
+            uint256 _nextKek = uint256(kekInfo.nextKek);
+            uint256 _maxKeks = uint256(kekInfo.maxKeks);
+            uint256 i = _nextKek > _maxKeks ? _nextKek - _maxKeks : 0;
+
+            indices = new uint256[](_nextKek - i);
+            sizes = new uint256[](_nextKek - i);
+            LockedKek storage kek;
+            for (i; i < _nextKek; ++i) {
+                kek = keks[i];
+                if (kek.amount > 0 && kek.endingTimestamp <= block.timestamp) {
+                    indices[count] = i;
+                    sizes[count] = kek.amount;
+                    ++count;
+                }
+            }
+        }
 
-                if (liquidity < needed) {
-                    unchecked {
-                        needed -= liquidity;
-                        i++;
-                    }
-                } else {
-                    break;
+        // we zero out sizes as we pick keks, so we don't pick one twice
+        uint256[] memory picked = new uint256[](count);
+        uint256 pickedCount;
+        uint256 remaining;
+        uint256 bestFit;
+        uint256 largest;
+        while (planned < _amount && pickedCount < count) {
+            remaining = _amount - planned;
+            bestFit = type(uint256).max;
+            largest = type(uint256).max;
+            for (uint256 j; j < count; ++j) {
+                uint256 size = sizes[j];
+                if (size == 0) {
+                    continue;
                 }
-            } else {
-                unchecked {
-                    i++;
+                if (
+                    size >= remaining &&
+                    (bestFit == type(uint256).max || size < sizes[bestFit])
+                ) {
+                    bestFit = j;
                 }
+                if (largest == type(uint256).max || size > sizes[largest]) {
+                    largest = j;
+                }
+            }
+
+            // if one kek covers the rest, we're done
+            if (bestFit != type(uint256).max) {
+                largest = bestFit;
             }
+            picked[pickedCount] = indices[largest];
+            planned += sizes[largest];
+            sizes[largest] = 0;
+            ++pickedCount;
+        }
+
+        // trim our plan down to the keks we picked
+        plan = new uint256[](pickedCount);
+        for (uint256 j; j < pickedCount; ++j) {
+            plan[j] = picked[j];
+        }
+    }
+
+    // withdraw each kek in our plan, and zero out our records of them
+    function _withdrawKeks(uint256[] memory _plan) internal {
+        LockedKek storage kek;
+        for (uint256 i; i < _plan.length; ++i) {
+            kek = keks[_plan[i]];
+            userVault.withdrawLockedAndUnwrap(kek.kekId);
+            kek.amount = 0;
         }
     }
 
@@ -661,16 +835,14 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
     /* ========== YSWAPS ========== */
 
     /**
-     * @notice Use to add or update rewards, rebuilds tradefactory too
+     * @notice Use to add or update rewards, updates tradefactory too
      * @dev Do this before updating trade factory if we have extra rewards. Can only be called by governance.
+     *  Only rewards tokens that were added or removed are approved or revoked on our trade factory.
      */
     function updateRewards() external onlyGovernance {
-        address tf = tradeFactory;
-        _removeTradeFactoryPermissions(true);
+        address[] memory oldRewardsTokens = rewardsTokens;
         _updateRewards();
-
-        tradeFactory = tf;
-        _setUpTradeFactory();
+        _updateTradeFactoryRewards(oldRewardsTokens);
     }
 
     function _updateRewards() internal {
@@ -691,6 +863,67 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         }
     }
 
+    // only approve and enable rewards tokens we've added, and revoke any we've removed. our base rewards
+    //  tokens are set up with our trade factory no matter what's in our list, so leave them alone.
+    function _updateTradeFactoryRewards(
+        address[] memory _oldRewardsTokens
+    ) internal {
+        address _tradeFactory = tradeFactory;
+        if (_tradeFactory == address(0)) {
+            return;
+        }
+        ITradeFactory tf = ITradeFactory(_tradeFactory);
+        address _want = address(want);
+        address[] memory _newRewardsTokens = rewardsTokens;
+
+        // revoke any tokens we no longer receive
+        for (uint256 i; i < _oldRewardsTokens.length; ++i) {
+            address _rewardsToken = _oldRewardsTokens[i];
+            if (
+                _isBaseRewardToken(_rewardsToken) ||
+                _contains(_newRewardsTokens, _rewardsToken)
+            ) {
+                continue;
+            }
+            IERC20(_rewardsToken).approve(_tradeFactory, 0);
+            tf.disable(_rewardsToken, _want);
+        }
+
+        // and approve any that are new to us
+        for (uint256 i; i < _newRewardsTokens.length; ++i) {
+            address _rewardsToken = _newRewardsTokens[i];
+            if (
+                _isBaseRewardToken(_rewardsToken) ||
+                _contains(_oldRewardsTokens, _rewardsToken)
+            ) {
+                continue;
+            }
+            IERC20(_rewardsToken).approve(_tradeFactory, type(uint256).max);
+            tf.enable(_rewardsToken, _want);
+        }
+    }
+
+    // check if a token is one of our base rewards tokens (CRV, CVX and FXS)
+    function _isBaseRewardToken(address _token) internal view returns (bool) {
+        return
+            _token == address(crv) ||
+            _token == address(convexToken) ||
+            _token == address(fxs);
+    }
+
+    // check if an array of addresses includes a given address
+    function _contains(
+        address[] memory _array,
+        address _value
+    ) internal pure returns (bool) {
+        for (uint256 i; i < _array.length; ++i) {
+            if (_array[i] == _value) {
+                return true;
+            }
+        }
+        return false;
+    }
+
     /**
      * @notice Use to update our trade factory.
      * @dev Can only be called by governance.
@@ -846,6 +1079,7 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
 
     /**
      * @notice Calculates the profit if all claimable assets were sold for USDC (6 decimals).
+     * @dev Uses our reward price snapshot if we have one, otherwise Chainlinks feed registry.
      * @return Total return in USDC from selling claimable CRV, CVX, and FXS.
      */
     function claimableProfitInUsdc() public view returns (uint256) {
@@ -857,7 +1091,24 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         uint256 tokensLength = _tokenAddresses.length;
 
         // occasionally we may have more than just FXS/CRV/CVX. however, FXS is always index 0,
-        //  and CRV and CVX are always the last two
+        //  and CRV and CVX are always the last two. our shared snapshot saves us the oracle calls below.
+        if (address(rewardPriceSnapshot) != address(0)) {
+            (
+                uint256 crvPrice,
+                uint256 cvxPrice,
+                uint256 fxsPrice,
+                ,
+
+            ) = rewardPriceSnapshot.snapshot();
+            return
+                (fxsPrice *
+                    _tokenAmounts[0] +
+                    crvPrice *
+                    _tokenAmounts[tokensLength - 2] +
+                    cvxPrice *
+                    _tokenAmounts[tokensLength - 1]) / 1e20;
+        }
+
         (, uint256 indexZeroPrice, , , ) = IOracle(
             0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf
         ).latestRoundData(
@@ -905,38 +1156,117 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
      * @return stillLocked The total amount of want that cannot yet be withdrawn from the staking contract.
      */
     function stillLockedStake() public view returns (uint256 stillLocked) {
-        IConvexFrax.LockedStake[] memory stakes = stakingAddress.lockedStakesOf(
-            address(userVault)
-        );
-
         // pull down our kek info
         uint256 _nextKek = uint256(kekInfo.nextKek);
         uint256 _maxKeks = uint256(kekInfo.maxKeks);
 
-        IConvexFrax.LockedStake memory stake;
+        LockedKek storage kek;
         uint256 time = block.timestamp;
         uint256 i = _nextKek > _maxKeks ? _nextKek - _maxKeks : 0;
 
         for (i; i < _nextKek; ++i) {
-            stake = stakes[i];
+            kek = keks[i];
 
-            if (stake.ending_timestamp > time) {
+            if (kek.endingTimestamp > time) {
                 unchecked {
-                    stillLocked += stake.amount;
+                    stillLocked += kek.amount;
                 }
             }
         }
     }
 
+    /**
+     * @notice See when our want unlocks, to help plan debt ratio changes without reverts.
+     * @dev Sorted by unlock time. Our first bucket is always now, and includes loose want and any keks that have
+     *  already unlocked. Keks outside our maxKeks window aren't included.
+     * @return unlockTimes Timestamp of each bucket.
+     * @return cumulativeLiquid Total want we can free up by each timestamp.
+     */
+    function unlockSchedule()
+        external
+        view
+        returns (
+            uint256[] memory unlockTimes,
+            uint256[] memory cumulativeLiquid
+        )
+    {
+        // pull down our kek info
+        uint256 _nextKek = uint256(kekInfo.nextKek);
+        uint256 _maxKeks = uint256(kekInfo.maxKeks);
+        uint256 i = _nextKek > _maxKeks ? _nextKek - _maxKeks : 0;
+
+        // collect the amount unlocking at each time, keeping our buckets sorted as we go
+        uint256[] memory times = new uint256[](_nextKek - i + 1);
+        uint256[] memory amounts = new uint256[](_nextKek - i + 1);
+        times[0] = block.timestamp;
+        amounts[0] = balanceOfWant();
+        uint256 buckets = 1;
+        LockedKek storage kek;
+        for (i; i < _nextKek; ++i) {
+            kek = keks[i];
+            uint256 amount = kek.amount;
+            uint256 ending = kek.endingTimestamp;
+            if (amount == 0) {
+                continue;
+            }
+            if (ending <= block.timestamp) {
+                amounts[0] += amount;
+                continue;
+            }
+
+            // find where this kek goes, shifting later buckets back if it needs a new one
+            uint256 j = 1;
+            while (j < buckets && times[j] < ending) {
+                ++j;
+            }
+            if (j < buckets && times[j] == ending) {
+                amounts[j] += amount;
+            } else {
+                for (uint256 k = buckets; k > j; --k) {
+                    times[k] = times[k - 1];
+                    amounts[k] = amounts[k - 1];
+                }
+                times[j] = ending;
+                amounts[j] = amount;
+                ++buckets;
+            }
+        }
+
+        // trim down to the buckets we used, and add them up
+        unlockTimes = new uint256[](buckets);
+        cumulativeLiquid = new uint256[](buckets);
+        uint256 total;
+        for (i = 0; i < buckets; ++i) {
+            total += amounts[i];
+            unlockTimes[i] = times[i];
+            cumulativeLiquid[i] = total;
+        }
+    }
+
+    /**
+     * @notice Preview which keks we would withdraw to free up a given amount of staked want.
+     * @dev Keks are withdrawn whole, so amount may be more than _amount. If it's less, we don't have enough unlocked.
+     * @param _amount Amount of staked want to free up.
+     * @return kekIndices Indices of the keks we would withdraw, in the order we would pick them.
+     * @return amount Total want in those keks.
+     */
+    function previewWithdrawal(
+        uint256 _amount
+    ) external view returns (uint256[] memory kekIndices, uint256 amount) {
+        return _planWithdrawal(_amount);
+    }
+
     /**
      * @notice This function allows manual withdrawal of a specific kek.
      * @dev Available if the counter or loops fail.
      * @param _index Index of the kek to withdraw.
      */
     function manualWithdraw(uint256 _index) external onlyVaultManagers {
+        // read from the staking contract here in case our own records are what failed
         userVault.withdrawLockedAndUnwrap(
-            stakingAddress.lockedStakesOf(address(userVault))[_index].kek_id
+            stakingAddress().lockedStakesOf(address(userVault))[_index].kek_id
         );
+        keks[_index].amount = 0;
     }
 
     /* ========== SETTERS ========== */
@@ -963,23 +1293,22 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
                 uint256 toWithdraw = _nextKek > _maxKeks
                     ? _maxKeks - _newMaxKeks
                     : _nextKek - _newMaxKeks;
-                IConvexFrax.LockedStake[] memory stakes = stakingAddress
-                    .lockedStakesOf(address(userVault));
-                IConvexFrax.LockedStake memory stake;
+                LockedKek storage kek;
 
                 for (uint256 i; i < toWithdraw; ++i) {
                     // withdraw our oldest keks to lower the number staked.
-                    stake = _maxKeks > _nextKek
-                        ? stakes[i]
-                        : stakes[_nextKek - _maxKeks + i];
+                    kek = keks[
+                        _maxKeks > _nextKek ? i : _nextKek - _maxKeks + i
+                    ];
 
                     // Need to make sure the kek can be withdrawn and is > 0
-                    if (stake.amount > 0) {
+                    if (kek.amount > 0) {
                         require(
-                            stake.ending_timestamp < block.timestamp,
+                            kek.endingTimestamp < block.timestamp,
                             "Not liquid"
                         );
-                        userVault.withdrawLockedAndUnwrap(stake.kek_id);
+                        userVault.withdrawLockedAndUnwrap(kek.kekId);
+                        kek.amount = 0;
                     }
                 }
             }
@@ -1016,9 +1345,10 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
      * @param _lockTime Time to lock our LP (in seconds). By default bound to 1 week < t < 1 year.
      */
     function setLockTime(uint256 _lockTime) external onlyVaultManagers {
+        IConvexFrax _stakingAddress = stakingAddress();
         require(
-            stakingAddress.lock_time_min() <= _lockTime &&
-                _lockTime <= stakingAddress.lock_time_for_max_multiplier(),
+            _stakingAddress.lock_time_min() <= _lockTime &&
+                _lockTime <= _stakingAddress.lock_time_for_max_multiplier(),
             "Disallowed by staking address"
         );
         lockTime = _lockTime;
@@ -1090,4 +1420,15 @@ contract StrategyConvexFraxFactoryClonable is BaseStrategy {
         harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
         harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
     }
+
+    /**
+     * @notice Use this to set or remove our shared reward price snapshot.
+     * @dev Only used in harvestTrigger. Set to zero address to price rewards directly via Chainlink.
+     * @param _rewardPriceSnapshot Address of our reward price snapshot.
+     */
+    function setRewardPriceSnapshot(
+        address _rewardPriceSnapshot
+    ) external onlyVaultManagers {
+        rewardPriceSnapshot = IRewardPriceSnapshot(_rewardPriceSnapshot);
+    }
 }
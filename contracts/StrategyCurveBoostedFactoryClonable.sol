@@ -2,25 +2,34 @@
 pragma solidity 0.8.19;
 
 import {Math} from "@openzeppelin/contracts@4.9.3/utils/math/Math.sol";
+import {ClonesWithImmutableArgs} from "./libraries/ClonesWithImmutableArgs.sol";
 import "github.com/yearn/yearn-vaults/blob/v0.4.6/contracts/BaseStrategy.sol";
 import "./interfaces/CurveInterfaces.sol";
 
 contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
     using SafeERC20 for IERC20;
 
-    /* ========== STATE VARIABLES ========== */
+    struct KeepInfo {
+        /// @notice The address of our Curve voter. This is where we send any keepCRV.
+        address curveVoter;
+        /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
+        uint16 localKeepCRV;
+    }
 
-    /// @notice Yearns strategyProxy, needed for interacting with our Curve Voter.
-    ICurveStrategyProxy public proxy;
+    /* ========== STATE VARIABLES ========== */
 
-    /// @notice Curve gauge contract, most are tokenized, held by Yearns voter.
-    address public gauge;
+    // our strategy proxy and gauge. only written on our original and plain clones, see proxy().
+    ICurveStrategyProxy internal storedProxy;
+    address internal storedGauge;
 
-    /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
-    uint256 public localKeepCRV;
+    // proxy (20 bytes) and gauge (20 bytes), packed at the end of our immutable-args clones
+    uint256 internal constant IMMUTABLE_ARGS_LENGTH = 40;
 
-    /// @notice The address of our Curve voter. This is where we send any keepCRV.
-    address public curveVoter;
+    /**
+     * @notice Our keep amount and voter. See struct NatSpec for more details.
+     * @dev Packed into one slot, so harvests only need a single read for both.
+     */
+    KeepInfo public keepInfo;
 
     // this means all of our fee values are in basis points
     uint256 internal constant FEE_DENOMINATOR = 10000;
@@ -113,9 +122,53 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         emit Cloned(newStrategy);
     }
 
+    /**
+     * @notice Same as cloneStrategyCurveBoosted, but our clone keeps its proxy and gauge in its code.
+     * @dev These never change, so this saves writing them on deployment and reading them from storage afterwards.
+     * @param _vault Vault address we are targeting with this strategy.
+     * @param _strategist Address to grant the strategist role.
+     * @param _rewards If we have any strategist rewards, send them here.
+     * @param _keeper Address to grant the keeper role.
+     * @param _tradeFactory Our trade factory address.
+     * @param _proxy Our strategy proxy address.
+     * @param _gauge Gauge address for this strategy.
+     * @return newStrategy Address of our new cloned strategy.
+     */
+    function cloneStrategyCurveBoostedWithArgs(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _tradeFactory,
+        address _proxy,
+        address _gauge
+    ) external returns (address newStrategy) {
+        // dont clone a clone
+        if (!isOriginal) {
+            revert("Cant clone a clone");
+        }
+
+        newStrategy = ClonesWithImmutableArgs.clone(
+            address(this),
+            abi.encodePacked(_proxy, _gauge)
+        );
+
+        StrategyCurveBoostedFactoryClonable(newStrategy).initialize(
+            _vault,
+            _strategist,
+            _rewards,
+            _keeper,
+            _tradeFactory,
+            _proxy,
+            _gauge
+        );
+
+        emit Cloned(newStrategy);
+    }
+
     /**
      * @notice Initialize the strategy.
-     * @dev This should only be called by the clone function above.
+     * @dev This should only be called by the clone functions above, or by our factory right after it deploys a clone.
      * @param _vault Vault address we are targeting with this strategy.
      * @param _strategist Address to grant the strategist role.
      * @param _rewards If we have any strategist rewards, send them here.
@@ -143,15 +196,17 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         address _proxy,
         address _gauge
     ) internal {
-        // make sure that we havent initialized this before
-        if (gauge != address(0)) {
-            revert("Already initialized");
+        // make sure that we havent initialized this before. our immutable-args clones rely on baseStrategy's check.
+        if (!ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            if (storedGauge != address(0)) {
+                revert("Already initialized");
+            }
+            storedProxy = ICurveStrategyProxy(_proxy); // our factory checks the latest proxy from curve voter and passes it here
+            storedGauge = _gauge;
         }
 
         // 1:1 assignments
         tradeFactory = _tradeFactory;
-        proxy = ICurveStrategyProxy(_proxy); // our factory checks the latest proxy from curve voter and passes it here
-        gauge = _gauge;
 
         // want = Curve LP
         want.approve(_proxy, type(uint256).max);
@@ -178,9 +233,36 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
             );
     }
 
+    /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
+    function localKeepCRV() external view returns (uint256) {
+        return uint256(keepInfo.localKeepCRV);
+    }
+
+    /// @notice The address of our Curve voter. This is where we send any keepCRV.
+    function curveVoter() external view returns (address) {
+        return keepInfo.curveVoter;
+    }
+
+    /// @notice Yearns strategyProxy, needed for interacting with our Curve Voter.
+    function proxy() public view returns (ICurveStrategyProxy) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return
+                ICurveStrategyProxy(ClonesWithImmutableArgs.getArgAddress(0));
+        }
+        return storedProxy;
+    }
+
+    /// @notice Curve gauge contract, most are tokenized, held by Yearns voter.
+    function gauge() public view returns (address) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return ClonesWithImmutableArgs.getArgAddress(20);
+        }
+        return storedGauge;
+    }
+
     /// @notice Balance of want staked in Curves gauge.
     function stakedBalance() public view returns (uint256) {
-        return proxy.balanceOf(gauge);
+        return proxy().balanceOf(gauge());
     }
 
     /// @notice Balance of want sitting in our strategy.
@@ -204,13 +286,17 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
     {
         // rewards will be converted later with mev protection by yswaps (tradeFactory)
         // if we have anything in the gauge, then harvest CRV from the gauge
-        uint256 _stakedBal = stakedBalance();
+        // read our proxy and gauge once, on args clones each read is an extcodesize and extcodecopy
+        ICurveStrategyProxy _proxy = proxy();
+        address _gauge = gauge();
+        uint256 _stakedBal = _proxy.balanceOf(_gauge);
         if (_stakedBal > 0) {
-            proxy.harvest(gauge);
+            _proxy.harvest(_gauge);
 
             // by default this is zero, but if we want any for our voter this will be used
-            uint256 _localKeepCRV = localKeepCRV;
-            address _curveVoter = curveVoter;
+            KeepInfo memory _keepInfo = keepInfo;
+            uint256 _localKeepCRV = uint256(_keepInfo.localKeepCRV);
+            address _curveVoter = _keepInfo.curveVoter;
             if (_localKeepCRV > 0 && _curveVoter != address(0)) {
                 uint256 crvBalance = crv.balanceOf(address(this));
                 uint256 _sendToVoter;
@@ -227,11 +313,11 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
 
         // claim any extra rewards we may have
         if (rewardsTokens.length > 0) {
-            proxy.claimManyRewards(gauge, rewardsTokens);
+            _proxy.claimManyRewards(_gauge, rewardsTokens);
         }
 
         // serious loss should never happen, but if it does (for instance, if Curve is hacked), lets record it accurately
-        uint256 assets = estimatedTotalAssets();
+        uint256 assets = balanceOfWant() + _proxy.balanceOf(_gauge);
         uint256 debt = vault.strategies(address(this)).totalDebt;
 
         // if assets are greater than debt, things are working great!
@@ -274,8 +360,9 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         // Send all of our LP tokens to the proxy and deposit to the gauge
         uint256 _toInvest = balanceOfWant();
         if (_toInvest > 0) {
-            want.safeTransfer(address(proxy), _toInvest);
-            proxy.deposit(gauge, address(want));
+            ICurveStrategyProxy _proxy = proxy();
+            want.safeTransfer(address(_proxy), _toInvest);
+            _proxy.deposit(gauge(), address(want));
         }
     }
 
@@ -285,15 +372,17 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         // check our loose want
         uint256 _wantBal = balanceOfWant();
         if (_amountNeeded > _wantBal) {
-            uint256 _stakedBal = stakedBalance();
+            ICurveStrategyProxy _proxy = proxy();
+            address _gauge = gauge();
+            uint256 _stakedBal = _proxy.balanceOf(_gauge);
             if (_stakedBal > 0) {
                 uint256 _neededFromStaked;
                 unchecked {
                     _neededFromStaked = _amountNeeded - _wantBal;
                 }
                 // withdraw whatever extra funds we need
-                proxy.withdraw(
-                    gauge,
+                _proxy.withdraw(
+                    _gauge,
                     address(want),
                     Math.min(_stakedBal, _neededFromStaked)
                 );
@@ -311,19 +400,23 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
 
     // fire sale, get rid of it all!
     function liquidateAllPositions() internal override returns (uint256) {
-        uint256 _stakedBal = stakedBalance();
+        ICurveStrategyProxy _proxy = proxy();
+        address _gauge = gauge();
+        uint256 _stakedBal = _proxy.balanceOf(_gauge);
         if (_stakedBal > 0) {
             // dont bother withdrawing zero, save gas where we can
-            proxy.withdraw(gauge, address(want), _stakedBal);
+            _proxy.withdraw(_gauge, address(want), _stakedBal);
         }
         return balanceOfWant();
     }
 
     // migrate our want token to a new strategy if needed, as well as our CRV
     function prepareMigration(address _newStrategy) internal override {
-        uint256 stakedBal = stakedBalance();
+        ICurveStrategyProxy _proxy = proxy();
+        address _gauge = gauge();
+        uint256 stakedBal = _proxy.balanceOf(_gauge);
         if (stakedBal > 0) {
-            proxy.withdraw(gauge, address(want), stakedBal);
+            _proxy.withdraw(_gauge, address(want), stakedBal);
         }
         uint256 crvBal = crv.balanceOf(address(this));
 
@@ -343,17 +436,73 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
     /* ========== YSWAPS ========== */
 
     /**
-     * @notice Use to add or update rewards, rebuilds tradefactory too
+     * @notice Use to add or update rewards, updates tradefactory too
      * @dev Do this before updating trade factory if we have extra rewards. Can only be called by governance.
+     *  Only rewards tokens that were added or removed are approved or revoked on our trade factory.
      * @param _rewards Rewards tokens to add to our trade factory.
      */
     function updateRewards(address[] memory _rewards) external onlyGovernance {
-        address tf = tradeFactory;
-        _removeTradeFactoryPermissions(true);
+        address[] memory oldRewardsTokens = rewardsTokens;
         rewardsTokens = _rewards;
+        _updateTradeFactoryRewards(oldRewardsTokens);
+    }
 
-        tradeFactory = tf;
-        _setUpTradeFactory();
+    // only approve and enable rewards tokens we've added, and revoke any we've removed. our base rewards
+    //  tokens are set up with our trade factory no matter what's in our list, so leave them alone.
+    function _updateTradeFactoryRewards(
+        address[] memory _oldRewardsTokens
+    ) internal {
+        address _tradeFactory = tradeFactory;
+        if (_tradeFactory == address(0)) {
+            return;
+        }
+        ITradeFactory tf = ITradeFactory(_tradeFactory);
+        address _want = address(want);
+        address[] memory _newRewardsTokens = rewardsTokens;
+
+        // revoke any tokens we no longer receive
+        for (uint256 i; i < _oldRewardsTokens.length; ++i) {
+            address _rewardsToken = _oldRewardsTokens[i];
+            if (
+                _isBaseRewardToken(_rewardsToken) ||
+                _contains(_newRewardsTokens, _rewardsToken)
+            ) {
+                continue;
+            }
+            IERC20(_rewardsToken).approve(_tradeFactory, 0);
+            tf.disable(_rewardsToken, _want);
+        }
+
+        // and approve any that are new to us
+        for (uint256 i; i < _newRewardsTokens.length; ++i) {
+            address _rewardsToken = _newRewardsTokens[i];
+            if (
+                _isBaseRewardToken(_rewardsToken) ||
+                _contains(_oldRewardsTokens, _rewardsToken)
+            ) {
+                continue;
+            }
+            IERC20(_rewardsToken).approve(_tradeFactory, type(uint256).max);
+            tf.enable(_rewardsToken, _want);
+        }
+    }
+
+    // check if a token is one of our base rewards tokens (CRV)
+    function _isBaseRewardToken(address _token) internal view returns (bool) {
+        return _token == address(crv);
+    }
+
+    // check if an array of addresses includes a given address
+    function _contains(
+        address[] memory _array,
+        address _value
+    ) internal pure returns (bool) {
+        for (uint256 i; i < _array.length; ++i) {
+            if (_array[i] == _value) {
+                return true;
+            }
+        }
+        return false;
     }
 
     /**
@@ -501,10 +650,11 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
         if (_keepCrv > 10_000) {
             revert();
         }
-        if (_keepCrv > 0 && curveVoter == address(0)) {
+        if (_keepCrv > 0 && keepInfo.curveVoter == address(0)) {
             revert("Set voter when keep >0");
         }
-        localKeepCRV = _keepCrv;
+        // we checked this above, so it fits
+        keepInfo.localKeepCRV = uint16(_keepCrv);
     }
 
     /**
@@ -513,6 +663,6 @@ contract StrategyCurveBoostedFactoryClonable is BaseStrategy {
      * @param _curveVoter Address of our curve voter.
      */
     function setVoter(address _curveVoter) external onlyGovernance {
-        curveVoter = _curveVoter;
+        keepInfo.curveVoter = _curveVoter;
     }
 }
@@ -2,6 +2,8 @@
 pragma solidity 0.8.19;
 
 import {Math} from "@openzeppelin/contracts@4.9.3/utils/math/Math.sol";
+import {SafeCast} from "@openzeppelin/contracts@4.9.3/utils/math/SafeCast.sol";
+import {ClonesWithImmutableArgs} from "./libraries/ClonesWithImmutableArgs.sol";
 import "github.com/yearn/yearn-vaults/blob/v0.4.6/contracts/BaseStrategy.sol";
 import "./interfaces/PrismaInterfaces.sol";
 
@@ -15,6 +17,34 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         bool shouldClaimRewards;
     }
 
+    struct HarvestInfo {
+        /**
+         * @notice Minimum profit size in USDC that we want to harvest.
+         * @dev Only used in harvestTrigger.
+         */
+        uint128 harvestProfitMinInUsdc;
+        /**
+         * @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
+         * @dev Only used in harvestTrigger.
+         */
+        uint128 harvestProfitMaxInUsdc;
+    }
+
+    struct KeepInfo {
+        /// @notice The address of our Curve voter. This is where we send any keepCRV.
+        address curveVoter;
+        /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
+        uint16 localKeepCRV;
+        /// @notice The percentage of CVX from each harvest that we send to our voter (out of 10,000).
+        uint16 localKeepCVX;
+        /// @notice The percentage of yPRISMA from each harvest that we send to our voter (out of 10,000).
+        uint16 localKeepYPrisma;
+        /// @notice The address of our Convex voter. This is where we send any keepCVX.
+        address convexVoter;
+        /// @notice The address of our yPRISMA POL contract. This is where we send any keepYPrisma.
+        address yprismaVoter;
+    }
+
     // Fees are in basis points
     uint256 internal constant FEE_DENOMINATOR = 10_000;
 
@@ -28,29 +58,18 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
 
     /* ========== STATE VARIABLES ========== */
 
-    /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
-    uint256 public localKeepCRV;
-
-    /// @notice The percentage of CVX from each harvest that we send to our voter (out of 10,000).
-    uint256 public localKeepCVX;
-
-    /// @notice The percentage of yPRISMA from each harvest that we send to our voter (out of 10,000).
-    uint256 public localKeepYPrisma;
-
-    /// @notice The address of our Curve voter. This is where we send any keepCRV.
-    address public curveVoter;
-
-    /// @notice The address of our Convex voter. This is where we send any keepCVX.
-    address public convexVoter;
-
-    /// @notice The address of our yPRISMA POL contract. This is where we send any keepYPrisma.
-    address public yprismaVoter;
+    /**
+     * @notice Our keep amounts and voters. See struct NatSpec for more details.
+     * @dev Our keeps share a slot with our curve voter, so we only read the other voters if we have a keep for them.
+     */
+    KeepInfo public keepInfo;
 
-    /// @notice Where we claim emissions as yPRISMA
-    IPrismaVault public prismaVault;
+    // our prisma vault and receiver. only written on our original and plain clones, see prismaVault().
+    IPrismaVault internal storedPrismaVault;
+    IPrismaReceiver internal storedPrismaReceiver;
 
-    /// @notice The contract we deposit our LPs to that is approved for PRISMA emissions.
-    IPrismaReceiver public prismaReceiver;
+    // prisma vault (20 bytes) and receiver (20 bytes), packed at the end of our immutable-args clones
+    uint256 internal constant IMMUTABLE_ARGS_LENGTH = 40;
 
     /// @notice The address of our base token (CRV for Curve, BAL for Balancer, etc.).
     IERC20 public constant crv =
@@ -60,17 +79,14 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
     IERC20 public constant convexToken =
         IERC20(0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B);
 
-    /**
-     * @notice Minimum profit size in USDC that we want to harvest.
-     * @dev Only used in harvestTrigger.
-     */
-    uint256 public harvestProfitMinInUsdc;
+    /// @notice Our harvest profit limits. See struct NatSpec for more details.
+    HarvestInfo public harvestInfo;
 
     /**
-     * @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
-     * @dev Only used in harvestTrigger.
+     * @notice Optional shared cache of our reward prices.
+     * @dev Only used in harvestTrigger. If zero address, we price rewards directly via Chainlink.
      */
-    uint256 public harvestProfitMaxInUsdc;
+    IRewardPriceSnapshot public rewardPriceSnapshot;
 
     // ySwaps stuff
     /// @notice The address of our ySwaps trade factory.
@@ -170,9 +186,59 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         emit Cloned(newStrategy);
     }
 
+    /**
+     * @notice Same as cloneStrategyPrismaConvex, but our clone keeps its prisma vault and receiver in its code.
+     * @dev These never change, so this saves writing them on deployment and reading them from storage afterwards.
+     * @param _vault Vault address we are targeting with this strategy.
+     * @param _strategist Address to grant the strategist role.
+     * @param _rewards If we have any strategist rewards, send them here.
+     * @param _keeper Address to grant the keeper role.
+     * @param _tradeFactory Our trade factory address.
+     * @param _harvestProfitMinInUsdc Minimum acceptable profit for a harvest.
+     * @param _harvestProfitMaxInUsdc Maximum acceptable profit for a harvest.
+     * @param _prismaVault Address of the Prisma vault.
+     * @param _prismaReceiver Address of the Prisma receiver to farm.
+     * @return newStrategy Address of our new cloned strategy.
+     */
+    function cloneStrategyPrismaConvexWithArgs(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _tradeFactory,
+        uint256 _harvestProfitMinInUsdc,
+        uint256 _harvestProfitMaxInUsdc,
+        address _prismaVault,
+        address _prismaReceiver
+    ) external returns (address newStrategy) {
+        // dont clone a clone
+        if (!isOriginal) {
+            revert("Cant clone a clone");
+        }
+
+        newStrategy = ClonesWithImmutableArgs.clone(
+            address(this),
+            abi.encodePacked(_prismaVault, _prismaReceiver)
+        );
+
+        StrategyPrismaConvexFactoryClonable(newStrategy).initialize(
+            _vault,
+            _strategist,
+            _rewards,
+            _keeper,
+            _tradeFactory,
+            _harvestProfitMinInUsdc,
+            _harvestProfitMaxInUsdc,
+            _prismaVault,
+            _prismaReceiver
+        );
+
+        emit Cloned(newStrategy);
+    }
+
     /**
      * @notice Initialize the strategy.
-     * @dev This should only be called by the clone function above.
+     * @dev This should only be called by the clone functions above.
      * @param _vault Vault address we are targeting with this strategy.
      * @param _strategist Address to grant the strategist role.
      * @param _rewards If we have any strategist rewards, send them here.
@@ -212,15 +278,22 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         address _prismaVault,
         address _prismaReceiver
     ) internal {
-        // make sure that we havent initialized this before
+        // make sure that we havent initialized this before. our immutable-args clones rely on baseStrategy's check.
         require(_prismaVault != address(0), "Non-zero required");
-        require(address(prismaVault) == address(0), "Already initialized");
+        if (!ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            require(
+                address(storedPrismaVault) == address(0),
+                "Already initialized"
+            );
+            storedPrismaReceiver = IPrismaReceiver(_prismaReceiver);
+            storedPrismaVault = IPrismaVault(_prismaVault);
+        }
 
-        prismaReceiver = IPrismaReceiver(_prismaReceiver);
-        prismaVault = IPrismaVault(_prismaVault);
         tradeFactory = _tradeFactory;
-        harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
-        harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
+        harvestInfo = HarvestInfo({
+            harvestProfitMinInUsdc: SafeCast.toUint128(_harvestProfitMinInUsdc),
+            harvestProfitMaxInUsdc: SafeCast.toUint128(_harvestProfitMaxInUsdc)
+        });
 
         // want = Curve LP
         want.approve(address(_prismaReceiver), type(uint256).max);
@@ -229,7 +302,10 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         maxReportDelay = 365 days;
         creditThreshold = 50_000e18;
 
-        require(address(want) == prismaReceiver.lpToken(), "Wrong LP.");
+        require(
+            address(want) == IPrismaReceiver(_prismaReceiver).lpToken(),
+            "Wrong LP."
+        );
 
         _setUpTradeFactory();
     }
@@ -247,9 +323,65 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
             );
     }
 
+    /// @notice The percentage of CRV from each harvest that we send to our voter (out of 10,000).
+    function localKeepCRV() external view returns (uint256) {
+        return uint256(keepInfo.localKeepCRV);
+    }
+
+    /// @notice The percentage of CVX from each harvest that we send to our voter (out of 10,000).
+    function localKeepCVX() external view returns (uint256) {
+        return uint256(keepInfo.localKeepCVX);
+    }
+
+    /// @notice The percentage of yPRISMA from each harvest that we send to our voter (out of 10,000).
+    function localKeepYPrisma() external view returns (uint256) {
+        return uint256(keepInfo.localKeepYPrisma);
+    }
+
+    /// @notice The address of our Curve voter. This is where we send any keepCRV.
+    function curveVoter() external view returns (address) {
+        return keepInfo.curveVoter;
+    }
+
+    /// @notice The address of our Convex voter. This is where we send any keepCVX.
+    function convexVoter() external view returns (address) {
+        return keepInfo.convexVoter;
+    }
+
+    /// @notice The address of our yPRISMA POL contract. This is where we send any keepYPrisma.
+    function yprismaVoter() external view returns (address) {
+        return keepInfo.yprismaVoter;
+    }
+
+    /// @notice Minimum profit size in USDC that we want to harvest.
+    function harvestProfitMinInUsdc() external view returns (uint256) {
+        return uint256(harvestInfo.harvestProfitMinInUsdc);
+    }
+
+    /// @notice Maximum profit size in USDC that we want to harvest (ignore gas price once we get here).
+    function harvestProfitMaxInUsdc() external view returns (uint256) {
+        return uint256(harvestInfo.harvestProfitMaxInUsdc);
+    }
+
+    /// @notice Where we claim emissions as yPRISMA
+    function prismaVault() public view returns (IPrismaVault) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return IPrismaVault(ClonesWithImmutableArgs.getArgAddress(0));
+        }
+        return storedPrismaVault;
+    }
+
+    /// @notice The contract we deposit our LPs to that is approved for PRISMA emissions.
+    function prismaReceiver() public view returns (IPrismaReceiver) {
+        if (ClonesWithImmutableArgs.hasArgs(IMMUTABLE_ARGS_LENGTH)) {
+            return IPrismaReceiver(ClonesWithImmutableArgs.getArgAddress(20));
+        }
+        return storedPrismaReceiver;
+    }
+
     /// @notice Balance of want staked in Prisma.
     function stakedBalance() public view returns (uint256) {
-        return prismaReceiver.balanceOf(address(this));
+        return prismaReceiver().balanceOf(address(this));
     }
 
     /// @notice Balance of want sitting in our strategy.
@@ -279,8 +411,9 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         }
 
         // by default this is zero, but if we want any for our voter this will be used
-        uint256 _localKeepCRV = localKeepCRV;
-        address _curveVoter = curveVoter;
+        KeepInfo storage _keepInfo = keepInfo;
+        uint256 _localKeepCRV = uint256(_keepInfo.localKeepCRV);
+        address _curveVoter = _keepInfo.curveVoter;
         uint256 _sendToVoter;
         if (_localKeepCRV > 0 && _curveVoter != address(0)) {
             uint256 crvBalance = crv.balanceOf(address(this));
@@ -293,30 +426,38 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         }
 
         // by default this is zero, but if we want any for our voter this will be used
-        uint256 _localKeepCVX = localKeepCVX;
-        address _convexVoter = convexVoter;
-        if (_localKeepCVX > 0 && _convexVoter != address(0)) {
-            uint256 cvxBalance = convexToken.balanceOf(address(this));
-            unchecked {
-                _sendToVoter = (cvxBalance * _localKeepCVX) / FEE_DENOMINATOR;
-            }
-            if (_sendToVoter > 0) {
-                convexToken.safeTransfer(_convexVoter, _sendToVoter);
+        // our convex voter is in its own slot, so we only read it if we have a keep
+        uint256 _localKeepCVX = uint256(_keepInfo.localKeepCVX);
+        if (_localKeepCVX > 0) {
+            address _convexVoter = _keepInfo.convexVoter;
+            if (_convexVoter != address(0)) {
+                uint256 cvxBalance = convexToken.balanceOf(address(this));
+                unchecked {
+                    _sendToVoter =
+                        (cvxBalance * _localKeepCVX) /
+                        FEE_DENOMINATOR;
+                }
+                if (_sendToVoter > 0) {
+                    convexToken.safeTransfer(_convexVoter, _sendToVoter);
+                }
             }
         }
 
         // by default this is zero, but if we want any for our voter this will be used
-        uint256 _localKeepYPrisma = localKeepYPrisma;
-        address _yprismaVoter = yprismaVoter;
-        if (_localKeepYPrisma > 0 && _yprismaVoter != address(0)) {
-            uint256 yprismaBalance = yPrisma.balanceOf(address(this));
-            unchecked {
-                _sendToVoter =
-                    (yprismaBalance * _localKeepYPrisma) /
-                    FEE_DENOMINATOR;
-            }
-            if (_sendToVoter > 0) {
-                yPrisma.safeTransfer(_yprismaVoter, _sendToVoter);
+        // same as above, our yPRISMA voter has its own slot
+        uint256 _localKeepYPrisma = uint256(_keepInfo.localKeepYPrisma);
+        if (_localKeepYPrisma > 0) {
+            address _yprismaVoter = _keepInfo.yprismaVoter;
+            if (_yprismaVoter != address(0)) {
+                uint256 yprismaBalance = yPrisma.balanceOf(address(this));
+                unchecked {
+                    _sendToVoter =
+                        (yprismaBalance * _localKeepYPrisma) /
+                        FEE_DENOMINATOR;
+                }
+                if (_sendToVoter > 0) {
+                    yPrisma.safeTransfer(_yprismaVoter, _sendToVoter);
+                }
             }
         }
 
@@ -366,7 +507,7 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
 
         // deposit into Prisma
         if (_toInvest > 0) {
-            prismaReceiver.deposit(address(this), _toInvest);
+            prismaReceiver().deposit(address(this), _toInvest);
         }
     }
 
@@ -376,7 +517,9 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         // check our loose want
         uint256 _wantBal = balanceOfWant();
         if (_amountNeeded > _wantBal) {
-            uint256 _stakedBal = stakedBalance();
+            // read our receiver once, on args clones each read is an extcodesize and extcodecopy
+            IPrismaReceiver _prismaReceiver = prismaReceiver();
+            uint256 _stakedBal = _prismaReceiver.balanceOf(address(this));
             if (_stakedBal > 0) {
                 uint256 _neededFromStaked;
                 unchecked {
@@ -385,7 +528,7 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
                 // withdraw whatever extra funds we need
                 uint256 toWithdraw = Math.min(_stakedBal, _neededFromStaked);
                 if (toWithdraw > 0) {
-                    prismaReceiver.withdraw(address(this), toWithdraw);
+                    _prismaReceiver.withdraw(address(this), toWithdraw);
                 }
             }
             uint256 _withdrawnBal = balanceOfWant();
@@ -401,20 +544,22 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
 
     // fire sale, get rid of it all!
     function liquidateAllPositions() internal override returns (uint256) {
-        uint256 _stakedBal = stakedBalance();
+        IPrismaReceiver _prismaReceiver = prismaReceiver();
+        uint256 _stakedBal = _prismaReceiver.balanceOf(address(this));
         if (_stakedBal > 0) {
             // dont bother withdrawing zero, save gas where we can
-            prismaReceiver.withdraw(address(this), _stakedBal);
+            _prismaReceiver.withdraw(address(this), _stakedBal);
         }
         return balanceOfWant();
     }
 
     // migrate our want token to a new strategy if needed, claim rewards tokens as well unless its an emergency
     function prepareMigration(address _newStrategy) internal override {
-        uint256 stakedBal = stakedBalance();
+        IPrismaReceiver _prismaReceiver = prismaReceiver();
+        uint256 stakedBal = _prismaReceiver.balanceOf(address(this));
 
         if (stakedBal > 0) {
-            prismaReceiver.withdraw(address(this), stakedBal);
+            _prismaReceiver.withdraw(address(this), stakedBal);
         }
 
         uint256 crvBal = crv.balanceOf(address(this));
@@ -443,8 +588,17 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
      * @return Whether claims are max boosted or not.
      */
     function claimsAreMaxBoosted() public view returns (bool) {
-        (uint256 claimable, , ) = prismaReceiver.claimableReward(address(this));
-        (uint256 maxBoostable, ) = prismaVault.getClaimableWithBoost(
+        return _claimsAreMaxBoosted(prismaReceiver(), prismaVault());
+    }
+
+    function _claimsAreMaxBoosted(
+        IPrismaReceiver _prismaReceiver,
+        IPrismaVault _prismaVault
+    ) internal view returns (bool) {
+        (uint256 claimable, , ) = _prismaReceiver.claimableReward(
+            address(this)
+        );
+        (uint256 maxBoostable, ) = _prismaVault.getClaimableWithBoost(
             YEARN_LOCKER
         );
         return maxBoostable >= claimable;
@@ -455,11 +609,18 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         address _boostDelegate,
         uint256 _maxFee
     ) internal {
+        // read our receiver and vault once, on args clones each read is an extcodesize and extcodecopy
+        IPrismaReceiver _prismaReceiver = prismaReceiver();
+        IPrismaVault _prismaVault = prismaVault();
+
         // By default, we only allow claims if max boosted. Force claim once if needed.
-        if (claimsAreMaxBoosted() || _forceClaimOnce) {
+        if (
+            _claimsAreMaxBoosted(_prismaReceiver, _prismaVault) ||
+            _forceClaimOnce
+        ) {
             address[] memory rewardContracts = new address[](1);
-            rewardContracts[0] = address(prismaReceiver);
-            prismaVault.batchClaimRewards(
+            rewardContracts[0] = address(_prismaReceiver);
+            _prismaVault.batchClaimRewards(
                 YEARN_LOCKER, // receiver
                 _boostDelegate, // delegate
                 rewardContracts, // rewards contracts
@@ -583,9 +744,10 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
 
         // harvest if we have a profit to claim at our upper limit without considering gas price
         ClaimParams memory _claimParams = claimParams;
+        HarvestInfo memory _harvestInfo = harvestInfo;
         uint256 claimableProfit = claimableProfitInUsdc();
         if (
-            claimableProfit > harvestProfitMaxInUsdc &&
+            claimableProfit > _harvestInfo.harvestProfitMaxInUsdc &&
             _claimParams.shouldClaimRewards
         ) {
             return true;
@@ -603,7 +765,7 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
 
         // harvest if we have a sufficient profit to claim, are max boosted, and we're claiming rewards.
         if (
-            claimableProfit > harvestProfitMinInUsdc &&
+            claimableProfit > _harvestInfo.harvestProfitMinInUsdc &&
             _claimParams.shouldClaimRewards &&
             (claimsAreMaxBoosted() || _claimParams.forceClaimOnce)
         ) {
@@ -630,7 +792,7 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
 
     /**
      * @notice Calculates the profit if all claimable assets were sold for USDC (6 decimals).
-     * @dev Uses Chainlinks feed registry.
+     * @dev Uses Chainlinks feed registry, or our reward price snapshot for CRV and CVX if we have one.
      * @return Total return in USDC from selling claimable CRV and CVX.
      */
     function claimableProfitInUsdc() public view returns (uint256) {
@@ -638,21 +800,28 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
             uint256 yPrismaAmount,
             uint256 crvAmount,
             uint256 cvxAmount
-        ) = prismaReceiver.claimableReward(address(this)); // This assumes 2x boost for prisma amount
-
-        (, uint256 crvPrice, , , ) = IOracle(
-            0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf
-        ).latestRoundData(
-                address(crv),
-                address(0x0000000000000000000000000000000000000348) // USD, returns 1e8
-            );
+        ) = prismaReceiver().claimableReward(address(this)); // This assumes 2x boost for prisma amount
 
-        (, uint256 cvxPrice, , , ) = IOracle(
-            0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf
-        ).latestRoundData(
-                address(convexToken),
-                address(0x0000000000000000000000000000000000000348) // USD, returns 1e8
-            );
+        // our shared snapshot saves us the CRV and CVX oracle calls
+        uint256 crvPrice;
+        uint256 cvxPrice;
+        if (address(rewardPriceSnapshot) != address(0)) {
+            (crvPrice, cvxPrice, , , ) = rewardPriceSnapshot.snapshot();
+        } else {
+            (, crvPrice, , , ) = IOracle(
+                0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf
+            ).latestRoundData(
+                    address(crv),
+                    address(0x0000000000000000000000000000000000000348) // USD, returns 1e8
+                );
+
+            (, cvxPrice, , , ) = IOracle(
+                0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf
+            ).latestRoundData(
+                    address(convexToken),
+                    address(0x0000000000000000000000000000000000000348) // USD, returns 1e8
+                );
+        }
 
         uint256 ethUsdPrice = ISimpleOracle(
             0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419
@@ -700,21 +869,22 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
             revert();
         }
 
-        if (_keepCrv > 0 && curveVoter == address(0)) {
+        if (_keepCrv > 0 && keepInfo.curveVoter == address(0)) {
             revert();
         }
 
-        if (_keepCvx > 0 && convexVoter == address(0)) {
+        if (_keepCvx > 0 && keepInfo.convexVoter == address(0)) {
             revert();
         }
 
-        if (_keepYPrisma > 0 && yprismaVoter == address(0)) {
+        if (_keepYPrisma > 0 && keepInfo.yprismaVoter == address(0)) {
             revert();
         }
 
-        localKeepCRV = _keepCrv;
-        localKeepCVX = _keepCvx;
-        localKeepYPrisma = _keepYPrisma;
+        // we checked these above, so they fit
+        keepInfo.localKeepCRV = uint16(_keepCrv);
+        keepInfo.localKeepCVX = uint16(_keepCvx);
+        keepInfo.localKeepYPrisma = uint16(_keepYPrisma);
     }
 
     /**
@@ -729,9 +899,9 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         address _convexVoter,
         address _yprismaVoter
     ) external onlyGovernance {
-        curveVoter = _curveVoter;
-        convexVoter = _convexVoter;
-        yprismaVoter = _yprismaVoter;
+        keepInfo.curveVoter = _curveVoter;
+        keepInfo.convexVoter = _convexVoter;
+        keepInfo.yprismaVoter = _yprismaVoter;
     }
 
     /**
@@ -744,8 +914,10 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         uint256 _harvestProfitMinInUsdc,
         uint256 _harvestProfitMaxInUsdc
     ) external onlyVaultManagers {
-        harvestProfitMinInUsdc = _harvestProfitMinInUsdc;
-        harvestProfitMaxInUsdc = _harvestProfitMaxInUsdc;
+        harvestInfo = HarvestInfo({
+            harvestProfitMinInUsdc: SafeCast.toUint128(_harvestProfitMinInUsdc),
+            harvestProfitMaxInUsdc: SafeCast.toUint128(_harvestProfitMaxInUsdc)
+        });
     }
 
     /**
@@ -760,4 +932,15 @@ contract StrategyPrismaConvexFactoryClonable is BaseStrategy {
         claimParams.forceClaimOnce = _forceClaimOnce;
         claimParams.shouldClaimRewards = _shouldClaimRewards;
     }
+
+    /**
+     * @notice Use this to set or remove our shared reward price snapshot.
+     * @dev Only used in harvestTrigger. Set to zero address to price rewards directly via Chainlink.
+     * @param _rewardPriceSnapshot Address of our reward price snapshot.
+     */
+    function setRewardPriceSnapshot(
+        address _rewardPriceSnapshot
+    ) external onlyVaultManagers {
+        rewardPriceSnapshot = IRewardPriceSnapshot(_rewardPriceSnapshot);
+    }
 }
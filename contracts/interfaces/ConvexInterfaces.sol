@@ -1,6 +1,8 @@
 // SPDX-License-Identifier: AGPL-3.0
 pragma solidity ^0.8.15;
 
+import "./RewardPriceSnapshotInterfaces.sol";
+
 interface ITradeFactory {
     function enable(address, address) external;
 
@@ -0,0 +1,15 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.15;
+
+interface IRewardPriceSnapshot {
+    function snapshot()
+        external
+        view
+        returns (
+            uint256 crvPrice,
+            uint256 cvxPrice,
+            uint256 fxsPrice,
+            uint256 cvxReduction,
+            uint256 cvxTillMax
+        );
+}
@@ -0,0 +1,195 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+import "./MockERC20.sol";
+
+/// @notice Mock of a Convex rewards contract (BaseRewardPool). Holds staked Curve LP directly.
+/// @dev CRV accrues over time and is minted on claim, along with an equal amount of CVX (we're well below
+///  CVX's first cliff on a fresh chain).
+contract MockConvexRewards is MockRewardAccrual {
+    MockConvexBooster public immutable booster;
+    uint256 public immutable pid;
+    MockERC20 public immutable stakingToken;
+    MockERC20 public immutable depositToken;
+
+    uint256 public periodFinish;
+
+    address[] public extraRewards;
+
+    constructor(
+        MockConvexBooster _booster,
+        uint256 _pid,
+        MockERC20 _stakingToken,
+        MockERC20 _depositToken
+    ) {
+        booster = _booster;
+        pid = _pid;
+        stakingToken = _stakingToken;
+        depositToken = _depositToken;
+    }
+
+    function rewardToken() external view returns (address) {
+        return address(booster.crv());
+    }
+
+    function earned(address _account) external view returns (uint256) {
+        return _earned(_account);
+    }
+
+    function extraRewardsLength() external view returns (uint256) {
+        return extraRewards.length;
+    }
+
+    function addExtraReward(address _extraReward) external {
+        extraRewards.push(_extraReward);
+    }
+
+    function clearExtraRewards() external {
+        delete extraRewards;
+    }
+
+    function stakeFor(address _account, uint256 _amount) external {
+        if (msg.sender != address(booster)) revert();
+        _stake(_account, _amount);
+    }
+
+    function notifyEarmark() external {
+        if (msg.sender != address(booster)) revert();
+        periodFinish = block.timestamp + 7 days;
+    }
+
+    // burn our stake and receive Convex deposit tokens
+    function withdraw(
+        uint256 _amount,
+        bool _claimRewards
+    ) external returns (bool) {
+        _unstake(msg.sender, _amount);
+        depositToken.mint(msg.sender, _amount);
+        if (_claimRewards) {
+            getReward(msg.sender, true);
+        }
+        return true;
+    }
+
+    // burn our stake and receive Curve LP
+    function withdrawAndUnwrap(
+        uint256 _amount,
+        bool _claimRewards
+    ) external returns (bool) {
+        _unstake(msg.sender, _amount);
+        stakingToken.transfer(msg.sender, _amount);
+        if (_claimRewards) {
+            getReward(msg.sender, true);
+        }
+        return true;
+    }
+
+    function getReward(address _account, bool) public returns (bool) {
+        uint256 rewards = _claim(_account);
+        if (rewards > 0) {
+            booster.crv().mint(_account, rewards);
+            booster.minter().mint(_account, rewards);
+        }
+        return true;
+    }
+}
+
+/// @notice Mock of a Convex extra rewards pool (VirtualBalanceRewardPool). We only need its reward token.
+contract MockExtraRewards {
+    address public immutable rewardToken;
+
+    constructor(address _rewardToken) {
+        rewardToken = _rewardToken;
+    }
+}
+
+/// @notice Mock of Convex's booster (deposit contract).
+contract MockConvexBooster {
+    struct PoolInfo {
+        address lptoken;
+        address token;
+        address gauge;
+        address crvRewards;
+        address stash;
+        bool shutdown;
+    }
+
+    MockERC20 public immutable crv;
+
+    /// @notice Our CVX token, minted alongside CRV rewards.
+    MockERC20 public immutable minter;
+
+    PoolInfo[] public poolInfo;
+
+    constructor(MockERC20 _crv, MockERC20 _cvx) {
+        crv = _crv;
+        minter = _cvx;
+    }
+
+    function poolLength() external view returns (uint256) {
+        return poolInfo.length;
+    }
+
+    /// @notice Add a new pool, deploying its deposit token and rewards contract.
+    function addPool(
+        address _lptoken,
+        address _gauge,
+        uint256
+    ) external returns (bool) {
+        uint256 pid = poolInfo.length;
+        MockERC20 depositToken = new MockERC20("Convex Deposit", "cvxLP");
+        MockConvexRewards rewards = new MockConvexRewards(
+            this,
+            pid,
+            MockERC20(_lptoken),
+            depositToken
+        );
+        poolInfo.push(
+            PoolInfo(
+                _lptoken,
+                address(depositToken),
+                _gauge,
+                address(rewards),
+                address(0),
+                false
+            )
+        );
+        return true;
+    }
+
+    function shutdownPool(uint256 _pid) external returns (bool) {
+        poolInfo[_pid].shutdown = true;
+        return true;
+    }
+
+    function deposit(
+        uint256 _pid,
+        uint256 _amount,
+        bool _stake
+    ) external returns (bool) {
+        PoolInfo memory pool = poolInfo[_pid];
+        if (pool.shutdown) revert();
+
+        if (_stake) {
+            MockERC20(pool.lptoken).transferFrom(
+                msg.sender,
+                pool.crvRewards,
+                _amount
+            );
+            MockConvexRewards(pool.crvRewards).stakeFor(msg.sender, _amount);
+        } else {
+            MockERC20(pool.lptoken).transferFrom(
+                msg.sender,
+                address(this),
+                _amount
+            );
+            MockERC20(pool.token).mint(msg.sender, _amount);
+        }
+        return true;
+    }
+
+    function earmarkRewards(uint256 _pid) external returns (bool) {
+        MockConvexRewards(poolInfo[_pid].crvRewards).notifyEarmark();
+        return true;
+    }
+}
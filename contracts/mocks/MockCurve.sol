@@ -0,0 +1,169 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+import "./MockERC20.sol";
+
+/// @notice Mock of a Curve liquidity gauge. CRV accrues over time and is minted on claim.
+contract MockCurveGauge is MockRewardAccrual {
+    MockERC20 public immutable lp_token;
+    MockERC20 public immutable crv;
+
+    constructor(MockERC20 _lpToken, MockERC20 _crv) {
+        lp_token = _lpToken;
+        crv = _crv;
+    }
+
+    function claimable_tokens(
+        address _account
+    ) external view returns (uint256) {
+        return _earned(_account);
+    }
+
+    function deposit(uint256 _value) external {
+        lp_token.transferFrom(msg.sender, address(this), _value);
+        _stake(msg.sender, _value);
+    }
+
+    function withdraw(uint256 _value) external {
+        _unstake(msg.sender, _value);
+        lp_token.transfer(msg.sender, _value);
+    }
+
+    // stands in for CRV's minter, which mints gauge rewards in practice
+    function claim() external {
+        uint256 rewards = _claim(msg.sender);
+        if (rewards > 0) {
+            crv.mint(msg.sender, rewards);
+        }
+    }
+}
+
+/// @notice Mock of Yearn's Curve voter, which holds our gauge deposits and acts only via its strategy proxy.
+contract MockCurveVoter {
+    address public strategy;
+
+    function setStrategy(address _strategy) external {
+        strategy = _strategy;
+    }
+
+    function execute(
+        address _to,
+        uint256 _value,
+        bytes calldata _data
+    ) external returns (bool, bytes memory) {
+        if (msg.sender != strategy) revert();
+        (bool success, bytes memory result) = _to.call{value: _value}(_data);
+        if (!success) revert();
+        return (success, result);
+    }
+}
+
+/// @notice Mock of Yearn's strategy proxy, which our Curve boosted strategies deposit through.
+contract MockStrategyProxy {
+    MockCurveVoter public immutable voter;
+    MockERC20 public immutable crv;
+
+    /// @notice Strategy approved to use each gauge.
+    mapping(address => address) public strategies;
+
+    /// @notice Extra reward tokens our strategies may claim.
+    mapping(address => bool) public rewardTokenApproved;
+
+    constructor(MockCurveVoter _voter, MockERC20 _crv) {
+        voter = _voter;
+        crv = _crv;
+    }
+
+    modifier onlyStrategy(address _gauge) {
+        if (strategies[_gauge] != msg.sender) revert();
+        _;
+    }
+
+    function approveStrategy(address _gauge, address _strategy) external {
+        strategies[_gauge] = _strategy;
+    }
+
+    function revokeStrategy(address _gauge) external {
+        strategies[_gauge] = address(0);
+    }
+
+    function approveRewardToken(address _token) external {
+        rewardTokenApproved[_token] = true;
+    }
+
+    function balanceOf(address _gauge) external view returns (uint256) {
+        return MockCurveGauge(_gauge).balanceOf(address(voter));
+    }
+
+    // our strategy sends us want first, then we deposit all of it for our voter
+    function deposit(
+        address _gauge,
+        address _token
+    ) external onlyStrategy(_gauge) {
+        uint256 balance = MockERC20(_token).balanceOf(address(this));
+        MockERC20(_token).transfer(address(voter), balance);
+        voter.execute(
+            _token,
+            0,
+            abi.encodeWithSignature("approve(address,uint256)", _gauge, balance)
+        );
+        voter.execute(
+            _gauge,
+            0,
+            abi.encodeWithSignature("deposit(uint256)", balance)
+        );
+    }
+
+    function withdraw(
+        address _gauge,
+        address _token,
+        uint256 _amount
+    ) external onlyStrategy(_gauge) returns (uint256) {
+        voter.execute(
+            _gauge,
+            0,
+            abi.encodeWithSignature("withdraw(uint256)", _amount)
+        );
+        _transferFromVoter(_token, msg.sender, _amount);
+        return _amount;
+    }
+
+    function harvest(address _gauge) external onlyStrategy(_gauge) {
+        voter.execute(_gauge, 0, abi.encodeWithSignature("claim()"));
+        _transferFromVoter(
+            address(crv),
+            msg.sender,
+            crv.balanceOf(address(voter))
+        );
+    }
+
+    function claimManyRewards(
+        address _gauge,
+        address[] memory _tokens
+    ) external onlyStrategy(_gauge) {
+        for (uint256 i; i < _tokens.length; ++i) {
+            address token = _tokens[i];
+            if (!rewardTokenApproved[token]) revert();
+            _transferFromVoter(
+                token,
+                msg.sender,
+                MockERC20(token).balanceOf(address(voter))
+            );
+        }
+    }
+
+    function _transferFromVoter(
+        address _token,
+        address _to,
+        uint256 _amount
+    ) internal {
+        if (_amount == 0) {
+            return;
+        }
+        voter.execute(
+            _token,
+            0,
+            abi.encodeWithSignature("transfer(address,uint256)", _to, _amount)
+        );
+    }
+}
@@ -0,0 +1,80 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+import {ERC20} from "@openzeppelin/contracts@4.9.3/token/ERC20/ERC20.sol";
+
+/// @notice Freely mintable ERC20 for testing against a bare local chain.
+/// @dev Decimals are fixed at 18 so this still works once its code is copied to a hardcoded address
+///  (eg, CRV or CVX). Our name and symbol are in storage, so they must be copied along with our code.
+contract MockERC20 is ERC20 {
+    constructor(
+        string memory _name,
+        string memory _symbol
+    ) ERC20(_name, _symbol) {}
+
+    /// @notice Mint tokens to any address.
+    function mint(address _to, uint256 _amount) external {
+        _mint(_to, _amount);
+    }
+
+    /// @notice Burn tokens from any address.
+    function burn(address _from, uint256 _amount) external {
+        _burn(_from, _amount);
+    }
+}
+
+/// @notice Simple staking balances that accrue rewards linearly over time.
+/// @dev Each staked token earns rewardRate (18 decimals) reward tokens per second. Our mocks mint whatever
+///  rewards are claimed, so there is nothing to fund.
+abstract contract MockRewardAccrual {
+    /// @notice Reward tokens earned per staked token per second (18 decimals).
+    uint256 public rewardRate = 1e12;
+
+    /// @notice Total staked across all accounts.
+    uint256 public totalSupply;
+
+    mapping(address => uint256) public balanceOf;
+
+    // rewards accrued but not yet claimed, and when we last checkpointed each account
+    mapping(address => uint256) internal accrued;
+    mapping(address => uint256) internal lastUpdate;
+
+    /// @notice Adjust how fast rewards accrue.
+    function setRewardRate(uint256 _rewardRate) external {
+        rewardRate = _rewardRate;
+    }
+
+    // rewards an account can claim right now
+    function _earned(address _account) internal view returns (uint256) {
+        return
+            accrued[_account] +
+            (balanceOf[_account] *
+                rewardRate *
+                (block.timestamp - lastUpdate[_account])) /
+            1e18;
+    }
+
+    function _checkpoint(address _account) internal {
+        accrued[_account] = _earned(_account);
+        lastUpdate[_account] = block.timestamp;
+    }
+
+    function _stake(address _account, uint256 _amount) internal {
+        _checkpoint(_account);
+        balanceOf[_account] += _amount;
+        totalSupply += _amount;
+    }
+
+    function _unstake(address _account, uint256 _amount) internal {
+        _checkpoint(_account);
+        balanceOf[_account] -= _amount;
+        totalSupply -= _amount;
+    }
+
+    // zero out and return an account's rewards
+    function _claim(address _account) internal returns (uint256 rewards) {
+        _checkpoint(_account);
+        rewards = accrued[_account];
+        accrued[_account] = 0;
+    }
+}
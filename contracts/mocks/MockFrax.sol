@@ -0,0 +1,262 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+import "./MockERC20.sol";
+
+/// @notice Mock of a Frax farm, locking Curve LP in keks. FXS, CRV and CVX accrue over time and are minted on claim.
+/// @dev Like the real farm, a withdrawn kek is zeroed out in place (kek_id included) so kek indices never shift, and
+///  it can't be withdrawn again.
+contract MockFraxStaking is MockRewardAccrual {
+    struct LockedStake {
+        bytes32 kek_id;
+        uint256 start_timestamp;
+        uint256 amount;
+        uint256 ending_timestamp;
+        uint256 multiplier; // 6 decimals of precision. 1x = 1000000
+    }
+
+    MockERC20 public immutable stakingToken;
+    MockERC20 public immutable fxs;
+    MockERC20 public immutable crv;
+    MockERC20 public immutable cvx;
+
+    uint256 public lock_time_min = 594_000; // ~6.9 days
+    uint256 public lock_time_for_max_multiplier = 365 days;
+
+    mapping(address => LockedStake[]) internal lockedStakes;
+
+    /// @notice Reward tokens paid out besides FXS, CRV and CVX. We don't actually pay any of these out.
+    address[] public extraRewardTokens;
+
+    constructor(
+        MockERC20 _stakingToken,
+        MockERC20 _fxs,
+        MockERC20 _crv,
+        MockERC20 _cvx
+    ) {
+        stakingToken = _stakingToken;
+        fxs = _fxs;
+        crv = _crv;
+        cvx = _cvx;
+    }
+
+    function setLockTimes(uint256 _min, uint256 _max) external {
+        lock_time_min = _min;
+        lock_time_for_max_multiplier = _max;
+    }
+
+    function lockedLiquidityOf(address _user) external view returns (uint256) {
+        return balanceOf[_user];
+    }
+
+    function lockedStakesOf(
+        address _user
+    ) external view returns (LockedStake[] memory) {
+        return lockedStakes[_user];
+    }
+
+    function addExtraRewardToken(address _token) external {
+        extraRewardTokens.push(_token);
+    }
+
+    function clearExtraRewardTokens() external {
+        delete extraRewardTokens;
+    }
+
+    // FXS first, then any other reward token, then CRV and CVX
+    function getAllRewardTokens()
+        public
+        view
+        returns (address[] memory tokens)
+    {
+        uint256 extras = extraRewardTokens.length;
+        tokens = new address[](extras + 3);
+        tokens[0] = address(fxs);
+        for (uint256 i; i < extras; ++i) {
+            tokens[i + 1] = extraRewardTokens[i];
+        }
+        tokens[extras + 1] = address(crv);
+        tokens[extras + 2] = address(cvx);
+    }
+
+    // we pay out the same amount of FXS, CRV and CVX, and nothing of any extra reward tokens
+    function earned(
+        address _account
+    ) public view returns (uint256[] memory amounts) {
+        uint256 rewards = _earned(_account);
+        uint256 length = extraRewardTokens.length + 3;
+        amounts = new uint256[](length);
+        amounts[0] = rewards;
+        amounts[length - 2] = rewards;
+        amounts[length - 1] = rewards;
+    }
+
+    function stakeLocked(
+        uint256 _liquidity,
+        uint256 _secs
+    ) external returns (bytes32 kekId) {
+        if (_secs < lock_time_min || _secs > lock_time_for_max_multiplier) {
+            revert("Bad lock time");
+        }
+        stakingToken.transferFrom(msg.sender, address(this), _liquidity);
+
+        kekId = keccak256(
+            abi.encodePacked(
+                msg.sender,
+                block.timestamp,
+                _liquidity,
+                lockedStakes[msg.sender].length
+            )
+        );
+        lockedStakes[msg.sender].push(
+            LockedStake(
+                kekId,
+                block.timestamp,
+                _liquidity,
+                block.timestamp + _secs,
+                1e6
+            )
+        );
+        _stake(msg.sender, _liquidity);
+    }
+
+    function lockAdditional(bytes32 _kekId, uint256 _addlLiq) external {
+        LockedStake storage stake = lockedStakes[msg.sender][
+            _findStakeIndex(msg.sender, _kekId)
+        ];
+        stakingToken.transferFrom(msg.sender, address(this), _addlLiq);
+        stake.amount += _addlLiq;
+        _stake(msg.sender, _addlLiq);
+    }
+
+    function withdrawLocked(
+        bytes32 _kekId,
+        address _destination
+    ) external returns (uint256 liquidity) {
+        uint256 index = _findStakeIndex(msg.sender, _kekId);
+        LockedStake storage stake = lockedStakes[msg.sender][index];
+        if (block.timestamp < stake.ending_timestamp) {
+            revert("Stake is still locked!");
+        }
+
+        liquidity = stake.amount;
+        if (liquidity > 0) {
+            delete lockedStakes[msg.sender][index];
+            _unstake(msg.sender, liquidity);
+            stakingToken.transfer(_destination, liquidity);
+        }
+    }
+
+    function getReward(address _destination) external {
+        uint256 rewards = _claim(msg.sender);
+        if (rewards > 0) {
+            fxs.mint(_destination, rewards);
+            crv.mint(_destination, rewards);
+            cvx.mint(_destination, rewards);
+        }
+    }
+
+    function _findStakeIndex(
+        address _user,
+        bytes32 _kekId
+    ) internal view returns (uint256) {
+        LockedStake[] storage stakes = lockedStakes[_user];
+        for (uint256 i; i < stakes.length; ++i) {
+            if (stakes[i].kek_id == _kekId) {
+                return i;
+            }
+        }
+        revert("Stake not found");
+    }
+}
+
+/// @notice Mock of a Convex Frax user vault, which stakes in a Frax farm on behalf of its owner.
+contract MockFraxUserVault {
+    address public immutable owner;
+    MockFraxStaking public immutable stakingAddress;
+
+    constructor(address _owner, MockFraxStaking _stakingAddress) {
+        owner = _owner;
+        stakingAddress = _stakingAddress;
+    }
+
+    modifier onlyOwner() {
+        if (msg.sender != owner) revert();
+        _;
+    }
+
+    function fxs() external view returns (address) {
+        return address(stakingAddress.fxs());
+    }
+
+    function crv() external view returns (address) {
+        return address(stakingAddress.crv());
+    }
+
+    function cvx() external view returns (address) {
+        return address(stakingAddress.cvx());
+    }
+
+    // older user vaults return their reward tokens and amounts directly
+    function earned()
+        external
+        view
+        returns (
+            address[] memory token_addresses,
+            uint256[] memory total_earned
+        )
+    {
+        token_addresses = stakingAddress.getAllRewardTokens();
+        total_earned = stakingAddress.earned(address(this));
+    }
+
+    function stakeLockedCurveLp(
+        uint256 _liquidity,
+        uint256 _secs
+    ) external onlyOwner returns (bytes32 kek_id) {
+        MockERC20 lp = stakingAddress.stakingToken();
+        lp.transferFrom(msg.sender, address(this), _liquidity);
+        lp.approve(address(stakingAddress), _liquidity);
+        kek_id = stakingAddress.stakeLocked(_liquidity, _secs);
+    }
+
+    function lockAdditionalCurveLp(
+        bytes32 _kek_id,
+        uint256 _addl_liq
+    ) external onlyOwner {
+        MockERC20 lp = stakingAddress.stakingToken();
+        lp.transferFrom(msg.sender, address(this), _addl_liq);
+        lp.approve(address(stakingAddress), _addl_liq);
+        stakingAddress.lockAdditional(_kek_id, _addl_liq);
+    }
+
+    function withdrawLockedAndUnwrap(bytes32 _kek_id) external onlyOwner {
+        stakingAddress.withdrawLocked(_kek_id, owner);
+    }
+
+    function getReward() external {
+        stakingAddress.getReward(owner);
+    }
+}
+
+/// @notice Mock of Convex Frax's booster, which deploys a user vault per strategy for each Frax pid.
+contract MockFraxBooster {
+    /// @notice Frax farm for each Frax pid.
+    mapping(uint256 => address) public stakingAddresses;
+
+    function addPool(uint256 _fraxPid, address _stakingAddress) external {
+        stakingAddresses[_fraxPid] = _stakingAddress;
+    }
+
+    function createVault(uint256 _fraxPid) external returns (address) {
+        address stakingAddress = stakingAddresses[_fraxPid];
+        if (stakingAddress == address(0)) revert();
+        return
+            address(
+                new MockFraxUserVault(
+                    msg.sender,
+                    MockFraxStaking(stakingAddress)
+                )
+            );
+    }
+}
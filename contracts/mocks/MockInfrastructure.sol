@@ -0,0 +1,137 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+/// @notice Mock of Chainlink's feed registry, returning whatever USD prices we set (8 decimals).
+contract MockFeedRegistry {
+    mapping(address => mapping(address => uint256)) public prices;
+
+    function setPrice(address _base, address _quote, uint256 _price) external {
+        prices[_base][_quote] = _price;
+    }
+
+    function latestRoundData(
+        address _base,
+        address _quote
+    )
+        external
+        view
+        returns (
+            uint80 roundId,
+            uint256 answer,
+            uint256 startedAt,
+            uint256 updatedAt,
+            uint80 answeredInRound
+        )
+    {
+        return (1, prices[_base][_quote], block.timestamp, block.timestamp, 1);
+    }
+}
+
+/// @notice Mock of a single price feed, covering both Chainlink's latestAnswer and Curve's price_oracle.
+contract MockPriceOracle {
+    uint256 public price;
+
+    function setPrice(uint256 _price) external {
+        price = _price;
+    }
+
+    function latestAnswer() external view returns (uint256) {
+        return price;
+    }
+
+    function price_oracle() external view returns (uint256) {
+        return price;
+    }
+}
+
+/// @notice Mock of yearn's base fee oracle. Base fee is acceptable unless set otherwise.
+contract MockBaseFeeOracle {
+    bool public manualBaseFeeBool;
+    address public baseFeeProvider;
+
+    // zero-initialized so this also works when our code is copied to a hardcoded address
+    bool public baseFeeUnacceptable;
+
+    function isCurrentBaseFeeAcceptable() external view returns (bool) {
+        return manualBaseFeeBool || !baseFeeUnacceptable;
+    }
+
+    function setBaseFeeProvider(address _baseFeeProvider) external {
+        baseFeeProvider = _baseFeeProvider;
+    }
+
+    function setManualBaseFeeBool(bool _manualBaseFeeBool) external {
+        manualBaseFeeBool = _manualBaseFeeBool;
+    }
+
+    function setBaseFeeUnacceptable(bool _baseFeeUnacceptable) external {
+        baseFeeUnacceptable = _baseFeeUnacceptable;
+    }
+}
+
+/// @notice Mock of yearn's common health check. Passes unless set otherwise.
+contract MockHealthCheck {
+    bool public failChecks;
+
+    function check(
+        uint256,
+        uint256,
+        uint256,
+        uint256,
+        uint256
+    ) external view returns (bool) {
+        return !failChecks;
+    }
+
+    function setFailChecks(bool _failChecks) external {
+        failChecks = _failChecks;
+    }
+}
+
+/// @notice Mock of ySwaps' trade factory, tracking which swaps each strategy has enabled.
+contract MockTradeFactory {
+    mapping(address => mapping(address => mapping(address => bool)))
+        public enabled;
+
+    function enable(address _tokenIn, address _tokenOut) external {
+        enabled[msg.sender][_tokenIn][_tokenOut] = true;
+    }
+
+    function disable(address _tokenIn, address _tokenOut) external {
+        enabled[msg.sender][_tokenIn][_tokenOut] = false;
+    }
+}
+
+/// @notice Emits our factory's NewAutomatedVault event for any vault we like, so event consumers (eg, our
+///  indexer) can be tested without deploying a real factory.
+contract MockFactoryEvents {
+    event NewAutomatedVault(
+        uint256 indexed category,
+        address indexed lpToken,
+        address gauge,
+        address indexed vault,
+        address convexStrategy,
+        address curveStrategy,
+        address convexFraxStrategy
+    );
+
+    function announceVault(
+        uint256 _category,
+        address _lpToken,
+        address _gauge,
+        address _vault,
+        address _convexStrategy,
+        address _curveStrategy,
+        address _convexFraxStrategy
+    ) external {
+        emit NewAutomatedVault(
+            _category,
+            _lpToken,
+            _gauge,
+            _vault,
+            _convexStrategy,
+            _curveStrategy,
+            _convexFraxStrategy
+        );
+    }
+}
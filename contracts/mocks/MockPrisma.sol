@@ -0,0 +1,110 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.19;
+
+import "./MockERC20.sol";
+
+/// @notice Mock of a Prisma Convex receiver. yPRISMA, CRV and CVX accrue over time and are minted on claim.
+contract MockPrismaReceiver is MockRewardAccrual {
+    MockERC20 public immutable lpToken;
+    MockERC20 public immutable CRV;
+    MockERC20 public immutable CVX;
+    MockERC20 public immutable yPrisma;
+    address public immutable vault;
+
+    constructor(
+        MockERC20 _lpToken,
+        MockERC20 _crv,
+        MockERC20 _cvx,
+        MockERC20 _yPrisma,
+        address _vault
+    ) {
+        lpToken = _lpToken;
+        CRV = _crv;
+        CVX = _cvx;
+        yPrisma = _yPrisma;
+        vault = _vault;
+    }
+
+    // we pay out the same amount of each reward token
+    function claimableReward(
+        address _account
+    )
+        external
+        view
+        returns (uint256 prismaAmount, uint256 crvAmount, uint256 cvxAmount)
+    {
+        uint256 rewards = _earned(_account);
+        return (rewards, rewards, rewards);
+    }
+
+    function deposit(
+        address _receiver,
+        uint256 _amount
+    ) external returns (bool) {
+        lpToken.transferFrom(msg.sender, address(this), _amount);
+        _stake(_receiver, _amount);
+        return true;
+    }
+
+    function withdraw(
+        address _receiver,
+        uint256 _amount
+    ) external returns (bool) {
+        _unstake(msg.sender, _amount);
+        lpToken.transfer(_receiver, _amount);
+        return true;
+    }
+
+    // PRISMA rewards are locked as yPRISMA for our claimant in practice
+    function vaultClaimReward(address _claimant) external {
+        if (msg.sender != vault) revert();
+        uint256 rewards = _claim(_claimant);
+        if (rewards > 0) {
+            yPrisma.mint(_claimant, rewards);
+            CRV.mint(_claimant, rewards);
+            CVX.mint(_claimant, rewards);
+        }
+    }
+}
+
+/// @notice Mock of Prisma's vault, which we claim our receiver rewards through.
+contract MockPrismaVault {
+    // zero-initialized, so claims are max boosted by default
+    bool public boostExhausted;
+
+    function setBoostExhausted(bool _boostExhausted) external {
+        boostExhausted = _boostExhausted;
+    }
+
+    function getClaimableWithBoost(
+        address
+    ) external view returns (uint256 maxBoosted, uint256 boosted) {
+        if (!boostExhausted) {
+            maxBoosted = type(uint256).max;
+            boosted = type(uint256).max;
+        }
+    }
+
+    function batchClaimRewards(
+        address,
+        address,
+        address[] calldata _rewardContracts,
+        uint256
+    ) external returns (bool) {
+        for (uint256 i; i < _rewardContracts.length; ++i) {
+            MockPrismaReceiver(_rewardContracts[i]).vaultClaimReward(
+                msg.sender
+            );
+        }
+        return true;
+    }
+}
+
+/// @notice Mock of Prisma's Convex receiver factory.
+contract MockPrismaFactory {
+    mapping(uint256 => address) public getDeterministicAddress;
+
+    function setReceiver(uint256 _pid, address _receiver) external {
+        getDeterministicAddress[_pid] = _receiver;
+    }
+}
@@ -0,0 +1,171 @@
+"""
+Build a Safe MultiSend payload that brings our factory's strategies in line with the factory's current settings.
+
+    brownie run fleet_multisend --network mainnet
+
+CurveGlobal.applyToStrategies only reaches strategies whose vault hasn't accepted governance yet. Once ychad accepts,
+keeps and voters are governance only, so they have to come from the governance Safe itself. This compares every
+strategy's keeps, voters, health check and base fee oracle against our factory's and batches each setter needed into
+a single MultiSendCallOnly transaction, to be proposed from the Safe as a delegatecall.
+
+Set FLEET_FACTORY for a different factory. Strategies still governed by the factory and Prisma strategies (which the
+factory doesn't deploy) are skipped.
+"""
+import os
+
+from brownie import (
+    Contract,
+    CurveGlobal,
+    StrategyConvexFactoryClonable,
+    StrategyConvexFraxFactoryClonable,
+    StrategyCurveBoostedFactoryClonable,
+    interface,
+    multicall,
+)
+from scripts.trigger_simulator import CONVEX, CURVE, FRAX, get_factory_strategies
+
+FACTORY_ADDRESS = os.environ.get(
+    "FLEET_FACTORY", "0x21b1FC8A52f179757bf555346130bF27c0C2A17A"
+)
+
+# Safe's MultiSendCallOnly (v1.3.0), which only allows plain calls from within our batch
+MULTISEND_CALL_ONLY_ADDRESS = "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"
+MULTISEND_ABI = [
+    {
+        "inputs": [{"name": "transactions", "type": "bytes"}],
+        "name": "multiSend",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+ABIS = {
+    CONVEX: StrategyConvexFactoryClonable.abi,
+    CURVE: StrategyCurveBoostedFactoryClonable.abi,
+    FRAX: StrategyConvexFraxFactoryClonable.abi,
+}
+
+
+def encode_multisend(transactions):
+    """
+    Pack a list of (to, data) calls the way MultiSend expects them: operation (uint8, always a call), to (address),
+    value (uint256, always zero), data length (uint256) and data, back to back.
+    """
+    packed = b""
+    for to, data in transactions:
+        data = bytes.fromhex(data[2:]) if isinstance(data, str) else bytes(data)
+        packed += (
+            b"\x00"
+            + bytes.fromhex(str(to)[2:])
+            + (0).to_bytes(32, "big")
+            + len(data).to_bytes(32, "big")
+            + data
+        )
+    return packed
+
+
+def get_fleet_calls(factory, strategies):
+    """
+    Return (strategy, calldata) for every setter needed to match our factory's settings, for a list of (strategy
+    address, strategy type) pairs. Voters are always set before keeps, since our strategies won't keep without them.
+    """
+    strategies = [
+        (Contract.from_abi("Strategy", address, ABIS[strategy_type]), strategy_type)
+        for address, strategy_type in strategies
+        if strategy_type in ABIS
+    ]
+    with multicall:
+        settings = {
+            "health_check": factory.healthCheck(),
+            "base_fee_oracle": factory.baseFeeOracle(),
+            "keeps": [factory.keepCRV(), factory.keepCVX(), factory.keepFXS()],
+            "voters": [
+                factory.curveVoter(),
+                factory.convexVoter(),
+                factory.fraxVoter(),
+            ],
+        }
+        vaults = [strategy.vault() for strategy, _ in strategies]
+
+    vaults = [interface.IVaultFactory045(str(vault)) for vault in vaults]
+
+    # multicall results are only filled in once we leave our context, so hold on to them until then
+    reads = []
+    with multicall:
+        for (strategy, strategy_type), vault in zip(strategies, vaults):
+            read = {
+                "governance": vault.governance(),
+                "health_check": strategy.healthCheck(),
+                "base_fee_oracle": strategy.baseFeeOracle(),
+                "keeps": [strategy.localKeepCRV()],
+                "voters": [strategy.curveVoter()],
+            }
+            if strategy_type != CURVE:
+                read["keeps"].append(strategy.localKeepCVX())
+                read["voters"].append(strategy.convexVoter())
+            if strategy_type == FRAX:
+                read["keeps"].append(strategy.localKeepFXS())
+                read["voters"].append(strategy.fraxVoter())
+            reads.append(read)
+
+    calls = []
+    for (strategy, strategy_type), read in zip(strategies, reads):
+        # applyToStrategies still reaches these
+        if str(read["governance"]) == factory.address:
+            continue
+
+        if str(read["health_check"]) != str(settings["health_check"]):
+            calls.append(
+                (
+                    strategy,
+                    strategy.setHealthCheck.encode_input(settings["health_check"]),
+                )
+            )
+        if str(read["base_fee_oracle"]) != str(settings["base_fee_oracle"]):
+            calls.append(
+                (
+                    strategy,
+                    strategy.setBaseFeeOracle.encode_input(settings["base_fee_oracle"]),
+                )
+            )
+
+        # each strategy type only keeps the tokens it has voters for
+        count = len(read["keeps"])
+        keeps = [int(keep) for keep in settings["keeps"][:count]]
+        voters = [str(voter) for voter in settings["voters"][:count]]
+        current_keeps = [int(keep) for keep in read["keeps"]]
+        current_voters = [str(voter) for voter in read["voters"]]
+
+        # like our factory, we only need voters if we keep anything. our curve strategy deposits through its voter.
+        if current_voters != voters and (any(keeps) or strategy_type == CURVE):
+            if strategy_type == CURVE:
+                calls.append((strategy, strategy.setVoter.encode_input(*voters)))
+            else:
+                calls.append((strategy, strategy.setVoters.encode_input(*voters)))
+        if current_keeps != keeps:
+            if strategy_type == CURVE:
+                calls.append((strategy, strategy.setLocalKeepCrv.encode_input(*keeps)))
+            else:
+                calls.append((strategy, strategy.setLocalKeepCrvs.encode_input(*keeps)))
+
+    return calls
+
+
+def main():
+    factory = Contract.from_abi("CurveGlobal", FACTORY_ADDRESS, CurveGlobal.abi)
+    calls = get_fleet_calls(factory, get_factory_strategies(factory))
+    if not calls:
+        print("Every strategy already matches our factory's settings")
+        return
+
+    multisend = Contract.from_abi(
+        "MultiSendCallOnly", MULTISEND_CALL_ONLY_ADDRESS, MULTISEND_ABI
+    )
+    payload = multisend.multiSend.encode_input(encode_multisend(calls))
+    strategies = {strategy.address for strategy, _ in calls}
+    print(f"{len(calls)} calls on {len(strategies)} strategies\n")
+    print("Governance Safe transaction (operation 1, delegatecall)")
+    print(f"    to: {MULTISEND_CALL_ONLY_ADDRESS}")
+    print("    value: 0")
+    print(f"    data: {payload}")
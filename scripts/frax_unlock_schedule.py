@@ -0,0 +1,87 @@
+"""
+Print when the want in each of our factory's Frax strategies unlocks, to help plan debt ratio changes.
+
+    brownie run frax_unlock_schedule --network mainnet
+
+Set UNLOCK_FACTORY for a different factory. Vaults, their withdrawal queues and every strategy's unlockSchedule() are
+each read in a single batched multicall. Strategies without unlockSchedule() (non-Frax, or older Frax deployments) are
+skipped.
+"""
+import os
+from datetime import datetime, timezone
+
+from brownie import (
+    CurveGlobal,
+    Contract,
+    StrategyConvexFraxFactoryClonable,
+    chain,
+    interface,
+    multicall,
+)
+
+FACTORY_ADDRESS = os.environ.get(
+    "UNLOCK_FACTORY", "0x21b1FC8A52f179757bf555346130bF27c0C2A17A"
+)
+
+# max number of strategies a yearn vault may have in its withdrawal queue
+MAXIMUM_STRATEGIES = 20
+
+
+def get_frax_schedules(factory):
+    """Return {strategy address: (vault, decimals, unlock times, cumulative liquid want)} for our Frax strategies."""
+    num_vaults = factory.numVaults()
+    with multicall:
+        vaults = [factory.deployedVaults(i) for i in range(num_vaults)]
+
+    vaults = [interface.IVaultFactory045(str(vault)) for vault in vaults]
+    with multicall:
+        decimals = [vault.decimals() for vault in vaults]
+        queues = [
+            [vault.withdrawalQueue(i) for i in range(MAXIMUM_STRATEGIES)]
+            for vault in vaults
+        ]
+
+    strategies = []
+    for vault, vault_decimals, queue in zip(vaults, decimals, queues):
+        for strategy in queue:
+            # queues are padded with the zero address
+            if int(str(strategy), 16) == 0:
+                break
+            strategies.append((vault.address, int(vault_decimals), str(strategy)))
+
+    # calls that revert come back as None, so anything without unlockSchedule() drops out here
+    abi = StrategyConvexFraxFactoryClonable.abi
+    with multicall:
+        schedules = [
+            Contract.from_abi("FraxStrategy", strategy, abi).unlockSchedule()
+            for (_, _, strategy) in strategies
+        ]
+
+    return {
+        strategy: (vault, vault_decimals, list(schedule[0]), list(schedule[1]))
+        for (vault, vault_decimals, strategy), schedule in zip(strategies, schedules)
+        if schedule is not None
+    }
+
+
+def render(strategy, vault, decimals, unlock_times, cumulative_liquid, now):
+    lines = [f"Strategy {strategy} (vault {vault})"]
+    for unlock_time, liquid in zip(unlock_times, cumulative_liquid):
+        if unlock_time <= now:
+            when = "now"
+        else:
+            hours = (unlock_time - now) / 3600
+            date = datetime.fromtimestamp(unlock_time, timezone.utc)
+            when = f"{date:%Y-%m-%d %H:%M} UTC (in {hours:.1f} hours)"
+        lines.append(f"    {when}: {liquid / 10 ** decimals:,.4f} liquid")
+    return "\n".join(lines)
+
+
+def main():
+    factory = Contract.from_abi("CurveGlobal", FACTORY_ADDRESS, CurveGlobal.abi)
+    schedules = get_frax_schedules(factory)
+    now = chain.time()
+
+    print(f"Found {len(schedules)} Frax strategies with unlock schedules\n")
+    for strategy, schedule in schedules.items():
+        print(render(strategy, *schedule, now), "\n")
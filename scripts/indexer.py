@@ -0,0 +1,330 @@
+"""
+Index our factory's NewAutomatedVault events and the Harvested events of every factory strategy into SQLite.
+
+    brownie run indexer --network mainnet
+
+Set INDEXER_DB to choose the database file, INDEXER_FACTORY for a different factory, and INDEXER_START_BLOCK to
+skip blocks before our factory was deployed. Progress is checkpointed after every block range, so the indexer can
+be stopped and restarted at any time.
+"""
+import os
+import sqlite3
+
+from brownie import CurveGlobal, StrategyCurveBoostedFactoryClonable, chain, web3
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+from requests.exceptions import Timeout
+
+FACTORY_ADDRESS = "0x21b1FC8A52f179757bf555346130bF27c0C2A17A"
+
+# nodes cap how many addresses they accept in one filter
+MAX_ADDRESSES_PER_FILTER = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vaults (
+    block_number INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    category INTEGER NOT NULL,
+    lp_token TEXT NOT NULL,
+    gauge TEXT NOT NULL,
+    vault TEXT NOT NULL,
+    convex_strategy TEXT NOT NULL,
+    curve_strategy TEXT NOT NULL,
+    convex_frax_strategy TEXT NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS vaults_gauge ON vaults (gauge);
+CREATE INDEX IF NOT EXISTS vaults_vault ON vaults (vault);
+
+CREATE TABLE IF NOT EXISTS strategies (
+    strategy TEXT PRIMARY KEY,
+    vault TEXT NOT NULL,
+    gauge TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    block_number INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS strategies_vault ON strategies (vault);
+CREATE INDEX IF NOT EXISTS strategies_gauge ON strategies (gauge);
+
+CREATE TABLE IF NOT EXISTS harvests (
+    block_number INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    strategy TEXT NOT NULL,
+    profit TEXT NOT NULL,
+    loss TEXT NOT NULL,
+    debt_payment TEXT NOT NULL,
+    debt_outstanding TEXT NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS harvests_strategy ON harvests (strategy, block_number);
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+"""
+
+
+# how providers tell us a log query covered too many blocks or results, or took too long
+RANGE_ERROR_CODES = {-32005}
+RANGE_ERROR_MESSAGES = (
+    "more than",
+    "too large",
+    "too many",
+    "too wide",
+    "exceed",
+    "limit",
+    "timeout",
+    "timed out",
+)
+
+
+def _hex(value):
+    # web3 gives us HexBytes, but raw RPC responses may give us hex strings
+    if isinstance(value, str):
+        return value.lower() if value.startswith("0x") else "0x" + value.lower()
+    return "0x" + bytes(value).hex()
+
+
+def new_vault_event():
+    """CurveGlobal's NewAutomatedVault event, from our compiled ABI."""
+    return web3.eth.contract(abi=CurveGlobal.abi).events.NewAutomatedVault()
+
+
+def harvested_event():
+    """BaseStrategy's Harvested event, which all of our strategies share."""
+    return web3.eth.contract(
+        abi=StrategyCurveBoostedFactoryClonable.abi
+    ).events.Harvested()
+
+
+def _process_logs(event, logs):
+    # web3 v6 renamed processLog to process_log
+    process_log = getattr(event, "process_log", None) or event.processLog
+    return [process_log(log) for log in logs]
+
+
+def decode_new_vaults(logs):
+    """Decode raw NewAutomatedVault logs into rows for our vaults table."""
+    rows = []
+    for event in _process_logs(new_vault_event(), logs):
+        args = event["args"]
+        rows.append(
+            (
+                event["blockNumber"],
+                _hex(event["transactionHash"]),
+                event["logIndex"],
+                args["category"],
+                args["lpToken"],
+                args["gauge"],
+                args["vault"],
+                args["convexStrategy"],
+                args["curveStrategy"],
+                args["convexFraxStrategy"],
+            )
+        )
+    return rows
+
+
+def decode_harvests(logs):
+    """Decode raw Harvested logs into rows for our harvests table."""
+    rows = []
+    for event in _process_logs(harvested_event(), logs):
+        args = event["args"]
+        rows.append(
+            (
+                event["blockNumber"],
+                _hex(event["transactionHash"]),
+                event["logIndex"],
+                to_checksum_address(event["address"]),
+                str(args["profit"]),
+                str(args["loss"]),
+                str(args["debtPayment"]),
+                str(args["debtOutstanding"]),
+            )
+        )
+    return rows
+
+
+def is_range_error(error):
+    """Whether an error from eth_getLogs means our query was too big, so a smaller range may succeed."""
+    if isinstance(error, Timeout):
+        return True
+    if not isinstance(error, ValueError):
+        return False
+
+    # web3 raises the JSON-RPC error dict as our ValueError's only arg
+    details = error.args[0] if error.args else ""
+    if isinstance(details, dict):
+        if details.get("code") in RANGE_ERROR_CODES:
+            return True
+        details = details.get("message", "")
+    message = str(details).lower()
+
+    # being rate limited has nothing to do with our range, so don't shrink it
+    if "rate limit" in message or "too many requests" in message:
+        return False
+    return any(phrase in message for phrase in RANGE_ERROR_MESSAGES)
+
+
+class AdaptiveLogFetcher:
+    """
+    Pull logs over large block ranges, halving the range whenever the node refuses a request as too big (too many
+    results, response too large, timeout) and growing it again after each success. Any other error is raised.
+    """
+
+    def __init__(
+        self, get_logs, initial_range=50_000, min_range=1, max_range=1_000_000
+    ):
+        self.get_logs = get_logs
+        self.block_range = initial_range
+        self.min_range = min_range
+        self.max_range = max_range
+
+    def fetch(self, addresses, topics, from_block, to_block):
+        """Yield (last block covered, logs) for each successful range, in block order."""
+        start = from_block
+        while start <= to_block:
+            end = min(start + self.block_range - 1, to_block)
+            try:
+                logs = self.get_logs(
+                    {
+                        "address": addresses,
+                        "topics": topics,
+                        "fromBlock": start,
+                        "toBlock": end,
+                    }
+                )
+            except (ValueError, Timeout) as error:
+                if not is_range_error(error) or self.block_range <= self.min_range:
+                    raise
+                self.block_range = max(self.min_range, self.block_range // 2)
+                continue
+
+            yield end, logs
+            start = end + 1
+            self.block_range = min(self.max_range, self.block_range * 2)
+
+
+class FactoryIndexer:
+    """Keep an SQLite store of our factory's vaults and their strategies' harvests up to date."""
+
+    def __init__(
+        self,
+        db_path,
+        get_logs,
+        factory=FACTORY_ADDRESS,
+        start_block=0,
+        fetcher=None,
+    ):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+        self.factory = to_checksum_address(factory)
+        self.start_block = start_block
+        self.fetcher = fetcher or AdaptiveLogFetcher(get_logs)
+        self.new_vault_topic = _hex(event_abi_to_log_topic(new_vault_event().abi))
+        self.harvested_topic = _hex(event_abi_to_log_topic(harvested_event().abi))
+
+    def checkpoint(self, name):
+        """Last block we have fully indexed for a given checkpoint, or None if we haven't started."""
+        row = self.db.execute(
+            "SELECT block_number FROM checkpoints WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_checkpoint(self, name, block_number):
+        self.db.execute(
+            "INSERT OR REPLACE INTO checkpoints (name, block_number) VALUES (?, ?)",
+            (name, block_number),
+        )
+
+    def _next_block(self, name):
+        last = self.checkpoint(name)
+        return self.start_block if last is None else last + 1
+
+    def strategies(self):
+        """All factory strategies we know about."""
+        return [row[0] for row in self.db.execute("SELECT strategy FROM strategies")]
+
+    def index_vaults(self, to_block):
+        """Index NewAutomatedVault events (and the strategies they create) up to to_block."""
+        for end, logs in self.fetcher.fetch(
+            self.factory, [self.new_vault_topic], self._next_block("vaults"), to_block
+        ):
+            rows = decode_new_vaults(logs)
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO vaults VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                for row in rows:
+                    block_number, gauge, vault = row[0], row[5], row[6]
+                    for kind, strategy in zip(
+                        ("convex", "curve", "convex_frax"), row[7:]
+                    ):
+                        if int(strategy, 16) == 0:
+                            continue
+                        self.db.execute(
+                            "INSERT OR IGNORE INTO strategies VALUES (?, ?, ?, ?, ?)",
+                            (strategy, vault, gauge, kind, block_number),
+                        )
+                self._set_checkpoint("vaults", end)
+
+    def index_harvests(self, to_block):
+        """Index Harvested events from all known factory strategies up to to_block."""
+        # make sure we know every strategy that could have harvested by to_block first
+        vaults_checkpoint = self.checkpoint("vaults")
+        if vaults_checkpoint is None or vaults_checkpoint < to_block:
+            raise ValueError("Index vaults up to to_block before indexing harvests")
+
+        from_block = self._next_block("harvests")
+        if from_block > to_block:
+            return
+
+        strategies = self.strategies()
+        if not strategies:
+            with self.db:
+                self._set_checkpoint("harvests", to_block)
+            return
+
+        # our checkpoint only moves once every group of strategies has been covered
+        groups = [
+            strategies[i : i + MAX_ADDRESSES_PER_FILTER]
+            for i in range(0, len(strategies), MAX_ADDRESSES_PER_FILTER)
+        ]
+        for group in groups:
+            for _, logs in self.fetcher.fetch(
+                group, [self.harvested_topic], from_block, to_block
+            ):
+                with self.db:
+                    self.db.executemany(
+                        "INSERT OR IGNORE INTO harvests VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        decode_harvests(logs),
+                    )
+        with self.db:
+            self._set_checkpoint("harvests", to_block)
+
+    def run(self, to_block):
+        """Bring both our vaults and harvests up to to_block."""
+        self.index_vaults(to_block)
+        self.index_harvests(to_block)
+
+
+def main():
+    db_path = os.environ.get("INDEXER_DB", "factory_events.db")
+    factory = os.environ.get("INDEXER_FACTORY", FACTORY_ADDRESS)
+    start_block = int(os.environ.get("INDEXER_START_BLOCK", 0))
+
+    # stay a few blocks behind the tip so we don't index anything that gets reorged out
+    to_block = chain.height - 5
+
+    indexer = FactoryIndexer(db_path, web3.eth.get_logs, factory, start_block)
+    indexer.run(to_block)
+
+    num_vaults = indexer.db.execute("SELECT COUNT(*) FROM vaults").fetchone()[0]
+    num_harvests = indexer.db.execute("SELECT COUNT(*) FROM harvests").fetchone()[0]
+    print(
+        f"Indexed to block {to_block}: {num_vaults} vaults, {len(indexer.strategies())} strategies, "
+        f"{num_harvests} harvests"
+    )
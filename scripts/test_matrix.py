@@ -0,0 +1,125 @@
+"""
+Run our test suite against every strategy target in tests/conftest.py at once, each on its own anvil fork.
+
+    python scripts/test_matrix.py
+    python scripts/test_matrix.py -t convex frax -- tests/strategies/test_simple_harvest.py -s
+
+Anything after -- is passed straight to brownie test. Each target gets its own brownie network (and so its own anvil
+instance and port), and its output is written to matrix_logs/<target>.log. Exits nonzero if any target fails.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+LOG_DIR = ROOT / "matrix_logs"
+
+# must match the keys of strategy_targets in tests/conftest.py
+TARGETS = ["convex", "curve", "prisma_convex", "frax"]
+
+# first port we hand out, one per target after that. our default fork network uses 8545.
+BASE_PORT = 8546
+
+
+def network_id(target):
+    return f"mainnet-anvil-fork-{target}"
+
+
+def add_network(target, port, fork):
+    # brownie won't overwrite a network, so clear out any left over from a previous run first
+    subprocess.run(
+        ["brownie", "networks", "delete", network_id(target)],
+        cwd=ROOT,
+        capture_output=True,
+    )
+    subprocess.run(
+        [
+            "brownie",
+            "networks",
+            "add",
+            "development",
+            network_id(target),
+            "cmd=anvil",
+            "host=http://127.0.0.1",
+            f"port={port}",
+            f"fork={fork}",
+            "accounts=10",
+            "mnemonic=brownie",
+            "timeout=120",
+        ],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+    )
+
+
+def run_target(target, pytest_args):
+    env = dict(os.environ, STRATEGY_TARGET=target)
+    log_path = LOG_DIR / f"{target}.log"
+    start = time.perf_counter()
+    with open(log_path, "w") as log:
+        result = subprocess.run(
+            ["brownie", "test", *pytest_args, "--network", network_id(target)],
+            cwd=ROOT,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    return target, result.returncode, time.perf_counter() - start
+
+
+def main():
+    args = sys.argv[1:]
+    pytest_args = []
+    if "--" in args:
+        split = args.index("--")
+        args, pytest_args = args[:split], args[split + 1 :]
+
+    parser = argparse.ArgumentParser(
+        description="Run the test suite for each strategy target in parallel"
+    )
+    parser.add_argument("-t", "--targets", nargs="+", choices=TARGETS, default=TARGETS)
+    parser.add_argument(
+        "--fork", default="mainnet", help="fork passed to anvil, a network or RPC url"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="max targets to run at once, defaults to one per core",
+    )
+    options = parser.parse_args(args)
+
+    targets = options.targets
+    workers = options.workers or min(len(targets), os.cpu_count() or 1)
+
+    # compile once up front so our workers don't race each other writing build artifacts
+    subprocess.run(["brownie", "compile"], cwd=ROOT, check=True)
+    for i, target in enumerate(targets):
+        add_network(target, BASE_PORT + i, options.fork)
+
+    LOG_DIR.mkdir(exist_ok=True)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(lambda target: run_target(target, pytest_args), targets)
+        )
+    elapsed = time.perf_counter() - start
+
+    failed = False
+    for target, returncode, duration in results:
+        status = "passed" if returncode == 0 else f"FAILED ({returncode})"
+        print(f"{target:<16} {status:<12} {duration:8.1f}s  {LOG_DIR / target}.log")
+        failed = failed or returncode != 0
+    print(f"\n{len(targets)} targets on {workers} workers in {elapsed:.1f}s")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
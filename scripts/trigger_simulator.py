@@ -0,0 +1,310 @@
+"""
+Simulate harvestTrigger for many strategies at once, without touching a node.
+
+    brownie run trigger_simulator --network mainnet
+
+snapshot() reads everything our triggers look at for every strategy in a few batched multicalls. simulate() then
+evaluates every trigger at once with NumPy, branch for branch with each strategy type's harvestTrigger, and says which
+branch decided each one. A snapshot is just a dict of arrays, so any column (claimable profit, base fee, timestamps)
+can be swapped or broadcast to sweep thousands of scenarios without another RPC call.
+
+Set TRIGGER_FACTORY for a different factory.
+"""
+import os
+
+import numpy as np
+from brownie import (
+    Contract,
+    CurveGlobal,
+    StrategyConvexFactoryClonable,
+    StrategyConvexFraxFactoryClonable,
+    StrategyCurveBoostedFactoryClonable,
+    StrategyPrismaConvexFactoryClonable,
+    chain,
+    interface,
+    multicall,
+)
+
+FACTORY_ADDRESS = os.environ.get(
+    "TRIGGER_FACTORY", "0x21b1FC8A52f179757bf555346130bF27c0C2A17A"
+)
+
+# max number of strategies a yearn vault may have in its withdrawal queue
+MAXIMUM_STRATEGIES = 20
+
+# our strategy types, numbered the same as which_strategy in our tests
+CONVEX = 0
+CURVE = 1
+PRISMA_CONVEX = 2
+FRAX = 4
+
+# each strategy's name() starts with one of these
+NAME_PREFIXES = {
+    "StrategyConvexFactory-": CONVEX,
+    "StrategyCurveBoostedFactory-": CURVE,
+    "StrategyPrismaConvexFactory-": PRISMA_CONVEX,
+    "StrategyConvexFraxFactory-": FRAX,
+}
+
+# every branch a trigger can be decided by, and whether that branch means we harvest
+REASONS = {
+    "inactive": False,
+    "needs_earmark": False,
+    "max_profit": True,
+    "base_fee": False,
+    "force": True,
+    "min_profit": True,
+    "max_delay": True,
+    "min_delay": True,
+    "credit": True,
+    "loose_want": True,
+    "none": False,
+}
+REASON_NAMES = np.array(list(REASONS))
+REASON_CODES = {reason: code for code, reason in enumerate(REASONS)}
+REASON_HARVESTS = np.array(list(REASONS.values()))
+
+# the branches each strategy type's harvestTrigger checks, in order. the first one that's true decides.
+BRANCHES = {
+    CONVEX: [
+        "inactive",
+        "needs_earmark",
+        "max_profit",
+        "base_fee",
+        "force",
+        "min_profit",
+        "max_delay",
+        "credit",
+    ],
+    CURVE: ["inactive", "max_delay", "base_fee", "force", "min_delay", "credit"],
+    PRISMA_CONVEX: [
+        "inactive",
+        "max_profit",
+        "base_fee",
+        "force",
+        "min_profit",
+        "max_delay",
+        "credit",
+    ],
+    FRAX: [
+        "inactive",
+        "max_profit",
+        "base_fee",
+        "force",
+        "min_profit",
+        "max_delay",
+        "credit",
+        "loose_want",
+    ],
+}
+
+# every column in a snapshot and its dtype. all numbers are float64, since 18-decimal amounts don't fit in int64.
+# anything below 2**53 (timestamps, delays, USDC profits) is still compared exactly.
+FIELDS = {
+    "strategy_type": np.int64,
+    "is_active": bool,
+    "check_earmark": bool,
+    "needs_earmark": bool,
+    "claimable_profit": np.float64,
+    "harvest_profit_min": np.float64,
+    "harvest_profit_max": np.float64,
+    "base_fee_acceptable": bool,
+    "force_harvest": bool,
+    "last_report": np.float64,
+    "min_report_delay": np.float64,
+    "max_report_delay": np.float64,
+    "credit_available": np.float64,
+    "credit_threshold": np.float64,
+    "should_claim_rewards": bool,
+    "force_claim_once": bool,
+    "claims_max_boosted": bool,
+    "loose_want": np.float64,
+    "min_deposit": np.float64,
+}
+
+
+def make_state(rows):
+    """Build a snapshot from a list of dicts, one per strategy. Missing fields default to zero or False."""
+    return {
+        field: np.array([row.get(field, 0) for row in rows], dtype=dtype)
+        for field, dtype in FIELDS.items()
+    }
+
+
+def _conditions(state, now):
+    # when each branch would be true, for every strategy in our snapshot
+    age = now - state["last_report"]
+    profit = state["claimable_profit"]
+    conditions = {
+        "inactive": ~state["is_active"],
+        "needs_earmark": state["check_earmark"] & state["needs_earmark"],
+        "max_profit": profit > state["harvest_profit_max"],
+        "base_fee": ~state["base_fee_acceptable"],
+        "force": state["force_harvest"],
+        "min_profit": profit > state["harvest_profit_min"],
+        "max_delay": age > state["max_report_delay"],
+        "min_delay": age > state["min_report_delay"],
+        "credit": state["credit_available"] > state["credit_threshold"],
+        "loose_want": (state["loose_want"] > state["min_deposit"])
+        & (age > state["min_report_delay"]),
+    }
+
+    # prisma only harvests for profit if we claim rewards, and only waits out max boost if we must
+    can_claim = state["should_claim_rewards"]
+    boosted = state["claims_max_boosted"] | state["force_claim_once"]
+    prisma = dict(conditions)
+    prisma["max_profit"] = conditions["max_profit"] & can_claim
+    prisma["min_profit"] = conditions["min_profit"] & can_claim & boosted
+    prisma["max_delay"] = conditions["max_delay"] & boosted
+    return {
+        strategy_type: prisma if strategy_type == PRISMA_CONVEX else conditions
+        for strategy_type in BRANCHES
+    }
+
+
+def simulate(state, now):
+    """
+    Evaluate harvestTrigger for every strategy in a snapshot as of a given timestamp.
+
+    Returns a bool array of whether each strategy would trigger, and an array of the branch (see REASONS) that
+    decided it.
+    """
+    strategy_types = state["strategy_type"]
+    unknown = set(np.unique(strategy_types).tolist()) - set(BRANCHES)
+    if unknown:
+        raise ValueError(f"unknown strategy types: {sorted(unknown)}")
+
+    codes = np.full(len(strategy_types), REASON_CODES["none"])
+    conditions = _conditions(state, now)
+    for strategy_type, branches in BRANCHES.items():
+        mask = strategy_types == strategy_type
+        if not mask.any():
+            continue
+        codes[mask] = np.select(
+            [conditions[strategy_type][branch][mask] for branch in branches],
+            [REASON_CODES[branch] for branch in branches],
+            default=REASON_CODES["none"],
+        )
+
+    return REASON_HARVESTS[codes], REASON_NAMES[codes]
+
+
+def snapshot(strategies):
+    """
+    Read everything harvestTrigger looks at for a list of (strategy address, strategy type) pairs, in batched
+    multicalls. Returns our snapshot and the timestamp it should be simulated at.
+    """
+    abis = {
+        CONVEX: StrategyConvexFactoryClonable.abi,
+        CURVE: StrategyCurveBoostedFactoryClonable.abi,
+        PRISMA_CONVEX: StrategyPrismaConvexFactoryClonable.abi,
+        FRAX: StrategyConvexFraxFactoryClonable.abi,
+    }
+    contracts = [
+        (Contract.from_abi("Strategy", address, abis[strategy_type]), strategy_type)
+        for address, strategy_type in strategies
+    ]
+    with multicall:
+        vaults = [strategy.vault() for strategy, _ in contracts]
+    vaults = [interface.IVaultFactory045(str(vault)) for vault in vaults]
+
+    # multicall results are only filled in once we leave our context, so hold on to them until then
+    calls = []
+    with multicall:
+        for (strategy, strategy_type), vault in zip(contracts, vaults):
+            call = {
+                "is_active": strategy.isActive(),
+                "base_fee_acceptable": strategy.isBaseFeeAcceptable(),
+                "force_harvest": strategy.forceHarvestTriggerOnce(),
+                "min_report_delay": strategy.minReportDelay(),
+                "max_report_delay": strategy.maxReportDelay(),
+                "credit_threshold": strategy.creditThreshold(),
+                "params": vault.strategies(strategy),
+                "credit_available": vault.creditAvailable(strategy),
+            }
+            if strategy_type != CURVE:
+                call["claimable_profit"] = strategy.claimableProfitInUsdc()
+                call["harvest_profit_min"] = strategy.harvestProfitMinInUsdc()
+                call["harvest_profit_max"] = strategy.harvestProfitMaxInUsdc()
+            if strategy_type == CONVEX:
+                call["check_earmark"] = strategy.checkEarmark()
+                call["needs_earmark"] = strategy.needsEarmarkReward()
+            elif strategy_type == PRISMA_CONVEX:
+                call["claim_params"] = strategy.claimParams()
+                call["claims_max_boosted"] = strategy.claimsAreMaxBoosted()
+            elif strategy_type == FRAX:
+                call["loose_want"] = strategy.balanceOfWant()
+                call["deposit_info"] = strategy.depositInfo()
+            calls.append(call)
+
+    rows = []
+    for (_, strategy_type), call in zip(contracts, calls):
+        row = {
+            field: value
+            for field, value in call.items()
+            if field not in ("params", "claim_params", "deposit_info")
+        }
+        row["strategy_type"] = strategy_type
+        row["last_report"] = call["params"]["lastReport"]
+        if "claim_params" in call:
+            row["force_claim_once"] = call["claim_params"][0]
+            row["should_claim_rewards"] = call["claim_params"][1]
+        if "deposit_info" in call:
+            row["min_deposit"] = call["deposit_info"][0]
+        rows.append(row)
+
+    return make_state(rows), chain.time()
+
+
+def get_factory_strategies(factory):
+    """Return (strategy address, strategy type) for every strategy attached to one of our factory's vaults."""
+    num_vaults = factory.numVaults()
+    with multicall:
+        vaults = [factory.deployedVaults(i) for i in range(num_vaults)]
+
+    vaults = [interface.IVaultFactory045(str(vault)) for vault in vaults]
+    with multicall:
+        queues = [
+            [vault.withdrawalQueue(i) for i in range(MAXIMUM_STRATEGIES)]
+            for vault in vaults
+        ]
+
+    addresses = []
+    for queue in queues:
+        for strategy in queue:
+            # queues are padded with the zero address
+            if int(str(strategy), 16) == 0:
+                break
+            addresses.append(str(strategy))
+
+    # any strategy has name(), and it tells us which type we have. others (revert as None) are skipped.
+    abi = StrategyConvexFactoryClonable.abi
+    with multicall:
+        names = [
+            Contract.from_abi("Strategy", address, abi).name() for address in addresses
+        ]
+
+    strategies = []
+    for address, name in zip(addresses, names):
+        for prefix, strategy_type in NAME_PREFIXES.items():
+            if name is not None and str(name).startswith(prefix):
+                strategies.append((address, strategy_type))
+                break
+    return strategies
+
+
+def main():
+    factory = Contract.from_abi("CurveGlobal", FACTORY_ADDRESS, CurveGlobal.abi)
+    strategies = get_factory_strategies(factory)
+    state, now = snapshot(strategies)
+    harvest, reasons = simulate(state, now)
+
+    print(f"{harvest.sum()} of {len(strategies)} strategies would harvest now\n")
+    for (address, _), triggered, reason in zip(strategies, harvest, reasons):
+        if triggered:
+            print(f"    {address}: {reason}")
+
+    # the same snapshot if gas were cheap, without another RPC call
+    cheap_gas = dict(state, base_fee_acceptable=np.ones_like(harvest))
+    cheap_harvest, _ = simulate(cheap_gas, now)
+    print(f"\n{cheap_harvest.sum()} would harvest with an acceptable base fee")
@@ -0,0 +1,236 @@
+"""
+Gas benchmarks for harvestTrigger, harvests (prepareReturn and adjustPosition) and withdrawals (liquidatePosition) for
+each strategy type, run against our mock protocol contracts so the numbers are reproducible.
+
+    USE_MOCKS=1 STRATEGY_TARGET=frax brownie test tests/benchmarks -s --network anvil
+
+Each run writes its results to benchmark_results/<strategy type>.json. A case fails if it uses more than GAS_TOLERANCE
+(default 5%) more gas than its entry in gas_baseline.json, or if its strategy type has baselines but none for this case.
+Strategy types with no baselines at all are skipped, or fail with GAS_BASELINE_STRICT=1. Run with UPDATE_GAS_BASELINE=1
+to record new baselines, and commit gas_baseline.json with them.
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from utils import advance_chain
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("USE_MOCKS") != "1",
+    reason="gas benchmarks only run against our mock protocol (USE_MOCKS=1)",
+)
+
+BASELINE_PATH = Path(__file__).parent / "gas_baseline.json"
+RESULTS_DIR = Path(__file__).resolve().parents[2] / "benchmark_results"
+GAS_TOLERANCE = float(os.environ.get("GAS_TOLERANCE", "0.05"))
+UPDATE_BASELINE = os.environ.get("UPDATE_GAS_BASELINE") == "1"
+STRICT_BASELINE = os.environ.get("GAS_BASELINE_STRICT") == "1"
+
+STRATEGY_TYPES = {
+    0: "convex",
+    1: "curve",
+    2: "prisma_convex",
+    3: "prisma_curve",
+    4: "frax",
+}
+
+# how many keks we benchmark frax with, up to our strategy's default maxKeks
+FRAX_KEK_COUNTS = [1, 2, 3, 4, 5]
+
+
+def read_baseline():
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+@pytest.fixture(scope="session")
+def gas_results(which_strategy):
+    results = {}
+    yield results
+
+    strategy_type = STRATEGY_TYPES[which_strategy]
+    RESULTS_DIR.mkdir(exist_ok=True)
+    (RESULTS_DIR / f"{strategy_type}.json").write_text(
+        json.dumps(results, indent=2, sort_keys=True) + "\n"
+    )
+
+    if UPDATE_BASELINE:
+        baseline = read_baseline()
+        baseline.setdefault(strategy_type, {}).update(
+            {case: result["gas"] for case, result in results.items()}
+        )
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+# send a transaction (or estimate a view), record its gas and latency, and check it against our baseline
+@pytest.fixture
+def record_gas(gas_results, which_strategy):
+    strategy_type = STRATEGY_TYPES[which_strategy]
+    baseline = read_baseline().get(strategy_type, {})
+
+    # nothing to compare against until this strategy type's baselines are recorded
+    if not baseline and not UPDATE_BASELINE:
+        message = f"no gas baselines for {strategy_type}, record them with UPDATE_GAS_BASELINE=1"
+        if STRICT_BASELINE:
+            pytest.fail(message)
+        pytest.skip(message)
+
+    def record(case, send):
+        start = time.perf_counter()
+        tx = send()
+        seconds = time.perf_counter() - start
+
+        # views only give us a gas estimate
+        gas_used = tx if isinstance(tx, int) else tx.gas_used
+        gas_results[case] = {"gas": gas_used, "seconds": round(seconds, 4)}
+        print(f"{case}: {gas_used} gas, {seconds:.3f}s")
+
+        # a new case without a baseline can't be checked, so don't let it pass silently
+        if not UPDATE_BASELINE:
+            expected = baseline.get(case)
+            assert expected is not None, (
+                f"{case} has no baseline for {strategy_type}, "
+                "record one with UPDATE_GAS_BASELINE=1"
+            )
+            assert gas_used <= expected * (
+                1 + GAS_TOLERANCE
+            ), f"{case} used {gas_used} gas, over our baseline of {expected}"
+        return tx
+
+    yield record
+
+
+def deposit(vault, token, whale, amount):
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+
+
+def test_harvest_gas(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    which_strategy,
+    record_gas,
+):
+    # our first harvest only deposits, and our second also claims and reports rewards
+    deposit(vault, token, whale, amount)
+    record_gas("cold_harvest", lambda: strategy.harvest({"from": gov}))
+    advance_chain(sleep_time)
+    record_gas("warm_harvest", lambda: strategy.harvest({"from": gov}))
+
+    # frax LPs need to unlock before we can withdraw them
+    if which_strategy == 4:
+        advance_chain(86400 * 7)
+
+    record_gas("withdraw", lambda: vault.withdraw(amount // 2, {"from": whale}))
+
+
+def test_harvest_trigger_gas(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    record_gas,
+):
+    # with profit waiting, our trigger reads all of its config before it returns
+    deposit(vault, token, whale, amount)
+    strategy.harvest({"from": gov})
+    advance_chain(sleep_time)
+    record_gas("harvest_trigger", lambda: strategy.harvestTrigger.estimate_gas(0))
+
+
+def test_harvest_gas_keep_rewards(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    which_strategy,
+    record_gas,
+):
+    # send 10% of each reward token to our voters
+    if which_strategy == 1:
+        strategy.setVoter(gov, {"from": gov})
+        strategy.setLocalKeepCrv(1_000, {"from": gov})
+    elif which_strategy == 0:
+        strategy.setVoters(gov, gov, {"from": gov})
+        strategy.setLocalKeepCrvs(1_000, 1_000, {"from": gov})
+    else:
+        strategy.setVoters(gov, gov, gov, {"from": gov})
+        strategy.setLocalKeepCrvs(1_000, 1_000, 1_000, {"from": gov})
+
+    deposit(vault, token, whale, amount)
+    strategy.harvest({"from": gov})
+    advance_chain(sleep_time)
+    record_gas("keep_rewards_harvest", lambda: strategy.harvest({"from": gov}))
+
+
+def test_harvest_gas_extra_rewards(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    which_strategy,
+    rewards_token,
+    new_proxy,
+    record_gas,
+):
+    # our mocks only pay out extra rewards through our curve strategy proxy
+    if which_strategy != 1:
+        pytest.skip("our mock protocol only has extra rewards for curve strategies")
+
+    strategy.updateRewards([rewards_token], {"from": gov})
+    new_proxy.approveRewardToken(rewards_token, {"from": gov})
+
+    deposit(vault, token, whale, amount)
+    strategy.harvest({"from": gov})
+    advance_chain(sleep_time)
+    record_gas("extra_rewards_harvest", lambda: strategy.harvest({"from": gov}))
+
+
+@pytest.mark.parametrize("keks", FRAX_KEK_COUNTS)
+def test_harvest_gas_frax_keks(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    which_strategy,
+    keks,
+    record_gas,
+):
+    if which_strategy != 4:
+        pytest.skip("kek benchmarks are only for frax strategies")
+
+    # split our deposit evenly into new keks, one per harvest, leaving no dust to start another
+    kek_size = amount // keks
+    strategy.setDepositParams(1, kek_size, False, {"from": gov})
+    deposit(vault, token, whale, kek_size * keks)
+    for _ in range(keks):
+        strategy.harvest({"from": gov})
+        advance_chain(1)
+    assert strategy.kekInfo()["nextKek"] == keks
+
+    advance_chain(sleep_time)
+    record_gas(f"keks_{keks}_harvest", lambda: strategy.harvest({"from": gov}))
+
+    # once everything unlocks, withdraw it all so we hit every kek
+    advance_chain(86400 * 7)
+    record_gas(f"keks_{keks}_withdraw", lambda: vault.withdraw({"from": whale}))
@@ -14,6 +14,17 @@ def isolate(fn_isolation):
 # note that for curve factory we should use tenderly with 2/3 factory tests
 use_tenderly = False
 
+# set this to test against our mock protocol contracts on a bare local chain instead of a fork (tests/mock_fixtures.py)
+# USE_MOCKS=1 brownie test tests/strategies --network anvil
+use_mocks = os.environ.get("USE_MOCKS") == "1"
+
+# set this to cache the mainnet state our fork pulls in, so repeat runs at the same fork block skip those RPC calls
+# (tests/fork_cache.py). pin the fork block, or every run is a cache miss.
+# FORK_CACHE=1 brownie test -s
+use_fork_cache = (
+    os.environ.get("FORK_CACHE") == "1" and not use_mocks and not use_tenderly
+)
+
 # tests to run; last 4 should be done with pool that we don't have a vault for yet, and also need tenderly
 # brownie test -s
 # brownie test tests/factory/test_curve_global.py::test_vault_deployment -s --gas
@@ -25,6 +36,51 @@ use_tenderly = False
 # use this to set what chain we use. 1 for ETH, 250 for fantom, 10 optimism, 42161 arbitrum
 chain_used = 1
 
+# strategy targets we can test, with a pool, whales, and amounts that work for each. pick one with the STRATEGY_TARGET
+# env var, or test all of them at once with scripts/test_matrix.py (python scripts/test_matrix.py -- -s)
+strategy_targets = {
+    # eUSD-FRAXBP, has a frax pool so we can test all three curve factory strategies on it
+    "convex": {
+        "which_strategy": 0,
+        "pid": 156,
+        "whale": "0x8605dc0C339a2e7e85EEA043bD29d42DA2c6D784",
+        "amount": 5_000,
+        "profit_whale": "0xf83deAdE1b0D2AfF07700C548a54700a082388bE",
+        "profit_amount": 25,
+    },
+    "curve": {
+        "which_strategy": 1,
+        "pid": 156,
+        "whale": "0x8605dc0C339a2e7e85EEA043bD29d42DA2c6D784",
+        "amount": 5_000,
+        "profit_whale": "0xf83deAdE1b0D2AfF07700C548a54700a082388bE",
+        "profit_amount": 25,
+    },
+    # cvxPRISMA LP
+    "prisma_convex": {
+        "which_strategy": 2,
+        "pid": 258,
+        "whale": "0x13E58C7b1147385D735a06D14F0456E54C2dEBC8",
+        "amount": 100_000,
+        "profit_whale": "0x154001A2F9f816389b2F6D9E07563cE0359D813D",
+        "profit_amount": 100,
+    },
+    "frax": {
+        "which_strategy": 4,
+        "pid": 156,
+        "whale": "0x8605dc0C339a2e7e85EEA043bD29d42DA2c6D784",
+        "amount": 5_000,
+        "profit_whale": "0xf83deAdE1b0D2AfF07700C548a54700a082388bE",
+        "profit_amount": 25,
+    },
+}
+target_name = os.environ.get("STRATEGY_TARGET", "prisma_convex")
+if target_name not in strategy_targets:
+    raise ValueError(
+        f"Unknown STRATEGY_TARGET {target_name}, must be one of {list(strategy_targets)}"
+    )
+strategy_target = strategy_targets[target_name]
+
 
 ################################################## TENDERLY DEBUGGING ##################################################
 
@@ -58,6 +114,32 @@ def tenderly_fork(web3, chain):
     )
 
 
+################################################## FORK STATE CACHE ##################################################
+
+
+@pytest.fixture(scope="session", autouse=use_fork_cache)
+def fork_state_cache(web3, chain, accounts):
+    import fork_cache
+
+    fork = fork_cache.fork_info(web3)
+    if fork is None:
+        print("Not on an anvil fork, skipping our fork state cache")
+        yield
+        return
+
+    # anvil funds our dev accounts, so never cache or load their mainnet state
+    fork_url, fork_block = fork
+    dev_accounts = [account.address for account in accounts]
+    cached = fork_cache.load(web3, chain.id, fork_block, dev_accounts)
+    if cached is not None:
+        print("Loaded cached fork state for block", fork_block)
+
+    # add anything our tests touched that we didn't have cached yet once they're done
+    yield
+    digest = fork_cache.save(web3, fork_url, chain.id, fork_block, cached, dev_accounts)
+    print("Cached fork state for block", fork_block, "as", digest)
+
+
 ################################################ UPDATE THINGS BELOW HERE ################################################
 
 #################### FIXTURES BELOW NEED TO BE ADJUSTED FOR THIS REPO ####################
@@ -74,7 +156,7 @@ def whale(accounts, amount, token):
     # Totally in it for the tech
     # Update this with a large holder of your want token (the largest EOA holder of LP)
     # use the FRAX-USDC pool for now
-    whale = accounts.at("0x13E58C7b1147385D735a06D14F0456E54C2dEBC8", force=True)
+    whale = accounts.at(strategy_target["whale"], force=True)
     # yPRISMA-f LP (gauge) 0xf1ce237a1E1a88F6e289CD7998A826138AEB30b0, cvxPRISMA gauge: 0x13E58C7b1147385D735a06D14F0456E54C2dEBC8
     # cvxCRV new gauge (already deployed, only use for strategy testing): 0xfB18127c1471131468a1AaD4785c19678e521D86, 47m tokens,
     # stETH: 0x65eaB5eC71ceC12f38829Fbb14C98ce4baD28C46, 1700 tokens, frax-usdc: 0xE57180685E3348589E9521aa53Af0BCD497E884d, DOLA pool, 23.6m tokens,
@@ -92,7 +174,7 @@ def whale(accounts, amount, token):
 @pytest.fixture(scope="session")
 def amount(token):
     amount = (
-        100_000 * 10 ** token.decimals()
+        strategy_target["amount"] * 10 ** token.decimals()
     )  # 500k for cvxCRV, 300 for stETH, 50k for frax-usdc, 5k for frxETH, 5 eCFX, 5_000 eUSD-FRAXBP, 10_000 crvUSD-FRAX, 100 frxETH-ng, 5000 yPRISMA, 100k cvxPRISMA
     yield amount
 
@@ -100,7 +182,7 @@ def amount(token):
 @pytest.fixture(scope="session")
 def profit_whale(accounts, profit_amount, token):
     # ideally not the same whale as the main whale, or else they will lose money
-    profit_whale = accounts.at("0x154001A2F9f816389b2F6D9E07563cE0359D813D", force=True)
+    profit_whale = accounts.at(strategy_target["profit_whale"], force=True)
     # 0x109B3C39d675A2FF16354E116d080B94d238a7c9 (only use for strategy testing), new cvxCRV 5100 tokens, stETH: 0x82a7E64cdCaEdc0220D0a4eB49fDc2Fe8230087A, 500 tokens
     # frax-usdc 0x8fdb0bB9365a46B145Db80D0B1C5C5e979C84190, BUSD pool, 17m tokens, 0x38a93e70b0D8343657f802C1c3Fdb06aC8F8fe99 frxETH 28 tokens
     # eCFX 0xeCb456EA5365865EbAb8a2661B0c503410e9B347 (only use for factory deployment testing), 0xf83deAdE1b0D2AfF07700C548a54700a082388bE eUSD-FRAXBP 188
@@ -116,7 +198,7 @@ def profit_whale(accounts, profit_amount, token):
 @pytest.fixture(scope="session")
 def profit_amount(token):
     profit_amount = (
-        100 * 10 ** token.decimals()
+        strategy_target["profit_amount"] * 10 ** token.decimals()
     )  # 1k for FRAX-USDC, 2 for stETH, 100 for cvxCRV, 4 for frxETH, 1 eCFX, 25 for eUSD, 50 crvUSD-FRAX, 1 frxETH-ng, 25 yPRISMA, 100 cvxPRISMA
     yield profit_amount
 
@@ -493,8 +575,9 @@ def strategy(
 # if you change this, make sure to update addresses/values below too
 @pytest.fixture(scope="session")
 def pid():
-    pid = 258  # 25 stETH, 157 cvxCRV new, 128 frxETH-ETH (do for frax), eCFX 160, eUSD-FRAXBP 156, crvUSD-FRAX 187, FRAX-USDC 100, frxETH-ng 219
+    # 25 stETH, 157 cvxCRV new, 128 frxETH-ETH (do for frax), eCFX 160, eUSD-FRAXBP 156, crvUSD-FRAX 187, FRAX-USDC 100, frxETH-ng 219
     # 258 cvxPRISMA LP, 260 yPRISMA LP
+    pid = strategy_target["pid"]
     yield pid
 
 
@@ -554,7 +637,7 @@ def which_strategy():
     # prisma convex: 2
     # prisma curve: 3
     # Only test 4 (Frax) for pools that actually have frax.
-    which_strategy = 2
+    which_strategy = strategy_target["which_strategy"]
     yield which_strategy
 
 
@@ -836,3 +919,53 @@ def new_proxy():
 @pytest.fixture(scope="session")
 def new_registry():
     yield Contract("0xaF1f5e1c19cB68B30aAD73846eFfDf78a5863319")
+
+
+@pytest.fixture(scope="function")
+def new_curve_global(
+    CurveGlobal, new_registry, convex_template, curve_template, frax_template, gov
+):
+    # deploy a fresh factory to test changes not yet on our live factory
+    new_curve_global = gov.deploy(
+        CurveGlobal,
+        new_registry,
+        convex_template,
+        curve_template,
+        frax_template,
+        gov,
+    )
+    print("New Curve factory deployed:", new_curve_global)
+    yield new_curve_global
+
+
+@pytest.fixture(scope="function")
+def new_curve_global_approved(new_curve_global, new_registry, new_proxy, gov):
+    # let our new factory own and endorse vaults, and approve strategies on our proxy, so it can deploy
+    registry_owner = accounts.at(new_registry.owner(), force=True)
+    new_registry.setApprovedVaultsOwner(
+        new_curve_global, True, {"from": registry_owner}
+    )
+    new_registry.setVaultEndorsers(new_curve_global, True, {"from": registry_owner})
+    new_proxy.setFactory(new_curve_global, {"from": gov})
+    yield new_curve_global
+
+
+@pytest.fixture(scope="session")
+def curve_global_lens(CurveGlobalLens, curve_global, gov):
+    # deploy our lens for reading data on many factory vaults at once
+    curve_global_lens = gov.deploy(CurveGlobalLens, curve_global)
+    print("Curve factory lens deployed:", curve_global_lens)
+    yield curve_global_lens
+
+
+@pytest.fixture(scope="session")
+def reward_price_snapshot(RewardPriceSnapshot, gov):
+    # deploy our shared reward price cache, refreshing at most every hour
+    reward_price_snapshot = gov.deploy(RewardPriceSnapshot, 3600)
+    print("Reward price snapshot deployed:", reward_price_snapshot)
+    yield reward_price_snapshot
+
+
+# swap in our mock protocol fixtures when testing on a bare local chain
+if use_mocks:
+    from mock_fixtures import *
@@ -1,7 +1,10 @@
 import brownie
 from brownie import Contract, ZERO_ADDRESS, interface, chain, accounts
 import math
-from utils import harvest_strategy, check_status
+import pytest
+from utils import harvest_strategy, check_status, advance_chain
+from scripts.fleet_multisend import encode_multisend, get_fleet_calls
+from scripts.trigger_simulator import CONVEX, CURVE
 
 # note that because ganache crashes with the try-catch when checking for frax pids, we need to do this test and the next with tenderly
 # for the vault deployment to not revert. additionally, best to do the first two individually.
@@ -286,8 +289,7 @@ def test_vault_deployment(
         assert frax_strategy.stakedBalance() > 0
 
     # wait a week for our funds to unlock
-    chain.sleep(86400 * 7)
-    chain.mine(1)
+    advance_chain(86400 * 7)
 
     if frax_strat != ZERO_ADDRESS:
         print("Check that anyone can harvest again to remove all funds")
@@ -814,3 +816,370 @@ def test_curve_global_setters_and_views(
     curve_global.setOwner(whale, {"from": gov})
     curve_global.acceptOwner({"from": whale})
     assert curve_global.owner() == whale.address
+
+
+def test_pid_index(
+    new_curve_global,
+    gauge,
+    pid,
+    gov,
+    whale,
+    booster,
+):
+    # before indexing, we need to search back through the booster to find our pid
+    unindexed_gas = new_curve_global.getPid.estimate_gas(gauge)
+    assert new_curve_global.getPid.call(gauge) == pid
+
+    # anyone can index, and we can split it up to stay under the gas limit
+    pool_length = booster.poolLength()
+    for start in range(0, pool_length, 100):
+        new_curve_global.syncPids(start, start + 100, {"from": whale})
+
+    # indexed lookups should be the same pid, just cheaper
+    indexed_gas = new_curve_global.getPid.estimate_gas(gauge)
+    assert new_curve_global.getPid.call(gauge) == pid
+    print("getPid gas unindexed:", unindexed_gas, "indexed:", indexed_gas)
+    assert indexed_gas < unindexed_gas
+
+    # syncing past the end of the booster or re-syncing old pools shouldn't change anything
+    new_curve_global.syncPids(0, pool_length + 100, {"from": whale})
+    assert new_curve_global.getPid.call(gauge) == pid
+
+    # still max uint for a gauge that doesn't exist on convex
+    assert new_curve_global.getPid.call(gov) == 2**256 - 1
+
+
+def test_frax_pool_index(
+    new_curve_global,
+    template_pid,
+    template_frax_pid,
+    template_staking_address,
+    gov,
+    whale,
+):
+    # before syncing, we need to search back through the whole frax registry
+    frax_registry = Contract(new_curve_global.convexFraxPoolRegistry())
+    unsynced_gas = new_curve_global.getFraxInfo.estimate_gas(template_pid)
+    assert new_curve_global.getFraxInfo.call(template_pid) == (
+        True,
+        template_frax_pid,
+        template_staking_address,
+    )
+
+    # anyone can sync, and we can split it up to stay under the gas limit
+    pool_length = frax_registry.poolLength()
+    while new_curve_global.fraxPoolsSynced(frax_registry) < pool_length:
+        new_curve_global.syncFraxPools(25, {"from": whale})
+    assert new_curve_global.fraxPoolsSynced(frax_registry) == pool_length
+
+    # synced lookups should give the same info, just cheaper
+    synced_gas = new_curve_global.getFraxInfo.estimate_gas(template_pid)
+    assert new_curve_global.getFraxInfo.call(template_pid) == (
+        True,
+        template_frax_pid,
+        template_staking_address,
+    )
+    print("getFraxInfo gas unsynced:", unsynced_gas, "synced:", synced_gas)
+    assert synced_gas < unsynced_gas
+
+    # syncing again once we're caught up shouldn't change anything
+    new_curve_global.syncFraxPools(2**256 - 1, {"from": whale})
+    assert new_curve_global.fraxPoolsSynced(frax_registry) == pool_length
+
+    # pools without a frax pool (stETH) still show as such
+    assert new_curve_global.getFraxInfo.call(25) == (False, 0, ZERO_ADDRESS)
+
+
+def test_batch_deployment(
+    new_curve_global,
+    new_curve_global_approved,
+    new_proxy,
+    gauge,
+    legacy_gauge,
+    health_check,
+    whale,
+):
+    # only our factory can deploy single vaults for a batch
+    with brownie.reverts():
+        new_curve_global.createNewVaultsAndStrategiesForBatch(
+            gauge, new_proxy, {"from": whale}
+        )
+
+    # one good gauge, one with a legacy vault, and one that isn't a gauge at all
+    gauges = [gauge, legacy_gauge, health_check]
+    unsynced_gas = new_curve_global.createNewVaultsAndStrategiesBatch.estimate_gas(
+        gauges, {"from": whale}
+    )
+
+    # deploy through our synced frax pool index, like we would on mainnet. sync in chunks to stay under the gas limit.
+    frax_registry = Contract(new_curve_global.convexFraxPoolRegistry())
+    pool_length = frax_registry.poolLength()
+    while new_curve_global.fraxPoolsSynced(frax_registry) < pool_length:
+        new_curve_global.syncFraxPools(25, {"from": whale})
+
+    tx = new_curve_global.createNewVaultsAndStrategiesBatch(gauges, {"from": whale})
+    results = tx.return_value
+    print("Batch deployment gas unsynced:", unsynced_gas, "synced:", tx.gas_used)
+    assert tx.gas_used < unsynced_gas
+
+    # failures shouldn't revert the batch, and should come back with a reason
+    assert [result["gauge"] for result in results] == gauges
+    assert results[0]["success"]
+    assert results[0]["vault"] == new_curve_global.latestStandardVaultFromGauge(gauge)
+    assert results[0]["curveStrategy"] == new_proxy.strategies(gauge)
+    assert results[0]["reason"] == "0x"
+    for result in results[1:]:
+        assert not result["success"]
+        assert result["vault"] == ZERO_ADDRESS
+        print("Failed deployment for", result["gauge"], "reason:", result["reason"])
+    assert results[1]["reason"] != "0x"
+
+    # only our successful deployment should be recorded
+    assert new_curve_global.numVaults() == 1
+    assert len(tx.events["NewAutomatedVault"]) == 1
+
+    # we can go from gauge to vault and back directly
+    assert new_curve_global.gaugeToVault(gauge) == results[0]["vault"]
+    assert new_curve_global.vaultToGauge(results[0]["vault"]) == gauge
+    assert new_curve_global.gaugeToVault(legacy_gauge) == ZERO_ADDRESS
+    assert not new_curve_global.canCreateVaultPermissionlessly(gauge)
+
+
+@pytest.mark.parametrize("immutable_args", [False, True])
+def test_predict_addresses(
+    StrategyConvexFactoryClonable,
+    new_curve_global,
+    new_curve_global_approved,
+    new_proxy,
+    gauge,
+    pid,
+    gov,
+    whale,
+    immutable_args,
+):
+    # only our owner can change our clone type
+    with brownie.reverts():
+        new_curve_global.setUseImmutableArgsClones(True, {"from": whale})
+    new_curve_global.setUseImmutableArgsClones(immutable_args, {"from": gov})
+
+    # our strategies should land exactly where we predicted, whoever deploys them
+    predicted = new_curve_global.predictAddresses(gauge)
+    print("Predicted strategies:", predicted)
+    tx = new_curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    event = tx.events["NewAutomatedVault"]
+    assert predicted == (
+        event["convexStrategy"],
+        event["curveStrategy"],
+        event["convexFraxStrategy"],
+    )
+    assert new_proxy.strategies(gauge) == predicted[1]
+    assert StrategyConvexFactoryClonable.at(predicted[0]).pid() == pid
+
+    # once we have a vault for this gauge, another deployment gets new addresses
+    assert new_curve_global.predictAddresses(gauge)[1] != predicted[1]
+
+
+def test_apply_to_strategies(
+    StrategyConvexFactoryClonable,
+    StrategyCurveBoostedFactoryClonable,
+    new_curve_global,
+    new_curve_global_approved,
+    gauge,
+    gov,
+    whale,
+):
+    # our factory stays governance on new vaults until ychad accepts
+    tx = new_curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    event = tx.events["NewAutomatedVault"]
+    convex_strategy = StrategyConvexFactoryClonable.at(event["convexStrategy"])
+    curve_strategy = StrategyCurveBoostedFactoryClonable.at(event["curveStrategy"])
+
+    # our convex strategy needs voters before it can keep anything
+    strategies = [
+        convex_strategy,
+        convex_strategy,
+        curve_strategy,
+        curve_strategy,
+        curve_strategy,
+    ]
+    calls = [
+        convex_strategy.setVoters.encode_input(gov, gov),
+        convex_strategy.setLocalKeepCrvs.encode_input(500, 250),
+        curve_strategy.setLocalKeepCrv.encode_input(500),
+        curve_strategy.setHealthCheck.encode_input(ZERO_ADDRESS),
+        # our curve strategy doesn't have this one, so it should fail without reverting the rest
+        convex_strategy.setLocalKeepCrvs.encode_input(500, 250),
+    ]
+
+    # only owner or management, with matching lengths, and only our setters
+    with brownie.reverts():
+        new_curve_global.applyToStrategies(strategies, calls, {"from": whale})
+    with brownie.reverts("Length mismatch"):
+        new_curve_global.applyToStrategies(strategies, calls[:2], {"from": gov})
+    with brownie.reverts("Call not allowed"):
+        new_curve_global.applyToStrategies(
+            [curve_strategy],
+            [curve_strategy.setKeeper.encode_input(whale)],
+            {"from": gov},
+        )
+
+    # management may update health checks, but keeps and voters are owner only
+    management = accounts.at(new_curve_global.management(), force=True)
+    assert management != gov
+    with brownie.reverts():
+        new_curve_global.applyToStrategies(
+            [convex_strategy],
+            [convex_strategy.setVoters.encode_input(whale, whale)],
+            {"from": management},
+        )
+    with brownie.reverts():
+        new_curve_global.applyToStrategies(
+            [curve_strategy],
+            [curve_strategy.setLocalKeepCrv.encode_input(10_000)],
+            {"from": management},
+        )
+    new_curve_global.applyToStrategies(
+        [convex_strategy],
+        [convex_strategy.setHealthCheck.encode_input(ZERO_ADDRESS)],
+        {"from": management},
+    )
+    assert convex_strategy.healthCheck() == ZERO_ADDRESS
+
+    tx = new_curve_global.applyToStrategies(strategies, calls, {"from": gov})
+    results = tx.return_value
+    print("Fleet update gas:", tx.gas_used)
+    assert [result["success"] for result in results] == [True, True, True, True, False]
+    assert [result["strategy"] for result in results] == strategies
+    assert results[0]["reason"] == "0x"
+    assert tx.events["StrategyCallFailed"]["strategy"] == curve_strategy.address
+
+    assert convex_strategy.convexVoter() == gov.address
+    assert convex_strategy.localKeepCRV() == 500
+    assert convex_strategy.localKeepCVX() == 250
+    assert curve_strategy.localKeepCRV() == 500
+    assert curve_strategy.healthCheck() == ZERO_ADDRESS
+
+
+def test_fleet_multisend(
+    StrategyConvexFactoryClonable,
+    StrategyCurveBoostedFactoryClonable,
+    new_curve_global,
+    new_curve_global_approved,
+    gauge,
+    whale,
+):
+    tx = new_curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    event = tx.events["NewAutomatedVault"]
+    convex_strategy = StrategyConvexFactoryClonable.at(event["convexStrategy"])
+    curve_strategy = StrategyCurveBoostedFactoryClonable.at(event["curveStrategy"])
+    strategies = [(convex_strategy.address, CONVEX), (curve_strategy.address, CURVE)]
+
+    # nothing to do while our factory is still governance, applyToStrategies covers that
+    new_curve_global.setKeepCRV(
+        500, new_curve_global.curveVoter(), {"from": new_curve_global.owner()}
+    )
+    assert get_fleet_calls(new_curve_global, strategies) == []
+
+    # once governance accepts, our factory can't update our keeps anymore
+    vault = Contract(event["vault"])
+    governance = accounts.at(new_curve_global.governance(), force=True)
+    vault.acceptGovernance({"from": governance})
+    tx = new_curve_global.applyToStrategies(
+        [curve_strategy],
+        [curve_strategy.setLocalKeepCrv.encode_input(500)],
+        {"from": new_curve_global.owner()},
+    )
+    assert not tx.return_value[0]["success"]
+
+    calls = get_fleet_calls(new_curve_global, strategies)
+    assert [(strategy.address, data[:10]) for strategy, data in calls] == [
+        (convex_strategy.address, convex_strategy.setVoters.signature),
+        (convex_strategy.address, convex_strategy.setLocalKeepCrvs.signature),
+        (curve_strategy.address, curve_strategy.setLocalKeepCrv.signature),
+    ]
+
+    # unpack our multisend payload and run each call from governance, like our Safe would
+    payload = encode_multisend(calls)
+    while payload:
+        assert payload[0] == 0
+        to = "0x" + payload[1:21].hex()
+        assert int.from_bytes(payload[21:53], "big") == 0
+        length = int.from_bytes(payload[53:85], "big")
+        governance.transfer(to, 0, data="0x" + payload[85 : 85 + length].hex())
+        payload = payload[85 + length :]
+
+    assert convex_strategy.localKeepCRV() == 500
+    assert convex_strategy.curveVoter() == new_curve_global.curveVoter()
+    assert curve_strategy.localKeepCRV() == 500
+    assert get_fleet_calls(new_curve_global, strategies) == []
+
+
+def test_lens_harvest_triggers(
+    curve_global,
+    curve_global_lens,
+    gov,
+):
+    # grab the first page of our factory's vaults
+    page_size = 10
+    triggers = curve_global_lens.harvestTriggers(0, page_size, 0)
+    vaults = [curve_global.deployedVaults(i) for i in range(page_size)]
+
+    # check that we have every strategy, in withdrawal queue order
+    expected = []
+    for vault_address in vaults:
+        vault = Contract(vault_address)
+        for i in range(20):
+            strategy = vault.withdrawalQueue(i)
+            if strategy == ZERO_ADDRESS:
+                break
+            expected.append((vault_address, strategy))
+    assert [(info["vault"], info["strategy"]) for info in triggers] == expected
+
+    # spot check our data against the strategies directly
+    for info in triggers:
+        vault = Contract(info["vault"])
+        assert info["lastReport"] == vault.strategies(info["strategy"])["lastReport"]
+        assert info["creditAvailable"] == vault.creditAvailable(info["strategy"])
+        strategy = Contract(info["strategy"])
+        if hasattr(strategy, "claimableProfitInUsdc"):
+            assert info["claimableProfitInUsdc"] == strategy.claimableProfitInUsdc()
+        else:
+            assert info["claimableProfitInUsdc"] == 0
+    print("Triggers:", triggers)
+
+    # pages past the end of our vaults should be empty, and partial pages should be trimmed
+    num_vaults = curve_global.numVaults()
+    assert len(curve_global_lens.harvestTriggers(num_vaults, page_size, 0)) == 0
+    last_page = curve_global_lens.harvestTriggers(num_vaults - 1, page_size, 0)
+    assert len(set(info["vault"] for info in last_page)) <= 1
+
+
+def test_lens_vault_summaries(
+    curve_global,
+    curve_global_lens,
+):
+    # our paged vaults should match the full list
+    all_vaults = curve_global.allDeployedVaults()
+    page_size = 10
+    page = curve_global.deployedVaultsPage(0, page_size)
+    assert list(page) == all_vaults[:page_size]
+    assert len(curve_global.deployedVaultsPage(len(all_vaults), page_size)) == 0
+    assert list(curve_global.deployedVaultsPage(len(all_vaults) - 1, page_size)) == [
+        all_vaults[-1]
+    ]
+
+    # check our summaries against the vaults directly
+    summaries = curve_global_lens.vaultSummaries(0, page_size)
+    assert [summary["vault"] for summary in summaries] == list(page)
+    for summary in summaries:
+        vault = Contract(summary["vault"])
+        assert summary["lpToken"] == vault.token()
+        assert summary["totalAssets"] == vault.totalAssets()
+        assert summary["debtRatio"] == vault.debtRatio()
+        assert len(summary["strategies"]) == len(summary["debtRatios"])
+        for strategy, debt_ratio in zip(summary["strategies"], summary["debtRatios"]):
+            assert vault.strategies(strategy)["debtRatio"] == debt_ratio
+
+        # every factory vault has a curve boosted strategy, so we should know our gauge
+        assert Contract(summary["gauge"]).lp_token() == vault.token()
+        print("Vault summary:", summary)
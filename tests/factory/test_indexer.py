@@ -0,0 +1,240 @@
+import brownie
+import pytest
+from brownie import chain, accounts, web3
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+from hexbytes import HexBytes
+from scripts.indexer import (
+    FactoryIndexer,
+    AdaptiveLogFetcher,
+    new_vault_event,
+    harvested_event,
+)
+
+# fake a node that refuses to return logs over wide block ranges
+class FakeNode:
+    def __init__(self, logs, max_range):
+        self.logs = logs
+        self.max_range = max_range
+        self.calls = []
+
+    def get_logs(self, params):
+        self.calls.append((params["fromBlock"], params["toBlock"]))
+        if params["toBlock"] - params["fromBlock"] + 1 > self.max_range:
+            raise ValueError(
+                {"code": -32005, "message": "query returned more than 10000 results"}
+            )
+        addresses = params["address"]
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        return [
+            log
+            for log in self.logs
+            if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+            and log["address"] in addresses
+            and "0x" + log["topics"][0].hex()[-64:] == params["topics"][0]
+        ]
+
+
+def _word(value):
+    return HexBytes(value.to_bytes(32, "big"))
+
+
+def _address(value):
+    return to_checksum_address("0x" + hex(value)[2:].zfill(40))
+
+
+def _address_word(address):
+    return _word(int(address, 16))
+
+
+def test_indexer_adaptive_ranges(tmp_path):
+    factory = "0x21b1FC8A52f179757bf555346130bF27c0C2A17A"
+    gauge, lp_token, vault = [_address(i) for i in (1, 2, 3)]
+    convex, curve = [_address(i) for i in (4, 5)]
+    new_vault_topic = HexBytes(event_abi_to_log_topic(new_vault_event().abi))
+    harvested_topic = HexBytes(event_abi_to_log_topic(harvested_event().abi))
+
+    # one vault with no frax strategy, then two harvests on our convex strategy
+    logs = [
+        {
+            "address": factory,
+            "blockNumber": 1_000,
+            "blockHash": _word(1_000),
+            "transactionHash": _word(1),
+            "transactionIndex": 0,
+            "logIndex": 0,
+            "topics": [
+                new_vault_topic,
+                _word(0),
+                _address_word(lp_token),
+                _address_word(vault),
+            ],
+            "data": HexBytes(
+                b"".join(_address_word(a) for a in (gauge, convex, curve, _address(0)))
+            ),
+        }
+    ]
+    for block, profit in [(5_000, 10**18), (90_000, 2**255)]:
+        logs.append(
+            {
+                "address": convex,
+                "blockNumber": block,
+                "blockHash": _word(block),
+                "transactionHash": _word(block),
+                "transactionIndex": 0,
+                "logIndex": 3,
+                "topics": [harvested_topic],
+                "data": HexBytes(b"".join(_word(v) for v in (profit, 0, 0, 0))),
+            }
+        )
+
+    node = FakeNode(logs, max_range=10_000)
+    fetcher = AdaptiveLogFetcher(node.get_logs, initial_range=50_000)
+    indexer = FactoryIndexer(
+        str(tmp_path / "events.db"), node.get_logs, factory, fetcher=fetcher
+    )
+    indexer.run(100_000)
+
+    # wide ranges should have been split until the node accepted them
+    assert any(end - start + 1 > 10_000 for start, end in node.calls)
+
+    # check our stored data
+    assert indexer.db.execute("SELECT gauge, vault FROM vaults").fetchall() == [
+        (gauge, vault)
+    ]
+    assert sorted(indexer.strategies()) == sorted([convex, curve])
+    harvests = indexer.db.execute(
+        "SELECT block_number, profit FROM harvests WHERE strategy = ? ORDER BY block_number",
+        (convex,),
+    ).fetchall()
+    assert harvests == [(5_000, str(10**18)), (90_000, str(2**255))]
+    assert indexer.checkpoint("vaults") == 100_000
+    assert indexer.checkpoint("harvests") == 100_000
+
+    # running again should resume from our checkpoint and not duplicate anything
+    node.calls = []
+    indexer.run(100_000)
+    assert node.calls == []
+    indexer.run(120_000)
+    assert min(start for start, _ in node.calls) == 100_001
+    assert indexer.db.execute("SELECT COUNT(*) FROM harvests").fetchone()[0] == 2
+
+    # a reopened store should pick up where we left off
+    reopened = FactoryIndexer(str(tmp_path / "events.db"), node.get_logs, factory)
+    assert reopened.checkpoint("harvests") == 120_000
+    assert sorted(reopened.strategies()) == sorted([convex, curve])
+
+
+# only errors about our query being too big should shrink our range, anything else should be raised
+def test_indexer_raises_other_errors():
+    calls = []
+
+    def get_logs(params):
+        calls.append(params)
+        raise ValueError({"code": -32602, "message": "invalid argument 0"})
+
+    fetcher = AdaptiveLogFetcher(get_logs, initial_range=50_000)
+    with pytest.raises(ValueError):
+        list(fetcher.fetch([], [], 0, 100_000))
+    assert len(calls) == 1
+    assert fetcher.block_range == 50_000
+
+    # nor should being rate limited
+    def rate_limited(params):
+        raise ValueError({"code": 429, "message": "Too Many Requests"})
+
+    fetcher = AdaptiveLogFetcher(rate_limited, initial_range=50_000)
+    with pytest.raises(ValueError):
+        list(fetcher.fetch([], [], 0, 100_000))
+    assert fetcher.block_range == 50_000
+
+
+# index real events from our local chain
+def test_indexer_local_chain(
+    tmp_path,
+    new_curve_global,
+    new_curve_global_approved,
+    gauge,
+    whale,
+):
+    start_block = chain.height
+
+    tx = new_curve_global.createNewVaultsAndStrategies(gauge, {"from": whale})
+    event = tx.events["NewAutomatedVault"]
+
+    # harvest our curve strategy so we have something to index
+    vault = brownie.Contract(event["vault"])
+    curve_strategy = brownie.Contract(event["curveStrategy"])
+    curve_strategy.harvest({"from": accounts.at(vault.management(), force=True)})
+
+    indexer = FactoryIndexer(
+        str(tmp_path / "events.db"),
+        web3.eth.get_logs,
+        new_curve_global.address,
+        start_block,
+    )
+    indexer.run(chain.height)
+
+    assert indexer.db.execute(
+        "SELECT gauge, vault, curve_strategy FROM vaults"
+    ).fetchall() == [(gauge.address, event["vault"], event["curveStrategy"])]
+    assert event["curveStrategy"] in indexer.strategies()
+    assert (
+        indexer.db.execute(
+            "SELECT COUNT(*) FROM harvests WHERE strategy = ?",
+            (event["curveStrategy"],),
+        ).fetchone()[0]
+        == 1
+    )
+
+
+# index events from our own vault and strategy, so this also runs on mocks (USE_MOCKS=1) without a fork
+def test_indexer_mock_factory(
+    tmp_path,
+    MockFactoryEvents,
+    gov,
+    token,
+    vault,
+    strategy,
+    whale,
+    amount,
+):
+    factory = gov.deploy(MockFactoryEvents)
+    start_block = chain.height
+
+    # announce our vault the same way our factory would, with our strategy as its curve strategy
+    factory.announceVault(
+        0,
+        token,
+        token,
+        vault,
+        brownie.ZERO_ADDRESS,
+        strategy,
+        brownie.ZERO_ADDRESS,
+        {"from": gov},
+    )
+
+    # deposit and harvest so we have something to index
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    tx = strategy.harvest({"from": gov})
+    harvested = tx.events["Harvested"]
+
+    indexer = FactoryIndexer(
+        str(tmp_path / "events.db"), web3.eth.get_logs, factory.address, start_block
+    )
+    indexer.run(chain.height)
+
+    assert indexer.db.execute(
+        "SELECT vault, curve_strategy FROM vaults"
+    ).fetchall() == [(vault.address, strategy.address)]
+    assert indexer.strategies() == [strategy.address]
+    assert indexer.db.execute(
+        "SELECT strategy, profit, debt_outstanding FROM harvests"
+    ).fetchall() == [
+        (
+            strategy.address,
+            str(harvested["profit"]),
+            str(harvested["debtOutstanding"]),
+        )
+    ]
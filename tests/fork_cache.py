@@ -0,0 +1,191 @@
+"""
+Persistent cache of the mainnet state our tests pull into an anvil fork, so repeat runs at the same fork block don't
+need to fetch it again over RPC.
+
+Entries are keyed by chain id and fork block in an index, and point to content-addressed (sha256) state files. After
+each run we note which accounts and storage slots it touched that aren't cached yet, then read their values as of the
+fork block (never what our tests changed them to) and add them to our entry. On later runs, we load that state into
+anvil before any test runs.
+
+Our local dev accounts, and anything with no state at the fork block (our own deployments), are never cached:
+loading them would overwrite what anvil gave them with mainnet's values, like our dev accounts' test ETH.
+
+Anvil still needs our RPC: it reads the fork block itself when it starts, and fetches anything our cache doesn't have.
+So a run only avoids RPC state reads entirely once earlier runs at that block have touched everything it touches. A
+run that reaches new state (a new test, a different strategy target) fetches it over RPC, then adds it to our cache.
+"""
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import requests
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "FORK_CACHE_DIR", Path(__file__).resolve().parent.parent / ".fork_cache"
+    )
+)
+
+# keep our batched RPC requests to a size any provider will take
+RPC_BATCH_SIZE = 500
+
+
+def _index_path():
+    return CACHE_DIR / "index.json"
+
+
+def _object_path(digest):
+    return CACHE_DIR / "objects" / f"{digest}.json.gz"
+
+
+def _read_index():
+    if not _index_path().exists():
+        return {}
+    return json.loads(_index_path().read_text())
+
+
+def _key(chain_id, fork_block):
+    return f"{chain_id}-{fork_block}"
+
+
+def fork_info(web3):
+    """Return (fork url, fork block) if we're connected to an anvil fork, otherwise None."""
+    response = web3.provider.make_request("anvil_nodeInfo", [])
+    fork_config = (response.get("result") or {}).get("forkConfig") or {}
+    if not fork_config.get("forkUrl"):
+        return None
+    return fork_config["forkUrl"], fork_config["forkBlockNumber"]
+
+
+def _is_empty(account):
+    # an account with nothing at our fork block, which anvil already knows without asking our RPC
+    return (
+        int(account["balance"], 16) == 0
+        and account["nonce"] == 0
+        and account["code"] in ("", "0x")
+        and not any(int(value, 16) for value in account["storage"].values())
+    )
+
+
+def _keep(accounts, exclude):
+    exclude = {address.lower() for address in exclude}
+    return {
+        address: account
+        for address, account in accounts.items()
+        if address.lower() not in exclude and not _is_empty(account)
+    }
+
+
+def load(web3, chain_id, fork_block, exclude=()):
+    """
+    Preload any cached state for this chain and fork block into anvil, except for the accounts in exclude (our local
+    dev accounts). Returns our cached accounts, or None.
+    """
+    digest = _read_index().get(_key(chain_id, fork_block))
+    if digest is None or not _object_path(digest).exists():
+        return None
+
+    # caches from before we skipped dev and empty accounts may still have them, so filter on the way in too
+    accounts = _keep(
+        json.loads(gzip.decompress(_object_path(digest).read_bytes()))["accounts"],
+        exclude,
+    )
+    state = gzip.compress(json.dumps({"accounts": accounts}).encode())
+    web3.provider.make_request("anvil_loadState", ["0x" + state.hex()])
+    return accounts
+
+
+def save(web3, fork_url, chain_id, fork_block, cached=None, exclude=()):
+    """
+    Add the fork block state of every account and slot anvil has touched so far to our cache, on top of any accounts
+    we had cached already. Accounts in exclude (our local dev accounts) and accounts with no state at our fork block
+    are left out. Returns our state's digest.
+    """
+    cached = cached or {}
+    excluded = {address.lower() for address in exclude}
+    response = web3.provider.make_request("anvil_dumpState", [])
+    dumped = json.loads(gzip.decompress(bytes.fromhex(response["result"][2:])))
+
+    # only fetch what we don't have yet
+    missing = {}
+    for address, account in dumped["accounts"].items():
+        if address.lower() in excluded:
+            continue
+        cached_account = cached.get(address)
+        if cached_account is None:
+            missing[address] = account
+            continue
+        slots = set(account.get("storage", {})) - set(cached_account["storage"])
+        if slots:
+            missing[address] = {"storage": dict.fromkeys(slots)}
+
+    accounts = {address: dict(account) for address, account in cached.items()}
+    for address, account in _fetch_accounts(fork_url, fork_block, missing).items():
+        if address in accounts:
+            # we already have this account's balance, nonce and code, just add our new slots
+            accounts[address]["storage"] = {
+                **accounts[address]["storage"],
+                **account["storage"],
+            }
+        else:
+            accounts[address] = account
+    accounts = _keep(accounts, exclude)
+
+    content = json.dumps({"accounts": accounts}, sort_keys=True).encode()
+    digest = hashlib.sha256(content).hexdigest()
+
+    # gzip's header includes a timestamp, so hash our content before compressing it
+    path = _object_path(digest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        path.write_bytes(gzip.compress(content, mtime=0))
+
+    index = _read_index()
+    index[_key(chain_id, fork_block)] = digest
+    _index_path().write_text(json.dumps(index, indent=2, sort_keys=True))
+    return digest
+
+
+def _fetch_accounts(fork_url, fork_block, touched):
+    # re-read everything we touched as of our fork block, so we don't cache any changes made during our tests
+    block = hex(fork_block)
+    calls = []
+    for address, account in touched.items():
+        # accounts we've cached already only need their new slots
+        if "code" in account:
+            calls.append((address, "balance", "eth_getBalance", [address, block]))
+            calls.append(
+                (address, "nonce", "eth_getTransactionCount", [address, block])
+            )
+            calls.append((address, "code", "eth_getCode", [address, block]))
+        for slot in account.get("storage", {}):
+            calls.append((address, slot, "eth_getStorageAt", [address, slot, block]))
+
+    accounts = {}
+    for i in range(0, len(calls), RPC_BATCH_SIZE):
+        batch = calls[i : i + RPC_BATCH_SIZE]
+        response = requests.post(
+            fork_url,
+            json=[
+                {"jsonrpc": "2.0", "id": j, "method": method, "params": params}
+                for j, (_, _, method, params) in enumerate(batch)
+            ],
+            timeout=120,
+        )
+        response.raise_for_status()
+        results = {item["id"]: item["result"] for item in response.json()}
+
+        for j, (address, field, _, _) in enumerate(batch):
+            account = accounts.setdefault(
+                address, {"balance": "0x0", "nonce": 0, "code": "0x", "storage": {}}
+            )
+            if field == "nonce":
+                account["nonce"] = int(results[j], 16)
+            elif field in ("balance", "code"):
+                account[field] = results[j]
+            else:
+                account["storage"][field] = results[j]
+
+    return accounts
@@ -0,0 +1,304 @@
+"""
+Fixtures that deploy our mock protocol contracts (contracts/mocks), so our strategy tests can run on a bare local chain.
+
+    USE_MOCKS=1 brownie test tests/strategies --network anvil
+
+These replace the fork fixtures of the same name in conftest.py, which imports this module when USE_MOCKS is set.
+Our strategies (and yearn's BaseStrategy) hardcode a few mainnet addresses, so we copy our mocks' code to those.
+Tests that need other live contracts (our deployed factory, templates, other vaults) are skipped.
+"""
+import pytest
+from brownie import accounts, web3
+
+CRV_ADDRESS = "0xD533a949740bb3306d119CC777fa900bA034cd52"
+CVX_ADDRESS = "0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B"
+YPRISMA_ADDRESS = "0xe3668873D944E4A949DA05fc8bDE419eFF543882"
+FEED_REGISTRY_ADDRESS = "0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf"
+ETH_USD_FEED_ADDRESS = "0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419"
+PRISMA_ETH_ORACLE_ADDRESS = "0x322135Dd9cBAE8Afa84727d9aE1434b5B3EBA44B"
+YPRISMA_PRISMA_ORACLE_ADDRESS = "0x69833361991ed76f9e8DBBcdf9ea1520fEbFb4a7"
+HEALTH_CHECK_ADDRESS = "0xDDCea799fF1699e98EDF118e0629A974Df7DF012"
+BASE_FEE_ORACLE_ADDRESS = "0xfeCA6895DcF50d6350ad0b5A8232CF657C316dA7"
+
+# chainlink's denomination for USD in the feed registry
+USD = "0x0000000000000000000000000000000000000348"
+
+# tests using any of these need live mainnet contracts, so we skip them on mocks
+FORK_ONLY_FIXTURES = {
+    "other_strategy",
+    "other_vault_strategy",
+    "curve_registry",
+    "curve_cryptoswap_registry",
+    "other_gauge",
+    "template_vault",
+    "template_gauge",
+    "legacy_gauge",
+    "convex_template",
+    "curve_template",
+    "frax_template",
+    "curve_global",
+    "new_registry",
+    "new_curve_global",
+    "curve_global_lens",
+    "tenderly_fork",
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    skip_fork_only = pytest.mark.skip(reason="needs mainnet contracts, run on a fork")
+    for item in items:
+        if FORK_ONLY_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(skip_fork_only)
+
+
+# OpenZeppelin's ERC20 keeps name and symbol in slots 3 and 4 (after balances, allowances and totalSupply). short
+# strings like ours live entirely in their slot.
+ERC20_METADATA_SLOTS = (3, 4)
+
+
+def etch(container, deployed, address, storage_slots=()):
+    # copy a deployed mock's runtime code to a hardcoded address. constructor state only carries over for the
+    # storage slots we copy along with it.
+    code = web3.eth.get_code(deployed.address).hex()
+    web3.provider.make_request("anvil_setCode", [address, code])
+    for slot in storage_slots:
+        value = web3.eth.get_storage_at(deployed.address, slot).hex()
+        web3.provider.make_request(
+            "anvil_setStorageAt",
+            [address, hex(slot), "0x" + value[-64:].zfill(64)],
+        )
+    return container.at(address)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_oracles(MockFeedRegistry, MockPriceOracle, gov, crv, convex_token, fxs):
+    # USD prices with 8 decimals, like chainlink
+    registry = etch(
+        MockFeedRegistry, gov.deploy(MockFeedRegistry), FEED_REGISTRY_ADDRESS
+    )
+    registry.setPrice(crv, USD, 0.5e8, {"from": gov})
+    registry.setPrice(convex_token, USD, 2.5e8, {"from": gov})
+    registry.setPrice(fxs, USD, 5e8, {"from": gov})
+
+    # yPRISMA is priced via ETH/USD (8 decimals), then PRISMA/ETH and yPRISMA/PRISMA curve oracles (18 decimals)
+    for address, price in (
+        (ETH_USD_FEED_ADDRESS, 2_000e8),
+        (PRISMA_ETH_ORACLE_ADDRESS, 1e14),
+        (YPRISMA_PRISMA_ORACLE_ADDRESS, 0.8e18),
+    ):
+        oracle = etch(MockPriceOracle, gov.deploy(MockPriceOracle), address)
+        oracle.setPrice(price, {"from": gov})
+
+    yield registry
+
+
+@pytest.fixture(scope="session")
+def gov():
+    yield accounts[0]
+
+
+@pytest.fixture(scope="session")
+def management():
+    yield accounts[1]
+
+
+@pytest.fixture(scope="session")
+def health_check(MockHealthCheck, gov):
+    # yearn's BaseStrategy defaults to this health check
+    yield etch(MockHealthCheck, gov.deploy(MockHealthCheck), HEALTH_CHECK_ADDRESS)
+
+
+@pytest.fixture(scope="session")
+def base_fee_oracle(MockBaseFeeOracle, gov):
+    yield etch(
+        MockBaseFeeOracle, gov.deploy(MockBaseFeeOracle), BASE_FEE_ORACLE_ADDRESS
+    )
+
+
+@pytest.fixture(scope="session")
+def trade_factory(MockTradeFactory, gov):
+    yield gov.deploy(MockTradeFactory)
+
+
+@pytest.fixture(scope="session")
+def keeper_wrapper(KeeperWrapper, gov):
+    yield gov.deploy(KeeperWrapper)
+
+
+@pytest.fixture(scope="session")
+def crv(MockERC20, gov):
+    yield etch(
+        MockERC20,
+        gov.deploy(MockERC20, "Curve DAO Token", "CRV"),
+        CRV_ADDRESS,
+        ERC20_METADATA_SLOTS,
+    )
+
+
+@pytest.fixture(scope="session")
+def convex_token(MockERC20, gov):
+    yield etch(
+        MockERC20,
+        gov.deploy(MockERC20, "Convex Token", "CVX"),
+        CVX_ADDRESS,
+        ERC20_METADATA_SLOTS,
+    )
+
+
+@pytest.fixture(scope="session")
+def yprisma(MockERC20, gov):
+    yield etch(
+        MockERC20,
+        gov.deploy(MockERC20, "yPrisma", "yPRISMA"),
+        YPRISMA_ADDRESS,
+        ERC20_METADATA_SLOTS,
+    )
+
+
+@pytest.fixture(scope="session")
+def fxs(MockERC20, gov):
+    yield gov.deploy(MockERC20, "Frax Share", "FXS")
+
+
+@pytest.fixture(scope="session")
+def token(MockERC20, gov):
+    yield gov.deploy(
+        MockERC20, "Curve.fi Factory Pool: eUSD-FRAXBP", "eUSDFRAXBP3CRV-f"
+    )
+
+
+# a plain curve pool is its own LP token
+@pytest.fixture(scope="session")
+def pool(token):
+    yield token
+
+
+@pytest.fixture(scope="session")
+def whale(accounts, amount, token):
+    whale = accounts[2]
+    token.mint(whale, 10 * amount, {"from": whale})
+    yield whale
+
+
+@pytest.fixture(scope="session")
+def profit_whale(accounts, profit_amount, token):
+    profit_whale = accounts[3]
+    token.mint(profit_whale, 100 * profit_amount, {"from": profit_whale})
+    yield profit_whale
+
+
+@pytest.fixture(scope="session")
+def crv_whale(accounts, crv):
+    crv_whale = accounts[4]
+    crv.mint(crv_whale, 1_000_000e18, {"from": crv_whale})
+    yield crv_whale
+
+
+@pytest.fixture(scope="session")
+def rewards_token(MockERC20, gov):
+    yield gov.deploy(MockERC20, "Lido DAO Token", "LDO")
+
+
+@pytest.fixture(scope="session")
+def rewards_whale(accounts, rewards_token, rewards_amount):
+    rewards_whale = accounts[5]
+    rewards_token.mint(rewards_whale, 10 * rewards_amount, {"from": rewards_whale})
+    yield rewards_whale
+
+
+########## CONVEX ##########
+
+# our mock booster only has the one pool
+@pytest.fixture(scope="session")
+def pid():
+    yield 0
+
+
+@pytest.fixture(scope="session")
+def gauge(MockCurveGauge, gov, token, crv):
+    yield gov.deploy(MockCurveGauge, token, crv)
+
+
+@pytest.fixture(scope="session")
+def booster(MockConvexBooster, gov, crv, convex_token, token, gauge):
+    booster = gov.deploy(MockConvexBooster, crv, convex_token)
+    booster.addPool(token, gauge, 3, {"from": gov})
+    yield booster
+
+
+@pytest.fixture(scope="session")
+def rewards_contract(MockConvexRewards, booster, pid):
+    yield MockConvexRewards.at(booster.poolInfo(pid)[3])
+
+
+@pytest.fixture(scope="session")
+def cvx_deposit(MockERC20, booster, pid):
+    yield MockERC20.at(booster.poolInfo(pid)[1])
+
+
+########## CURVE ##########
+
+
+@pytest.fixture(scope="session")
+def voter(MockCurveVoter, gov):
+    yield gov.deploy(MockCurveVoter)
+
+
+@pytest.fixture(scope="session")
+def new_proxy(MockStrategyProxy, gov, voter, crv):
+    yield gov.deploy(MockStrategyProxy, voter, crv)
+
+
+########## FRAX ##########
+
+
+# newer frax pids (44+) read rewards from the staking contract instead of the user vault
+@pytest.fixture(scope="session")
+def frax_pid():
+    yield 44
+
+
+@pytest.fixture(scope="session")
+def staking_address(MockFraxStaking, gov, token, fxs, crv, convex_token):
+    staking = gov.deploy(MockFraxStaking, token, fxs, crv, convex_token)
+    yield staking.address
+
+
+@pytest.fixture(scope="session")
+def frax_booster(MockFraxBooster, gov, frax_pid, staking_address):
+    frax_booster = gov.deploy(MockFraxBooster)
+    frax_booster.addPool(frax_pid, staking_address, {"from": gov})
+    yield frax_booster
+
+
+########## PRISMA ##########
+
+
+@pytest.fixture(scope="session")
+def prisma_vault(MockPrismaVault, gov):
+    yield gov.deploy(MockPrismaVault)
+
+
+@pytest.fixture(scope="session")
+def prisma_convex_factory(
+    MockPrismaFactory,
+    MockPrismaReceiver,
+    gov,
+    pid,
+    token,
+    crv,
+    convex_token,
+    yprisma,
+    prisma_vault,
+):
+    factory = gov.deploy(MockPrismaFactory)
+    receiver = gov.deploy(
+        MockPrismaReceiver, token, crv, convex_token, yprisma, prisma_vault
+    )
+    factory.setReceiver(pid, receiver, {"from": gov})
+    yield factory
+
+
+@pytest.fixture(scope="session")
+def prisma_curve_factory(MockPrismaFactory, gov):
+    yield gov.deploy(MockPrismaFactory)
@@ -1,7 +1,7 @@
 import brownie
 from brownie import chain, Contract
 import pytest
-from utils import harvest_strategy
+from utils import harvest_strategy, advance_chain
 
 # make sure cloned strategy works just like normal
 def test_cloning(
@@ -360,8 +360,7 @@ def test_cloning(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     (profit, loss) = harvest_strategy(
         use_yswaps,
@@ -454,13 +453,11 @@ def test_cloning(
     )
 
     # simulate five days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # withdraw and confirm we made money, or at least that we have about the same (profit whale has to be different from normal whale)
     vault.withdraw({"from": whale})
@@ -473,3 +470,143 @@ def test_cloning(
 
     # make sure our PPS went us as well
     assert vault.pricePerShare() >= before_pps
+
+
+# our immutable-args clones should be cheaper to deploy and to read from, and otherwise work just like normal
+def test_cloning_with_immutable_args(
+    gov,
+    token,
+    vault,
+    strategist,
+    whale,
+    strategy,
+    rewards,
+    keeper,
+    amount,
+    contract_name,
+    is_clonable,
+    tests_using_tenderly,
+    profit_whale,
+    profit_amount,
+    target,
+    use_yswaps,
+    which_strategy,
+    trade_factory,
+    pid,
+    new_proxy,
+    booster,
+    convex_token,
+    gauge,
+    frax_pid,
+    staking_address,
+    frax_booster,
+    prisma_vault,
+    prisma_receiver,
+):
+    # skip this test if we don't clone. tenderly also doesn't give us return values or gas used.
+    if not is_clonable or tests_using_tenderly:
+        return
+
+    # our clone function, its strategy-specific args, and our values that are immutable args on our new clones
+    if which_strategy == 0:  # convex
+        clone_function = "cloneStrategyConvex"
+        clone_args = [pid, 10_000 * 1e6, 25_000 * 1e6, booster, convex_token]
+        immutables = ["depositContract", "rewardsContract", "pid"]
+    elif which_strategy == 1:  # curve
+        clone_function = "cloneStrategyCurveBoosted"
+        clone_args = [new_proxy, gauge]
+        immutables = ["proxy", "gauge"]
+    elif which_strategy == 2:  # prisma convex
+        clone_function = "cloneStrategyPrismaConvex"
+        clone_args = [10_000 * 1e6, 25_000 * 1e6, prisma_vault, prisma_receiver]
+        immutables = ["prismaVault", "prismaReceiver"]
+    else:  # frax
+        clone_function = "cloneStrategyConvexFrax"
+        clone_args = [
+            frax_pid,
+            staking_address,
+            10_000 * 1e6,
+            25_000 * 1e6,
+            frax_booster,
+        ]
+        immutables = ["fraxBooster", "stakingAddress", "fraxPid"]
+
+    def clone(function_name):
+        tx = getattr(strategy, function_name)(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            trade_factory,
+            *clone_args,
+            {"from": gov},
+        )
+        return (contract_name.at(tx.events["Cloned"]["clone"]), tx.gas_used)
+
+    (plain_strategy, plain_gas) = clone(clone_function)
+    (args_strategy, args_gas) = clone(clone_function + "WithArgs")
+    print(f"\nClone deployment gas: {plain_gas} plain, {args_gas} with immutable args")
+    assert args_gas < plain_gas
+
+    # same values, cheaper reads
+    for immutable in immutables:
+        assert (
+            getattr(args_strategy, immutable)() == getattr(plain_strategy, immutable)()
+        )
+        plain_read = getattr(plain_strategy, immutable).estimate_gas()
+        args_read = getattr(args_strategy, immutable).estimate_gas()
+        print(
+            f"{immutable} read gas: {plain_read} plain, {args_read} with immutable args"
+        )
+        assert args_read < plain_read
+
+    # shouldn't be able to clone a clone, or initialize again
+    with brownie.reverts():
+        getattr(args_strategy, clone_function + "WithArgs")(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            trade_factory,
+            *clone_args,
+            {"from": gov},
+        )
+    with brownie.reverts():
+        args_strategy.initialize(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            trade_factory,
+            *clone_args,
+            {"from": gov},
+        )
+
+    # swap our original strategy for our new clone, and make sure it can deposit and withdraw
+    vault.revokeStrategy(strategy, {"from": gov})
+    vault.removeStrategyFromQueue(strategy, {"from": gov})
+    vault.addStrategy(args_strategy, 10_000, 0, 2**256 - 1, 0, {"from": gov})
+    if which_strategy == 1:
+        new_proxy.approveStrategy(gauge, args_strategy, {"from": gov})
+
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    (profit, loss) = harvest_strategy(
+        use_yswaps,
+        args_strategy,
+        token,
+        gov,
+        profit_whale,
+        profit_amount,
+        target,
+    )
+    assert args_strategy.stakedBalance() > 0
+    assert args_strategy.estimatedTotalAssets() >= amount
+
+    if which_strategy == 4:
+        # wait a week so our frax LPs are unlocked
+        advance_chain(86400 * 7)
+
+    starting_whale = token.balanceOf(whale)
+    vault.withdraw({"from": whale})
+    assert token.balanceOf(whale) >= starting_whale + amount
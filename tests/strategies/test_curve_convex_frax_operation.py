@@ -1,7 +1,7 @@
 import brownie
-from brownie import chain, ZERO_ADDRESS, Contract
+from brownie import chain, ZERO_ADDRESS, Contract, interface
 import pytest
-from utils import harvest_strategy
+from utils import harvest_strategy, advance_chain
 
 
 # this test makes sure we can use keepCVX and keepCRV
@@ -80,8 +80,7 @@ def test_keep(
     )
 
     # sleep to get some profit
-    chain.sleep(sleep_time)
-    chain.mine(1)
+    advance_chain(sleep_time)
 
     # normal operation
     if which_strategy == 0:
@@ -379,8 +378,7 @@ def test_proxy_rewards(
     )
 
     # simulate profits
-    chain.sleep(sleep_time)
-    chain.mine(1)
+    advance_chain(sleep_time)
 
     # add a second rewards token to our array, doesn't matter what
     second_reward_token = fxs
@@ -509,11 +507,9 @@ def test_lower_keks(
 
     # deposit and harvest multiple separate times to increase our nextKek
     vault.deposit(amount / 20, {"from": whale})
-    chain.sleep(86400)
-    chain.mine(1)
+    advance_chain(86400)
     tx = strategy.harvest({"from": gov})
-    chain.sleep(1)
-    chain.mine(1)
+    advance_chain(1)
 
     # can't set to zero
     with brownie.reverts():
@@ -609,8 +605,7 @@ def test_lower_keks(
         print("Wait for unlock to lower the number of keks we have")
 
     # wait another week so our frax LPs are unlocked
-    chain.sleep(86400 * 7)
-    chain.mine(1)
+    advance_chain(86400 * 7)
 
     # check how much locked stake we have (should be zero)
     locked = strategy.stillLockedStake() / 1e18
@@ -996,6 +991,7 @@ def test_manual_withdrawal(
     convex_token,
     frax_pid,
     target,
+    staking_address,
 ):
     if which_strategy != 4:
         return
@@ -1073,6 +1069,14 @@ def test_manual_withdrawal(
     locked = strategy.stillLockedStake() / 1e18
     print("Locked stake:", locked)
 
+    # our own kek records should match the staking contract's
+    stakes = interface.IConvexFrax(staking_address).lockedStakesOf(strategy.userVault())
+    for i in range(strategy.kekInfo()["nextKek"]):
+        kek = strategy.keks(i)
+        assert kek["kekId"] == stakes[i]["kek_id"]
+        assert kek["amount"] == stakes[i]["amount"]
+        assert kek["endingTimestamp"] == stakes[i]["ending_timestamp"]
+
     # test withdrawing 1 kek manually at a time
     assert strategy.balanceOfWant() == profit_amount
     index_to_withdraw = strategy.kekInfo()["nextKek"] - 1
@@ -1081,10 +1085,96 @@ def test_manual_withdrawal(
     with brownie.reverts():
         strategy.manualWithdraw(index_to_withdraw, {"from": gov})
 
-    chain.sleep(86400 * 7)
-    chain.mine(1)
+    advance_chain(86400 * 7)
     strategy.manualWithdraw(index_to_withdraw, {"from": gov})
     assert strategy.balanceOfWant() > 0
+    assert strategy.keks(index_to_withdraw)["amount"] == 0
+
+
+# make sure we withdraw as few keks as we can, and the smallest ones that get the job done
+def test_withdrawal_planner(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    which_strategy,
+):
+    if which_strategy != 4:
+        return
+
+    # lock three keks of different sizes
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    for kek_size in [amount // 20, amount // 5, amount // 10]:
+        vault.deposit(kek_size, {"from": whale})
+        strategy.harvest({"from": gov})
+        advance_chain(1)
+    assert strategy.kekInfo()["nextKek"] == 3
+
+    # nothing is unlocked yet
+    (kek_indices, planned) = strategy.previewWithdrawal(amount // 20)
+    assert len(kek_indices) == 0 and planned == 0
+
+    # wait a week so our frax LPs are unlocked
+    advance_chain(86400 * 7)
+
+    # our smallest kek that covers the whole amount, not our oldest
+    (kek_indices, planned) = strategy.previewWithdrawal(amount // 20 + 1)
+    assert list(kek_indices) == [2]
+    assert planned == amount // 10
+
+    # no single kek covers this, so take our largest and then the smallest that covers the rest
+    (kek_indices, planned) = strategy.previewWithdrawal(amount // 5 + amount // 20)
+    assert list(kek_indices) == [1, 0]
+    assert planned == amount // 5 + amount // 20
+
+    # withdrawing from our vault follows the same plan
+    vault.withdraw(amount // 20 + 1, {"from": whale})
+    assert strategy.keks(2)["amount"] == 0
+    assert strategy.keks(1)["amount"] == amount // 5
+    assert strategy.keks(0)["amount"] == amount // 20
+
+
+def test_unlock_schedule(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    which_strategy,
+):
+    if which_strategy != 4:
+        return
+
+    # lock two keks, a few seconds apart so they unlock at different times
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    for kek_size in [amount // 10, amount // 5]:
+        vault.deposit(kek_size, {"from": whale})
+        strategy.harvest({"from": gov})
+        advance_chain(10)
+    first_kek = strategy.keks(0)
+    second_kek = strategy.keks(1)
+    assert first_kek["endingTimestamp"] < second_kek["endingTimestamp"]
+
+    # nothing is liquid now, then each kek adds to our total as it unlocks
+    (unlock_times, cumulative_liquid) = strategy.unlockSchedule()
+    assert list(unlock_times[1:]) == [
+        first_kek["endingTimestamp"],
+        second_kek["endingTimestamp"],
+    ]
+    assert list(cumulative_liquid) == [
+        0,
+        amount // 10,
+        amount // 10 + amount // 5,
+    ]
+
+    # once everything unlocks, it all lands in our first bucket
+    advance_chain(86400 * 7)
+    (unlock_times, cumulative_liquid) = strategy.unlockSchedule()
+    assert len(unlock_times) == 1
+    assert list(cumulative_liquid) == [amount // 10 + amount // 5]
 
 
 # lower our number of keks
@@ -1187,11 +1277,9 @@ def test_lower_keks_add_to_existing(
 
     # deposit and harvest multiple separate times to increase our nextKek
     vault.deposit(amount / 20, {"from": whale})
-    chain.sleep(86400)
-    chain.mine(1)
+    advance_chain(86400)
     tx = strategy.harvest({"from": gov})
-    chain.sleep(1)
-    chain.mine(1)
+    advance_chain(1)
 
     # can't set to zero
     with brownie.reverts():
@@ -1287,8 +1375,7 @@ def test_lower_keks_add_to_existing(
     print("Wait for unlock to lower the number of keks we have")
 
     # wait another week so our frax LPs are unlocked
-    chain.sleep(86400 * 7)
-    chain.mine(1)
+    advance_chain(86400 * 7)
 
     # check how much locked stake we have (should be zero)
     locked = strategy.stillLockedStake() / 1e18
@@ -1877,8 +1964,7 @@ def test_keks_add_to_existing(
         output[4],
     )
     assert len(output) == 5
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # whale should be able to withdraw all of his funds now
     vault.withdraw({"from": whale})
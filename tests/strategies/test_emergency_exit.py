@@ -1,7 +1,7 @@
 import pytest
 import brownie
 from brownie import Contract, chain, interface
-from utils import harvest_strategy, check_status
+from utils import harvest_strategy, check_status, advance_chain
 
 # test that emergency exit works properly
 def test_emergency_exit(
@@ -80,8 +80,7 @@ def test_emergency_exit(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # check our current status
     print("\nAfter exit + before third harvest")
@@ -156,8 +155,7 @@ def test_emergency_exit(
     assert strategy.estimatedTotalAssets() == 0
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -271,8 +269,7 @@ def test_emergency_exit_with_profit(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # for some reason withdrawing via our user vault doesn't include the same getReward() call that the staking pool does natively
     # since emergencyExit doesn't enter prepareReturn, we have to manually claim these rewards
@@ -348,8 +345,7 @@ def test_emergency_exit_with_profit(
     assert strategy.estimatedTotalAssets() == 0
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -450,19 +446,12 @@ def test_emergency_exit_with_loss(
         assert strategy.estimatedTotalAssets() == 0
     elif which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
-
-        # try and make the staking pool send away assets to simulate losses
-        user_vault = Contract(strategy.userVault())
-        staking_contract = Contract(staking_address)
-        staking_token = Contract(staking_contract.stakingToken())
-        stake = staking_contract.lockedStakesOf(user_vault)[0]
-        kek = stake[0]
-        user_vault.withdrawLocked(kek, {"from": strategy})
-        staking_token.transfer(
-            gov, staking_token.balanceOf(strategy), {"from": strategy}
-        )
+        advance_chain(86400 * 7)
+
+        # withdraw our first kek through our strategy (so it keeps its kek records) and send it away to simulate losses
+        to_send = strategy.keks(0)["amount"]
+        strategy.manualWithdraw(0, {"from": gov})
+        token.transfer(gov, to_send, {"from": strategy})
         assert strategy.estimatedTotalAssets() == 0
 
     ################# SET FALSE IF PROFIT EXPECTED. ADJUST AS NEEDED. #################
@@ -605,8 +594,7 @@ def test_emergency_exit_with_loss(
     assert vault.totalAssets() == expected_assets
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -614,8 +602,7 @@ def test_emergency_exit_with_loss(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # withdraw and see how down bad we are, confirming we can withdraw from an empty (or mostly empty) vault
     vault.withdraw({"from": whale})
@@ -702,19 +689,12 @@ def test_emergency_exit_with_no_loss(
         prisma_receiver.withdraw(gov, to_send, {"from": strategy})
     elif which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
-
-        # try and make the staking pool send away assets to simulate losses
-        user_vault = Contract(strategy.userVault())
-        staking_contract = Contract(staking_address)
-        staking_token = Contract(staking_contract.stakingToken())
-        stake = staking_contract.lockedStakesOf(user_vault)[0]
-        kek = stake[0]
-        user_vault.withdrawLocked(kek, {"from": strategy})
-        staking_token.transfer(
-            gov, staking_token.balanceOf(strategy), {"from": strategy}
-        )
+        advance_chain(86400 * 7)
+
+        # withdraw our first kek through our strategy (so it keeps its kek records) and send it away to simulate losses
+        to_send = strategy.keks(0)["amount"]
+        strategy.manualWithdraw(0, {"from": gov})
+        token.transfer(gov, to_send, {"from": strategy})
 
     ################# SET FALSE IF PROFIT EXPECTED. ADJUST AS NEEDED. #################
     # set this true if no profit on this test. it is normal for a strategy to not generate profit here.
@@ -747,10 +727,8 @@ def test_emergency_exit_with_no_loss(
         token.transfer(strategy, to_send, {"from": gov})
         assert strategy.estimatedTotalAssets() > 0
     elif which_strategy == 4:
-        # gov unwraps and sends it back, glad someone was watching!
-        to_unwrap = staking_token.balanceOf(gov)
-        staking_token.withdrawAndUnwrap(to_unwrap, {"from": gov})
-        token.transfer(strategy, to_unwrap, {"from": gov})
+        # gov sends it back, glad someone was watching!
+        token.transfer(strategy, to_send, {"from": gov})
         assert strategy.estimatedTotalAssets() > 0
 
     # check our current status
@@ -873,8 +851,7 @@ def test_emergency_exit_with_no_loss(
         assert loss == 0
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -892,8 +869,7 @@ def test_emergency_exit_with_no_loss(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # withdraw and confirm we made money, or at least that we have about the same
     vault.withdraw({"from": whale})
@@ -995,8 +971,7 @@ def test_emergency_shutdown_from_vault(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     (profit, loss) = harvest_strategy(
         use_yswaps,
@@ -1058,8 +1033,7 @@ def test_emergency_shutdown_from_vault(
         assert loss == 0
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -1077,8 +1051,7 @@ def test_emergency_shutdown_from_vault(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # withdraw and confirm we made money, or at least that we have about the same (profit whale has to be different from normal whale)
     vault.withdraw({"from": whale})
@@ -1284,8 +1257,7 @@ def test_emergency_withdraw_method_0(
     assert vault.totalAssets() == expected_assets
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -1478,8 +1450,7 @@ def test_emergency_withdraw_method_1(
     assert vault.totalAssets() == expected_assets
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
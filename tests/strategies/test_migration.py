@@ -1,5 +1,5 @@
 import pytest
-from utils import harvest_strategy
+from utils import harvest_strategy, advance_chain
 from brownie import accounts, interface, chain
 import brownie
 
@@ -122,8 +122,7 @@ def test_migration(
         with brownie.reverts():
             vault.migrateStrategy(strategy, new_strategy, {"from": gov})
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
         user_vault = interface.IFraxVault(strategy.userVault())
         user_vault.getReward({"from": gov})
@@ -180,8 +179,7 @@ def test_migration(
     vault_new_assets = vault.totalAssets()
 
     # simulate earnings
-    chain.sleep(sleep_time)
-    chain.mine(1)
+    advance_chain(sleep_time)
 
     # Test out our migrated strategy, confirm we're making a profit
     (profit, loss) = harvest_strategy(
@@ -301,8 +299,7 @@ def test_empty_migration(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # set our debtRatio to zero so our harvest sends all funds back to vault
     vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
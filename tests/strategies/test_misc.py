@@ -1,5 +1,5 @@
 import pytest
-from utils import harvest_strategy, check_status
+from utils import harvest_strategy, check_status, advance_chain
 import brownie
 from brownie import ZERO_ADDRESS, chain, interface, Contract
 from utils import harvest_strategy
@@ -130,8 +130,7 @@ def test_yprisma_claim(
         assert yprisma.balanceOf(strategy) == 0
 
     # sleep to get to the new epoch
-    chain.sleep(60 * 60 * 24 * 7)
-    chain.mine()
+    advance_chain(60 * 60 * 24 * 7)
 
     claimable_profit = strategy.claimableProfitInUsdc()
     assert claimable_profit > 0
@@ -237,8 +236,7 @@ def test_yprisma_force_claim(
     balance_1 = yprisma.balanceOf(strategy)
 
     # sleep to get to the new epoch
-    chain.sleep(60 * 60 * 24 * 7)
-    chain.mine()
+    advance_chain(60 * 60 * 24 * 7)
 
     # turn off claims to not add any more yprisma with the next harvest
     strategy.setClaimParams(False, False, {"from": vault.governance()})
@@ -394,8 +392,7 @@ def test_revoke_strategy_from_vault(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
     (profit, loss) = harvest_strategy(
         use_yswaps,
         strategy,
@@ -447,13 +444,11 @@ def test_revoke_strategy_from_vault(
     assert pytest.approx(strategy_assets_after_revoke, rel=RELATIVE_APPROX) == 0
 
     # simulate five days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # withdraw and confirm we made money, or at least that we have about the same (profit whale has to be different from normal whale)
     vault.withdraw({"from": whale})
@@ -532,22 +527,19 @@ def test_setters(
         assert strategy.estimatedTotalAssets() > total_staked
 
         # get the rest of our funds staked
-        chain.sleep(1)
-        chain.mine(1)
+        advance_chain(1)
         strategy.setDepositParams(1e21, 1e29, False, {"from": gov})
         strategy.harvest({"from": gov})
         assert strategy.estimatedTotalAssets() >= amount
 
     # check that we have claimable rewards, have to call for frax tho
     if which_strategy == 4:
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
         profit = strategy.claimableProfitInUsdc.call()
         assert profit > 0
         print("Claimable Profit:", profit / 1e6)
     elif which_strategy == 0:
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
         profit = strategy.claimableProfitInUsdc()
         assert profit > 0
         print("Claimable Profit:", profit / 1e6)
@@ -557,15 +549,31 @@ def test_setters(
         strategy.setLocalKeepCrvs(10, 10, {"from": gov})
         strategy.setClaimRewards(True, {"from": gov})
 
+        # our config is packed into structs, but our individual getters still work
+        keep_info = strategy.keepInfo()
+        assert keep_info["localKeepCVX"] == strategy.localKeepCVX() == 10
+        assert keep_info["convexVoter"] == strategy.convexVoter() == gov
+        harvest_info = strategy.harvestInfo()
+        assert harvest_info["claimRewards"] == strategy.claimRewards() == True
+        assert (
+            harvest_info["harvestProfitMaxInUsdc"] == strategy.harvestProfitMaxInUsdc()
+        )
+
         if not tests_using_tenderly:
             # test our reverts as well
             with brownie.reverts():
                 strategy.setLocalKeepCrvs(1000000, 0, {"from": gov})
             with brownie.reverts():
                 strategy.setLocalKeepCrvs(0, 100000000, {"from": gov})
+            # our profit limits need to fit in our packed struct
+            with brownie.reverts():
+                strategy.setHarvestTriggerParams(
+                    2**112, 2**112, False, {"from": gov}
+                )
     elif which_strategy == 1:
         strategy.setVoter(gov, {"from": gov})
         strategy.setLocalKeepCrv(10, {"from": gov})
+        assert strategy.keepInfo() == (gov, 10)
 
         if not tests_using_tenderly:
             # test our reverts as well
@@ -575,6 +583,8 @@ def test_setters(
     if which_strategy == 2:
         strategy.setVoters(gov, gov, gov, {"from": gov})
         strategy.setLocalKeepCrvs(10, 10, 10, {"from": gov})
+        assert strategy.keepInfo()["localKeepYPrisma"] == strategy.localKeepYPrisma()
+        assert strategy.keepInfo()["yprismaVoter"] == strategy.yprismaVoter() == gov
         if not tests_using_tenderly:
             # test our reverts as well
             with brownie.reverts():
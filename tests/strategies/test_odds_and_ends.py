@@ -1,7 +1,7 @@
 import brownie
 from brownie import Contract, chain, ZERO_ADDRESS, interface
 import pytest
-from utils import harvest_strategy, check_status
+from utils import harvest_strategy, check_status, advance_chain
 
 # this module includes other tests we may need to generate, for instance to get best possible coverage on prepareReturn or liquidatePosition
 # do any extra testing here to hit all parts of liquidatePosition
@@ -80,19 +80,12 @@ def test_liquidatePosition(
         assert strategy.estimatedTotalAssets() == 0
     else:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
-
-        # try and make the staking pool send away assets to simulate losses
-        user_vault = Contract(strategy.userVault())
-        staking_contract = Contract(staking_address)
-        staking_token = Contract(staking_contract.stakingToken())
-        stake = staking_contract.lockedStakesOf(user_vault)[0]
-        kek = stake[0]
-        user_vault.withdrawLocked(kek, {"from": strategy})
-        staking_token.transfer(
-            gov, staking_token.balanceOf(strategy), {"from": strategy}
-        )
+        advance_chain(86400 * 7)
+
+        # withdraw our first kek through our strategy (so it keeps its kek records) and send it away to simulate losses
+        to_send = strategy.keks(0)["amount"]
+        strategy.manualWithdraw(0, {"from": gov})
+        token.transfer(gov, to_send, {"from": strategy})
 
     # check our current status
     print("\nAfter fund transfer, before withdrawal")
@@ -288,19 +281,12 @@ def test_rekt(
         assert strategy.estimatedTotalAssets() == 0
     elif which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
-
-        # try and make the staking pool send away assets to simulate losses
-        user_vault = Contract(strategy.userVault())
-        staking_contract = Contract(staking_address)
-        staking_token = Contract(staking_contract.stakingToken())
-        stake = staking_contract.lockedStakesOf(user_vault)[0]
-        kek = stake[0]
-        user_vault.withdrawLocked(kek, {"from": strategy})
-        staking_token.transfer(
-            gov, staking_token.balanceOf(strategy), {"from": strategy}
-        )
+        advance_chain(86400 * 7)
+
+        # withdraw our first kek through our strategy (so it keeps its kek records) and send it away to simulate losses
+        to_send = strategy.keks(0)["amount"]
+        strategy.manualWithdraw(0, {"from": gov})
+        token.transfer(gov, to_send, {"from": strategy})
 
     # confirm we emptied the strategy
     assert strategy.estimatedTotalAssets() == 0
@@ -329,8 +315,7 @@ def test_rekt(
         assert vault.totalAssets() == 0
 
     # simulate 5 days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # withdraw and see how down bad we are, confirm we can withdraw from an empty vault
     vault.withdraw({"from": whale})
@@ -453,23 +438,17 @@ def test_empty_strat(
         assert strategy.estimatedTotalAssets() == 0
     elif which_strategy == 4:
         # wait another week so our frax LPs are unlocked
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
         # we have to manually claim these rewards
         # also, FXS profit accrues every block, so we will still get some dust rewards after we exit as well if we were to call getReward() again
         user_vault = interface.IFraxVault(strategy.userVault())
         user_vault.getReward({"from": gov})
 
-        # try and make the staking pool send away assets to simulate losses
-        staking_contract = Contract(staking_address)
-        staking_token = Contract(staking_contract.stakingToken())
-        stake = staking_contract.lockedStakesOf(user_vault)[0]
-        kek = stake[0]
-        user_vault.withdrawLocked(kek, {"from": strategy})
-        staking_token.transfer(
-            gov, staking_token.balanceOf(strategy), {"from": strategy}
-        )
+        # withdraw our first kek through our strategy (so it keeps its kek records) and send it away to simulate losses
+        to_send = strategy.keks(0)["amount"]
+        strategy.manualWithdraw(0, {"from": gov})
+        token.transfer(gov, to_send, {"from": strategy})
 
     # confirm we emptied the strategy
     assert strategy.estimatedTotalAssets() == 0
@@ -1,5 +1,9 @@
 from brownie import chain, Contract, ZERO_ADDRESS, interface
-from utils import harvest_strategy
+from utils import (
+    harvest_strategy_fast as harvest_strategy,
+    advance_chain,
+    advance_blocks,
+)
 import pytest
 
 # test the our strategy's ability to deposit, harvest, and withdraw, with different optimal deposit tokens if we have them
@@ -94,8 +98,7 @@ def test_simple_harvest(
         print("Next kek:", strategy.kekInfo()["nextKek"])
 
     # simulate profits, the mine is needed for anvil
-    chain.sleep(sleep_time)
-    chain.mine(1)
+    advance_chain(sleep_time)
 
     # check our pending profit for frax
     if which_strategy == 4:
@@ -154,8 +157,7 @@ def test_simple_harvest(
         new_assets > old_assets
 
     # simulate five days of waiting for share price to bump back up
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # Display estimated APR
     print(
@@ -167,8 +169,7 @@ def test_simple_harvest(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # withdraw and confirm we made money, or at least that we have about the same
     vault.withdraw({"from": whale})
@@ -253,18 +254,18 @@ def test_check_rewards(
 
         if which_strategy == 1 and try_blocks:
             # test our proxy, some old gauges use blocks instead of seconds. make sure we're earning!
-            chain.mine(240)
+            advance_blocks(240)
             assert gauge.balanceOf(voter) > 0
             balance_1 = gauge.claimable_reward(voter)
             print("Earned balance:", balance_1)
             chain.sleep(1)
-            chain.mine(240)
+            advance_blocks(240)
             chain.sleep(1)
             balance_2 = gauge.claimable_reward(voter)
             print("Earned balance:", balance_2)
             assert balance_2 > balance_1
             tx = strategy.harvest({"from": gov})
-            chain.mine(240)
+            advance_blocks(240)
             chain.sleep(1)
             balance_3 = gauge.claimable_reward(voter)
             print("Earned balance:", balance_3)
@@ -1,7 +1,9 @@
 import brownie
 from brownie import chain, Contract, ZERO_ADDRESS, accounts
+import numpy as np
 import pytest
-from utils import harvest_strategy, check_status
+from utils import harvest_strategy, check_status, advance_chain
+from scripts.trigger_simulator import snapshot, simulate
 
 # test our harvest triggers
 # for frax, skip this when trying coverage
@@ -155,8 +157,7 @@ def test_triggers(
                 assert profit > 0
 
         # simulate seven days of waiting for share price to bump back up and LPs to unlock
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
     else:
         # inactive strategy (0 DR and 0 assets) shouldn't be touched by keepers
         currentDebtRatio = vault.strategies(strategy)["debtRatio"]
@@ -328,8 +329,7 @@ def test_triggers(
                 assert profit > 0
 
         # simulate five days of waiting for share price to bump back up
-        chain.sleep(86400 * 5)
-        chain.mine(1)
+        advance_chain(86400 * 5)
 
     # withdraw and confirm we made money, or at least that we have about the same
     vault.withdraw({"from": whale})
@@ -339,3 +339,168 @@ def test_triggers(
         )
     else:
         assert token.balanceOf(whale) > starting_whale
+
+
+# test pricing our rewards with our shared snapshot instead of chainlink directly
+def test_reward_price_snapshot(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    profit_whale,
+    profit_amount,
+    target,
+    use_yswaps,
+    which_strategy,
+    reward_price_snapshot,
+    chain,
+):
+    # curve boosted strategies don't price their rewards
+    if which_strategy == 1:
+        return
+
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    (profit, loss) = harvest_strategy(
+        use_yswaps,
+        strategy,
+        token,
+        gov,
+        profit_whale,
+        profit_amount,
+        target,
+    )
+
+    # sleep to accrue some rewards
+    advance_chain(sleep_time)
+    direct_profit = strategy.claimableProfitInUsdc.call()
+    direct_gas = strategy.claimableProfitInUsdc.estimate_gas()
+    assert direct_profit > 0
+
+    # only management can set our snapshot
+    with brownie.reverts():
+        strategy.setRewardPriceSnapshot(reward_price_snapshot, {"from": whale})
+    strategy.setRewardPriceSnapshot(reward_price_snapshot, {"from": gov})
+
+    # before we update, our snapshot is stale and should give us live values
+    assert reward_price_snapshot.isStale()
+    assert strategy.claimableProfitInUsdc.call() == pytest.approx(
+        direct_profit, rel=1e-6
+    )
+
+    # anyone can update, and our cached values should match too, just cheaper
+    reward_price_snapshot.update({"from": whale})
+    assert not reward_price_snapshot.isStale()
+    assert strategy.claimableProfitInUsdc.call() == pytest.approx(
+        direct_profit, rel=1e-6
+    )
+    snapshot_gas = strategy.claimableProfitInUsdc.estimate_gas()
+    print("claimableProfitInUsdc gas direct:", direct_gas, "snapshot:", snapshot_gas)
+    assert snapshot_gas < direct_gas
+
+    # our trigger should still work, and our snapshot should expire after our ttl
+    strategy.harvestTrigger.call(0, {"from": gov})
+    advance_chain(reward_price_snapshot.ttl() + 1)
+    assert reward_price_snapshot.isStale()
+
+    # we can always go back to pricing directly
+    strategy.setRewardPriceSnapshot(ZERO_ADDRESS, {"from": gov})
+    assert strategy.rewardPriceSnapshot() == ZERO_ADDRESS
+
+
+# make sure our off-chain trigger simulator agrees with harvestTrigger, branch for branch
+def test_trigger_simulator(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    sleep_time,
+    profit_whale,
+    profit_amount,
+    target,
+    base_fee_oracle,
+    use_yswaps,
+    which_strategy,
+):
+    # compare our simulator to our strategy's own trigger. expected=None only checks that they agree.
+    def check(expected=None, expected_reason=None):
+        state, now = snapshot([(strategy.address, which_strategy)])
+        harvest, reasons = simulate(state, now)
+        triggered = strategy.harvestTrigger.call(0, {"from": gov})
+        print(f"\nTrigger: {triggered}, simulated: {harvest[0]} ({reasons[0]})")
+        assert harvest[0] == triggered
+        if expected is not None:
+            assert triggered == expected
+        if expected_reason is not None:
+            assert reasons[0] == expected_reason
+        return state, now, reasons[0]
+
+    # inactive strategy (0 DR and 0 assets)
+    currentDebtRatio = vault.strategies(strategy)["debtRatio"]
+    vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
+    harvest_strategy(
+        use_yswaps, strategy, token, gov, profit_whale, profit_amount, target
+    )
+    check(False, "inactive")
+    vault.updateStrategyDebtRatio(strategy, currentDebtRatio, {"from": gov})
+
+    # deposit, but don't harvest yet
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    strategy.setCreditThreshold(1, {"from": gov})
+    check(True, "credit")
+    strategy.setCreditThreshold(1e24, {"from": gov})
+
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    check(True, "force")
+
+    # just harvested, nothing to do
+    harvest_strategy(
+        use_yswaps, strategy, token, gov, profit_whale, profit_amount, target
+    )
+    check(False, "none")
+
+    # simulate earnings, then check our delays
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    strategy.setMaxReportDelay(sleep_time - 1, {"from": gov})
+    # prisma also waits for max boost here
+    check(None if which_strategy == 2 else True)
+    strategy.setMaxReportDelay(86400 * 21, {"from": gov})
+    if which_strategy == 1:
+        strategy.setMinReportDelay(sleep_time - 1, {"from": gov})
+        check(True, "min_delay")
+        strategy.setMinReportDelay(86400 * 21, {"from": gov})
+
+    # high base fee blocks everything else
+    base_fee_oracle.setManualBaseFeeBool(False, {"from": gov})
+    check(False, "base_fee")
+    base_fee_oracle.setManualBaseFeeBool(True, {"from": gov})
+
+    # sweep claimable profit across our whole range at once, without touching our node
+    if which_strategy != 1:
+        (state, now, _) = check()
+        max_profit = state["harvest_profit_max"][0]
+        profits = np.linspace(0, 2 * max_profit, 10_000)
+        sweep = {
+            field: np.repeat(values, len(profits)) for field, values in state.items()
+        }
+        sweep["claimable_profit"] = profits
+        harvest, reasons = simulate(sweep, now)
+        assert harvest[profits > max_profit].all()
+        assert set(reasons[profits > max_profit]) == {"max_profit"}
+
+    # convex can also be blocked waiting on an earmark
+    if which_strategy == 0:
+        strategy.setHarvestTriggerParams(90000e6, 150000e6, True, {"from": gov})
+        (state, _, reason) = check()
+        assert state["needs_earmark"][0] == strategy.needsEarmarkReward()
+        if strategy.needsEarmarkReward():
+            assert reason == "needs_earmark"
+        strategy.setHarvestTriggerParams(90000e6, 150000e6, False, {"from": gov})
@@ -1,6 +1,6 @@
 from brownie import chain, ZERO_ADDRESS
 import pytest
-from utils import harvest_strategy, check_status
+from utils import harvest_strategy, check_status, advance_chain
 
 # these tests all assess whether a strategy will hit accounting errors following donations to the strategy.
 # lower debtRatio to 50%, donate, withdraw less than the donation, then harvest
@@ -79,8 +79,7 @@ def test_withdraw_after_donation_1(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw half of the donation, this ensures that we test withdrawing without pulling from the staked balance
     to_withdraw = donation / 2
@@ -174,8 +173,7 @@ def test_withdraw_after_donation_1(
     new_params = vault.strategies(strategy)
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -301,8 +299,7 @@ def test_withdraw_after_donation_2(
 
     if which_strategy == 4:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw half of the donation, this ensures that we test withdrawing without pulling from the staked balance
     to_withdraw = donation / 2
@@ -395,8 +392,7 @@ def test_withdraw_after_donation_2(
     new_params = vault.strategies(strategy)
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -511,8 +507,7 @@ def test_withdraw_after_donation_3(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw more than the donation, ensuring we pull from strategy
     to_withdraw = donation * 1.05
@@ -605,8 +600,7 @@ def test_withdraw_after_donation_3(
     new_params = vault.strategies(strategy)
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -724,8 +718,7 @@ def test_withdraw_after_donation_4(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw more than the donation, ensuring we pull from strategy
     to_withdraw = donation * 1.05
@@ -819,8 +812,7 @@ def test_withdraw_after_donation_4(
     new_params = vault.strategies(strategy)
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -932,8 +924,7 @@ def test_withdraw_after_donation_5(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw more than the donation, ensuring we pull from strategy
     to_withdraw = donation * 1.05
@@ -1024,8 +1015,7 @@ def test_withdraw_after_donation_5(
     new_params = vault.strategies(strategy)
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -1135,8 +1125,7 @@ def test_withdraw_after_donation_6(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw half of the donation, this ensures that we test withdrawing without pulling from the staked balance
     to_withdraw = donation / 2
@@ -1227,8 +1216,7 @@ def test_withdraw_after_donation_6(
     new_params = vault.strategies(strategy)
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -1354,8 +1342,7 @@ def test_withdraw_after_donation_7(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw more than the donation, ensuring we pull from strategy
     to_withdraw = donation * 1.05
@@ -1448,8 +1435,7 @@ def test_withdraw_after_donation_7(
     new_params = vault.strategies(strategy)
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
@@ -1589,8 +1575,7 @@ def test_withdraw_after_donation_8(
 
     if which_strategy == 2:
         # wait another week so our frax LPs are unlocked, need to do this when reducing debt or withdrawing
-        chain.sleep(86400 * 7)
-        chain.mine(1)
+        advance_chain(86400 * 7)
 
     # have our whale withdraw half of the donation, this ensures that we test withdrawing without pulling from the staked balance
     to_withdraw = donation / 2
@@ -1684,8 +1669,7 @@ def test_withdraw_after_donation_8(
     current_assets = vault.totalAssets()
 
     # sleep 5 days to allow share price to normalize
-    chain.sleep(86400 * 5)
-    chain.mine(1)
+    advance_chain(86400 * 5)
 
     # check our current status
     print("\nAfter sleep for share price")
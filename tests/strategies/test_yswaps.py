@@ -1,6 +1,8 @@
 import brownie
+import os
+import pytest
 from brownie import ZERO_ADDRESS, interface, chain
-from utils import harvest_strategy
+from utils import harvest_strategy, advance_chain
 
 # test our permissionless swaps and our trade handler functions as intended
 def test_keepers_and_trade_handler(
@@ -44,8 +46,7 @@ def test_keepers_and_trade_handler(
     )
 
     # simulate profits
-    chain.sleep(sleep_time)
-    chain.mine(1)
+    advance_chain(sleep_time)
 
     # harvest, store new asset amount
     (profit, loss) = harvest_strategy(
@@ -121,8 +122,7 @@ def test_keepers_and_trade_handler(
     strategy.updateTradeFactory(trade_factory, {"from": gov})
 
     # simulate profits
-    chain.sleep(sleep_time)
-    chain.mine(1)
+    advance_chain(sleep_time)
 
     # can't set trade factory to zero
     if not tests_using_tenderly:
@@ -165,3 +165,168 @@ def test_keepers_and_trade_handler(
             else:
                 with brownie.reverts():
                     strategy.updateRewards([], {"from": whale})
+
+
+# test harvesting several strategies at once through our keeper wrapper
+def test_keeper_wrapper_batch(
+    KeeperWrapper,
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    amount,
+    profit_whale,
+):
+    # deploy a fresh keeper wrapper with our batch harvests
+    keeper_wrapper = gov.deploy(KeeperWrapper)
+    strategy.setKeeper(keeper_wrapper, {"from": gov})
+
+    ## deposit to the vault after approving
+    token.approve(vault, 2**256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+
+    # our vault can't be harvested, but that shouldn't stop our strategy from being harvested
+    tx = keeper_wrapper.harvestMany([vault, strategy], {"from": profit_whale})
+    assert tx.return_value == 1
+    assert tx.events["HarvestFailed"]["strategy"] == vault.address
+    assert tx.events["Harvested"]["strategy"] == strategy.address
+    assert strategy.estimatedTotalAssets() > 0
+    print("Batch harvest gas:", tx.gas_used)
+
+    # only harvest if our trigger is true. vault has no trigger, so it should fail and be logged
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    triggered = strategy.harvestTrigger.call(0, {"from": gov})
+    tx = keeper_wrapper.harvestManyIfTriggered(
+        [vault, strategy], 0, {"from": profit_whale}
+    )
+    assert tx.return_value == int(triggered)
+    assert tx.events["HarvestFailed"]["strategy"] == vault.address
+    assert ("Harvested" in tx.events) == triggered
+
+    # trigger is reset after harvesting, so result should match it again
+    triggered = strategy.harvestTrigger.call(0, {"from": gov})
+    tx = keeper_wrapper.harvestManyIfTriggered([strategy], 0, {"from": profit_whale})
+    assert tx.return_value == int(triggered)
+    assert "HarvestFailed" not in tx.events
+
+    # addresses without code, or that aren't strategies, shouldn't revert the batch either
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    triggered = strategy.harvestTrigger.call(0, {"from": gov})
+    tx = keeper_wrapper.harvestManyIfTriggered(
+        [ZERO_ADDRESS, keeper_wrapper, strategy], 0, {"from": profit_whale}
+    )
+    assert tx.return_value == int(triggered)
+    assert [event["strategy"] for event in tx.events["HarvestFailed"]] == [
+        ZERO_ADDRESS,
+        keeper_wrapper.address,
+    ]
+    assert ("Harvested" in tx.events) == triggered
+
+    tx = keeper_wrapper.harvestMany([ZERO_ADDRESS, strategy], {"from": profit_whale})
+    assert tx.return_value == 1
+    assert tx.events["HarvestFailed"]["strategy"] == ZERO_ADDRESS
+
+
+# updating our rewards should only touch the tokens that actually changed
+def test_update_rewards_diff(
+    gov,
+    strategy,
+    trade_factory,
+    crv,
+    rewards_token,
+    fxs,
+    which_strategy,
+    tests_using_tenderly,
+):
+    # our curve strategy is the only one we give a rewards list directly
+    if which_strategy != 1 or tests_using_tenderly:
+        return
+
+    # start from a clean slate
+    strategy.updateRewards([], {"from": gov})
+    assert rewards_token.allowance(strategy, trade_factory) == 0
+
+    # adding a token only approves that token
+    tx = strategy.updateRewards([rewards_token], {"from": gov})
+    assert len(tx.events["Approval"]) == 1
+    assert rewards_token.allowance(strategy, trade_factory) == 2**256 - 1
+    print("Add one reward token gas:", tx.gas_used)
+
+    # nothing changed, so nothing to approve
+    tx = strategy.updateRewards([rewards_token], {"from": gov})
+    assert "Approval" not in tx.events
+    print("No-op reward update gas:", tx.gas_used)
+
+    # swap one token for another, leaving our crv untouched
+    tx = strategy.updateRewards([fxs], {"from": gov})
+    assert len(tx.events["Approval"]) == 2
+    assert rewards_token.allowance(strategy, trade_factory) == 0
+    assert fxs.allowance(strategy, trade_factory) == 2**256 - 1
+    assert crv.allowance(strategy, trade_factory) == 2**256 - 1
+    assert strategy.rewardsTokens(0) == fxs.address
+
+    # and remove it again
+    strategy.updateRewards([], {"from": gov})
+    assert fxs.allowance(strategy, trade_factory) == 0
+    with brownie.reverts():
+        strategy.rewardsTokens(0)
+
+    # our crv may end up in our list too, but removing it again shouldn't revoke it
+    strategy.updateRewards([crv], {"from": gov})
+    strategy.updateRewards([], {"from": gov})
+    assert crv.allowance(strategy, trade_factory) == 2**256 - 1
+
+
+# convex and frax read their rewards lists on-chain, so we can only change them on our mocks
+@pytest.mark.skipif(
+    os.environ.get("USE_MOCKS") != "1",
+    reason="convex and frax rewards lists can only be changed on our mocks (USE_MOCKS=1)",
+)
+def test_update_rewards_diff_onchain(
+    gov,
+    strategy,
+    trade_factory,
+    crv,
+    convex_token,
+    rewards_token,
+    rewards_contract,
+    staking_address,
+    which_strategy,
+    MockExtraRewards,
+    MockFraxStaking,
+):
+    if which_strategy == 0:
+        add_reward = lambda token: rewards_contract.addExtraReward(
+            gov.deploy(MockExtraRewards, token), {"from": gov}
+        )
+        clear_rewards = lambda: rewards_contract.clearExtraRewards({"from": gov})
+    elif which_strategy == 4:
+        staking = MockFraxStaking.at(staking_address)
+        add_reward = lambda token: staking.addExtraRewardToken(token, {"from": gov})
+        clear_rewards = lambda: staking.clearExtraRewardTokens({"from": gov})
+    else:
+        return
+    strategy.updateTradeFactory(trade_factory, {"from": gov})
+
+    # a new extra reward only approves that token
+    add_reward(rewards_token)
+    tx = strategy.updateRewards({"from": gov})
+    assert len(tx.events["Approval"]) == 1
+    assert rewards_token.allowance(strategy, trade_factory) == 2**256 - 1
+    assert trade_factory.enabled(strategy, rewards_token, strategy.want())
+
+    # crv can show up as an extra reward, but we always have it approved already
+    add_reward(crv)
+    tx = strategy.updateRewards({"from": gov})
+    assert "Approval" not in tx.events
+
+    # once both are gone, only our extra reward is revoked
+    clear_rewards()
+    tx = strategy.updateRewards({"from": gov})
+    assert len(tx.events["Approval"]) == 1
+    assert rewards_token.allowance(strategy, trade_factory) == 0
+    assert not trade_factory.enabled(strategy, rewards_token, strategy.want())
+    for token in [crv, convex_token]:
+        assert token.allowance(strategy, trade_factory) == 2**256 - 1
+        assert trade_factory.enabled(strategy, token, strategy.want())
@@ -1,6 +1,31 @@
 import pytest
 import brownie, time
-from brownie import interface, chain, accounts, ZERO_ADDRESS
+from dataclasses import dataclass
+from brownie import interface, chain, accounts, multicall, web3, ZERO_ADDRESS
+
+# values that never change for a given strategy (vault, decimals, reward tokens), keyed by (strategy, target)
+_strategy_constants = {}
+
+# seconds spent in each harvest_strategy_fast call, so slow tests are easy to spot
+harvest_timings = []
+
+# move our chain forward in as few RPC calls as we can. same result as chain.sleep(seconds) followed by chain.mine(1),
+# but with one evm_mine that sets our new block's timestamp instead of an evm_increaseTime and an evm_mine. brownie
+# keeps chain.time() and its undo history in sync, just like with chain.mine.
+def advance_chain(seconds=0, blocks=1):
+    if seconds:
+        # with more than one block, brownie spreads our blocks evenly up to chain.time() + seconds
+        chain.mine(blocks, timedelta=seconds)
+    else:
+        chain.mine(blocks)
+
+
+# mine a number of blocks without skipping any time in one anvil_mine call, instead of one evm_mine per block with
+# chain.mine(blocks). useful for older gauges that accrue by block. our clock doesn't move, so chain.time() stays in
+# sync, but these blocks aren't added to brownie's chain.undo history.
+def advance_blocks(blocks):
+    web3.provider.make_request("anvil_mine", [hex(blocks)])
+
 
 # returns (profit, loss) of a harvest
 def harvest_strategy(
@@ -75,14 +100,176 @@ def harvest_strategy(
         trade_handler_action(strategy, token, gov, profit_whale, profit_amount, target)
         return (0, 0)
 
+    # reset everything with a sleep and mine
+    advance_chain(1)
+
+    # return our profit, loss
+    return (profit, loss)
+
+
+# same as harvest_strategy, but we batch our reads into a few multicalls and cache our strategy's constants
+# returns (profit, loss) of a harvest
+def harvest_strategy_fast(
+    use_yswaps,
+    strategy,
+    token,
+    gov,
+    profit_whale,
+    profit_amount,
+    target,
+    force_claim=True,
+):
+    start = time.perf_counter()
+
     # reset everything with a sleep and mine
     chain.sleep(1)
-    chain.mine(1)
+
+    # fetch everything we need before harvesting in one go. we always re-read our vault, since a strategy deployed
+    #  at a reverted address in an earlier test may have had a different one.
+    with multicall:
+        vault_address = strategy.vault()
+        staked_balance = strategy.stakedBalance()
+        emergency_exit = strategy.emergencyExit()
+        claim_rewards = strategy.claimRewards() if target == 0 else None
+        claim_params = strategy.claimParams() if target in [2, 3] else None
+
+    constants = _get_strategy_constants(strategy, target, vault_address)
+
+    # governance can change, so only read it when we need to adjust our strategy
+    governance = None
+    if (
+        (target == 0 and (emergency_exit or claim_rewards))
+        or staked_balance == 0
+        or target in [2, 3]
+    ):
+        governance = interface.IVaultFactory045(constants["vault"]).governance()
+
+    # this should only happen with convex strategies
+    if target == 0:
+        booster = interface.IConvexBooster(constants["deposit_contract"])
+        booster.earmarkRewards(constants["pid"], {"from": profit_whale})
+
+        # when in emergency exit we don't enter prepare return, so we should manually claim rewards when withdrawing
+        if emergency_exit:
+            strategy.setClaimRewards(True, {"from": governance})
+        elif claim_rewards:
+            strategy.setClaimRewards(False, {"from": governance})
+
+    # if we have no staked assets, and we are taking profit (when closing out a strategy) then we will need to ignore health check
+    # we also may have profit and no assets in edge cases
+    if staked_balance == 0:
+        strategy.setDoHealthCheck(False, {"from": governance})
+        print("\nTurned off health check!\n")
+
+    # for PRISMA, force claims by default
+    if target in [2, 3]:
+        claim_or_not = claim_params["shouldClaimRewards"]
+        print("Claim or not:", claim_or_not)
+        strategy.setClaimParams(force_claim, claim_or_not, {"from": governance})
+
+    if gov != 9:
+        tx = strategy.harvest({"from": gov})
+        profit = tx.events["Harvested"]["profit"] / (10 ** constants["decimals"])
+        loss = tx.events["Harvested"]["loss"] / (10 ** constants["decimals"])
+
+    with multicall:
+        balance_of_want = strategy.balanceOfWant()
+        deposit_info = strategy.depositInfo() if target == 4 else None
+        total_assets = strategy.estimatedTotalAssets() if target == 4 else None
+
+    if target == 4:
+        assert (
+            balance_of_want < deposit_info["minDeposit"]
+            or deposit_info["maxSingleDeposit"] < total_assets
+        )
+    else:
+        assert balance_of_want == 0
+
+    # our trade handler takes action, sending out rewards tokens and sending back in profit
+    if use_yswaps or gov == 9:
+        _trade_handler_action_fast(
+            strategy, token, profit_whale, profit_amount, constants
+        )
+
+    if gov == 9:
+        harvest_timings.append(time.perf_counter() - start)
+        return (0, 0)
+
+    # reset everything with a sleep and mine
+    advance_chain(1)
+
+    harvest_timings.append(time.perf_counter() - start)
+    print(f"Harvest took {harvest_timings[-1]:.2f}s")
 
     # return our profit, loss
     return (profit, loss)
 
 
+def _get_strategy_constants(strategy, target, vault_address):
+    vault_address = str(vault_address)
+    key = (strategy.address, target)
+    constants = _strategy_constants.get(key)
+    if constants is not None and constants["vault"] == vault_address:
+        return constants
+
+    with multicall:
+        want = interface.IVaultFactory045(vault_address).token()
+        crv = strategy.crv()
+        convex_token = strategy.convexToken() if target != 1 else None
+        fxs = strategy.fxs() if target == 4 else None
+        yprisma = strategy.yPrisma() if target in [2, 3] else None
+        deposit_contract = strategy.depositContract() if target == 0 else None
+        pid = strategy.pid() if target == 0 else None
+
+    # multicall hands back lazy proxies, so store plain values. reward tokens are in the order our trade handler sweeps them.
+    reward_tokens = [
+        ("CRV", crv),
+        ("CVX", convex_token),
+        ("FXS", fxs),
+        ("yPRISMA", yprisma),
+    ]
+    constants = {
+        "vault": vault_address,
+        "decimals": interface.IERC20(str(want)).decimals(),
+        "reward_tokens": [
+            (symbol, interface.IERC20(str(address)))
+            for (symbol, address) in reward_tokens
+            if address is not None
+        ],
+        "deposit_contract": None if deposit_contract is None else str(deposit_contract),
+        "pid": None if pid is None else int(pid),
+    }
+    _strategy_constants[key] = constants
+    return constants
+
+
+# same as trade_handler_action, but we check our reward balances in one multicall
+def _trade_handler_action_fast(strategy, token, profit_whale, profit_amount, constants):
+    reward_tokens = constants["reward_tokens"]
+    with multicall:
+        balances = [reward.balanceOf(strategy) for (_, reward) in reward_tokens]
+
+    # get our tokens from our strategy
+    swept = False
+    for (symbol, reward), balance in zip(reward_tokens, balances):
+        if balance > 0:
+            reward.transfer(token, balance, {"from": strategy})
+            print(f"{symbol} rewards present:", balance / 1e18)
+            swept = True
+
+    if not swept:
+        return
+
+    with multicall:
+        remaining = [reward.balanceOf(strategy) for (_, reward) in reward_tokens]
+    assert all(balance == 0 for balance in remaining)
+
+    # send our profits back in
+    token.transfer(strategy, profit_amount, {"from": profit_whale})
+    print("Rewards converted into profit and returned")
+    assert strategy.balanceOfWant() > 0
+
+
 # simulate the trade handler sweeping out assets and sending back profit
 def trade_handler_action(
     strategy,
@@ -142,77 +329,110 @@ def trade_handler_action(
         assert strategy.balanceOfWant() > 0
 
 
-# do a check on our strategy and vault of choice
+# a point-in-time view of our strategy and vault. index it like vault.strategies(), e.g. status["totalDebt"]
+@dataclass(frozen=True)
+class StrategyStatus:
+    __slots__ = (
+        "vault_assets",
+        "debt_outstanding",
+        "credit_available",
+        "vault_total_debt",
+        "share_price",
+        "strategy_debt",
+        "strategy_loss",
+        "strategy_gain",
+        "strategy_debt_ratio",
+        "strategy_assets",
+        "decimals",
+        "strategy_params",
+    )
+
+    vault_assets: int
+    debt_outstanding: int
+    credit_available: int
+    vault_total_debt: int
+    share_price: int
+    strategy_debt: int
+    strategy_loss: int
+    strategy_gain: int
+    strategy_debt_ratio: int
+    strategy_assets: int
+    decimals: int
+    strategy_params: dict
+
+    def __getitem__(self, key):
+        return self.strategy_params[key]
+
+    # returns {field: (ours, theirs)} for every value that differs from a later (or earlier) snapshot
+    def diff(self, other):
+        changes = {}
+        for field, _ in STATUS_LABELS:
+            ours, theirs = getattr(self, field), getattr(other, field)
+            if ours != theirs:
+                changes[field] = (ours, theirs)
+        return changes
+
+    def print(self):
+        for field, label in STATUS_LABELS:
+            print(f"{label}:", getattr(self, field))
+        print()
+
+        # print simplified versions if we have something more than dust
+        for field, label in STATUS_LABELS:
+            value = getattr(self, field)
+            if value > 10 and field != "strategy_debt_ratio":
+                print(f"Decimal-Corrected {label}:", value / (10**self.decimals))
+
+
+STATUS_LABELS = (
+    ("vault_assets", "Vault Assets"),
+    ("debt_outstanding", "Strategy Debt Outstanding"),
+    ("credit_available", "Strategy Credit Available"),
+    ("vault_total_debt", "Vault Total Debt"),
+    ("share_price", "Vault Share Price"),
+    ("strategy_debt", "Strategy Total Debt"),
+    ("strategy_loss", "Strategy Total Loss"),
+    ("strategy_gain", "Strategy Total Gain"),
+    ("strategy_debt_ratio", "Strategy Debt Ratio"),
+    ("strategy_assets", "Strategy Estimated Total Assets"),
+)
+
+
+# do a check on our strategy and vault of choice, all in one multicall
 def check_status(
     strategy,
     vault,
+    verbose=False,
 ):
-    # check our current status
-    strategy_params = vault.strategies(strategy)
-    vault_assets = vault.totalAssets()
-    debt_outstanding = vault.debtOutstanding(strategy)
-    credit_available = vault.creditAvailable(strategy)
-    total_debt = vault.totalDebt()
-    share_price = vault.pricePerShare()
-    strategy_debt = strategy_params["totalDebt"]
-    strategy_loss = strategy_params["totalLoss"]
-    strategy_gain = strategy_params["totalGain"]
-    strategy_debt_ratio = strategy_params["debtRatio"]
-    strategy_assets = strategy.estimatedTotalAssets()
+    # check our current status. our vault's decimals match its token's.
+    with multicall:
+        strategy_params = vault.strategies(strategy)
+        vault_assets = vault.totalAssets()
+        debt_outstanding = vault.debtOutstanding(strategy)
+        credit_available = vault.creditAvailable(strategy)
+        total_debt = vault.totalDebt()
+        share_price = vault.pricePerShare()
+        strategy_assets = strategy.estimatedTotalAssets()
+        decimals = vault.decimals()
+
+    strategy_params = strategy_params.dict()
+    status = StrategyStatus(
+        vault_assets=int(vault_assets),
+        debt_outstanding=int(debt_outstanding),
+        credit_available=int(credit_available),
+        vault_total_debt=int(total_debt),
+        share_price=int(share_price),
+        strategy_debt=strategy_params["totalDebt"],
+        strategy_loss=strategy_params["totalLoss"],
+        strategy_gain=strategy_params["totalGain"],
+        strategy_debt_ratio=strategy_params["debtRatio"],
+        strategy_assets=int(strategy_assets),
+        decimals=int(decimals),
+        strategy_params=strategy_params,
+    )
 
     # print our stuff
-    print("Vault Assets:", vault_assets)
-    print("Strategy Debt Outstanding:", debt_outstanding)
-    print("Strategy Credit Available:", credit_available)
-    print("Vault Total Debt:", total_debt)
-    print("Vault Share Price:", share_price)
-    print("Strategy Total Debt:", strategy_debt)
-    print("Strategy Total Loss:", strategy_loss)
-    print("Strategy Total Gain:", strategy_gain)
-    print("Strategy Debt Ratio:", strategy_debt_ratio)
-    print("Strategy Estimated Total Assets:", strategy_assets, "\n")
-
-    # print simplified versions if we have something more than dust
-    token = interface.IERC20(vault.token())
-    if vault_assets > 10:
-        print(
-            "Decimal-Corrected Vault Assets:", vault_assets / (10 ** token.decimals())
-        )
-    if debt_outstanding > 10:
-        print(
-            "Decimal-Corrected Strategy Debt Outstanding:",
-            debt_outstanding / (10 ** token.decimals()),
-        )
-    if credit_available > 10:
-        print(
-            "Decimal-Corrected Strategy Credit Available:",
-            credit_available / (10 ** token.decimals()),
-        )
-    if total_debt > 10:
-        print(
-            "Decimal-Corrected Vault Total Debt:", total_debt / (10 ** token.decimals())
-        )
-    if share_price > 10:
-        print("Decimal-Corrected Share Price:", share_price / (10 ** token.decimals()))
-    if strategy_debt > 10:
-        print(
-            "Decimal-Corrected Strategy Total Debt:",
-            strategy_debt / (10 ** token.decimals()),
-        )
-    if strategy_loss > 10:
-        print(
-            "Decimal-Corrected Strategy Total Loss:",
-            strategy_loss / (10 ** token.decimals()),
-        )
-    if strategy_gain > 10:
-        print(
-            "Decimal-Corrected Strategy Total Gain:",
-            strategy_gain / (10 ** token.decimals()),
-        )
-    if strategy_assets > 10:
-        print(
-            "Decimal-Corrected Strategy Total Assets:",
-            strategy_assets / (10 ** token.decimals()),
-        )
+    if verbose:
+        status.print()
 
-    return strategy_params
+    return status